@@ -0,0 +1,433 @@
+"""Görev deposu için başsız (headless) REST/JSON API.
+
+Streamlit'ten ayrı bir süreçte çalışır; betikler ve entegrasyonlar arayüzü
+sürmeden aynı veritabanına ulaşır ve makine trafiği arayüzün yeniden
+çalıştırmalarıyla yarışmaz. Sunucu standart kütüphanedeki ``asyncio``
+üzerinde küçük bir HTTP/1.1 uygulamasıdır (ek bağımlılık yok); veri erişimi
+arayüzün kullandığı depo zinciri üzerindendir: ``SQLiteTaskRepository`` →
+``CachedTaskRepository`` → ``AsyncTaskRepository``.
+
+Uç noktalar (``owner`` ve ``list`` sorgu parametreleri bölümü seçer;
+verilmezse varsayılan kullanıcının tüm listeleri):
+
+    GET    /tasks               ?limit=&cursor=&completed=0&priority=High,Low&due=today&q=
+    POST   /tasks               {"title": ..., "deadline": "2025-01-31", "priority": "High", ...}
+    GET    /tasks/next          ?limit=   (en acil açık görevler)
+    GET    /tasks/{id}
+    PATCH  /tasks/{id}          {"progress": 50, ...}
+    POST   /tasks/{id}/complete {"completed": true}
+    DELETE /tasks/{id}
+    POST   /tasks/bulk          {"action": "complete|reopen|delete|update", "ids": [...], "fields": {...}}
+    GET    /summary
+
+Liste anahtar küme (keyset) ile sayfalanır: yanıttaki ``next_cursor`` bir
+sonraki isteğin ``cursor`` parametresidir. GET yanıtları veri sürümünden
+türetilen bir ETag taşır; ``If-None-Match`` eşleşirse gövdesiz 304 döner.
+İstemci kabul ediyorsa büyük yanıtlar gzip ile sıkıştırılır.
+
+Örnek:
+    python manage.py serve-api --port 8502
+    curl -s 'localhost:8502/tasks?completed=0&limit=20'
+"""
+
+import asyncio
+import base64
+import binascii
+import gzip
+import hashlib
+import json
+import logging
+from datetime import date
+from urllib.parse import parse_qs, urlsplit
+
+from storage import (
+    DEFAULT_OWNER_ID, PRIORITIES, AsyncTaskRepository, CachedTaskRepository, ResultCache, Scope,
+    SQLiteTaskRepository, TaskFilter, user_lists,
+)
+from storage.queries import DUE_FILTERS
+
+log = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 50
+NEXT_UP_SIZE = 10
+MAX_PAGE_SIZE = 500
+MAX_BODY_BYTES = 1024 * 1024
+# Bu boyutun altındaki yanıtlar sıkıştırılmaz (başlık maliyeti kazancı aşar)
+GZIP_MIN_BYTES = 1024
+
+# PATCH ile değiştirilebilen alanlar; tamamlanma /complete uç noktasındadır
+EDITABLE_FIELDS = ("title", "description", "deadline", "priority", "progress")
+
+REASONS = {
+    200: "OK", 201: "Created", 204: "No Content", 304: "Not Modified", 400: "Bad Request",
+    404: "Not Found", 405: "Method Not Allowed", 411: "Length Required", 413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+
+class HTTPError(Exception):
+    """İstemciye ``{"error": mesaj}`` olarak dönen hata."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+# ============================================================
+# DOĞRULAMA
+# ============================================================
+
+def _int_param(query, name, default=None, low=None, high=None):
+    raw = query.get(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        raise HTTPError(400, f"'{name}' tam sayı olmalı") from None
+    if (low is not None and value < low) or (high is not None and value > high):
+        raise HTTPError(400, f"'{name}' {low}..{high} aralığında olmalı")
+    return value
+
+
+def encode_cursor(after):
+    raw = json.dumps(after, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    try:
+        after = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, ValueError):
+        raise HTTPError(400, "Geçersiz 'cursor'") from None
+    # (is_completed, deadline, priority, id): bkz. storage.queries.keyset_ranges
+    if not (isinstance(after, list) and len(after) == 4):
+        raise HTTPError(400, "Geçersiz 'cursor'")
+    completed, deadline, priority, task_id = after
+    if not (
+        _is_int(completed) and completed in (0, 1)
+        and (deadline is None or _is_int(deadline)) and _is_int(priority) and _is_int(task_id)
+    ):
+        raise HTTPError(400, "Geçersiz 'cursor'")
+    return (int(completed), deadline, priority, task_id)
+
+
+def _is_int(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def parse_filter(query):
+    """Sorgu parametrelerinden ``TaskFilter``."""
+    priorities = PRIORITIES
+    if query.get("priority"):
+        priorities = tuple(p.strip() for p in query["priority"].split(","))
+        unknown = set(priorities) - set(PRIORITIES)
+        if unknown:
+            raise HTTPError(400, f"Bilinmeyen öncelik: {', '.join(sorted(unknown))}")
+    due = query.get("due", "all")
+    if due not in DUE_FILTERS:
+        raise HTTPError(400, f"'due' şunlardan biri olmalı: {', '.join(DUE_FILTERS)}")
+    return TaskFilter(
+        show_completed=query.get("completed", "1") != "0",
+        priorities=priorities,
+        due=due,
+        search=query.get("q", ""),
+        today=date.today(),  # Vade filtreleri ve önbellek anahtarı gün değişince yenilensin
+    )
+
+
+def validate_fields(fields, required=()):
+    """Görev alanlarını denetler; geçerli alanların sözlüğü."""
+    if not isinstance(fields, dict):
+        raise HTTPError(400, "Gövde bir JSON nesnesi olmalı")
+    unknown = set(fields) - set(EDITABLE_FIELDS)
+    if unknown:
+        raise HTTPError(400, f"Bilinmeyen ya da değiştirilemeyen alan(lar): {', '.join(sorted(unknown))}")
+    for name in required:
+        if name not in fields:
+            raise HTTPError(400, f"'{name}' gerekli")
+    if "title" in fields and not (isinstance(fields["title"], str) and fields["title"].strip()):
+        raise HTTPError(400, "'title' boş olmamalı")
+    if "description" in fields and not isinstance(fields["description"], (str, type(None))):
+        raise HTTPError(400, "'description' metin olmalı")
+    if "priority" in fields and fields["priority"] not in PRIORITIES:
+        raise HTTPError(400, f"'priority' şunlardan biri olmalı: {', '.join(PRIORITIES)}")
+    if "progress" in fields and not (
+        isinstance(fields["progress"], int) and not isinstance(fields["progress"], bool) and 0 <= fields["progress"] <= 100
+    ):
+        raise HTTPError(400, "'progress' 0..100 aralığında tam sayı olmalı")
+    if fields.get("deadline") is not None:
+        try:
+            date.fromisoformat(fields["deadline"])
+        except (TypeError, ValueError):
+            raise HTTPError(400, "'deadline' YYYY-AA-GG biçiminde olmalı") from None
+    return dict(fields)
+
+
+def _task_ids(body):
+    ids = body.get("ids")
+    if not (isinstance(ids, list) and all(isinstance(i, int) and not isinstance(i, bool) for i in ids)):
+        raise HTTPError(400, "'ids' tam sayı listesi olmalı")
+    return ids
+
+
+# ============================================================
+# UYGULAMA
+# ============================================================
+
+class Response:
+    def __init__(self, status, payload=None, headers=None):
+        self.status = status
+        self.payload = payload
+        self.headers = headers or {}
+
+
+class TaskApi:
+    """İstekleri depo çağrılarına çevirir; ağdan bağımsızdır (doğrudan test edilebilir)."""
+
+    def __init__(self, pool, cache=None):
+        self.pool = pool
+        cache = cache or ResultCache(version_probe=lambda: pool.version)
+        self.repo = AsyncTaskRepository(CachedTaskRepository(SQLiteTaskRepository(pool), cache))
+
+    def _scoped(self, query):
+        owner = _int_param(query, "owner", DEFAULT_OWNER_ID)
+        return self.repo.scoped(Scope(owner, _int_param(query, "list")))
+
+    def etag(self, target):
+        """Veri sürümü, gün ve istek hedefinden türetilen zayıf ETag.
+
+        Sürüm sorgudan önce okunur; okuma sırasında gelen bir yazma, bir sonraki
+        istekte ETag'i değiştirir ve istemci eski gövdede takılı kalmaz. Gün de
+        anahtardadır: vade filtreleri (``due``) yazma olmadan gece yarısı değişir.
+        """
+        digest = hashlib.sha1(repr((self.pool.version, date.today(), target)).encode()).hexdigest()[:20]
+        return f'W/"{digest}"'
+
+    async def handle(self, method, target, headers, body):
+        """Bir isteği yanıtlar; hatalar da ``Response`` olarak döner."""
+        try:
+            return await self._route(method, target, headers, body)
+        except HTTPError as e:
+            return Response(e.status, {"error": e.message})
+        except ValueError as e:
+            # Depo doğrulaması (ör. başka kullanıcının listesi)
+            return Response(400, {"error": str(e)})
+        except Exception:
+            log.exception("%s %s başarısız", method, target)
+            return Response(500, {"error": "Sunucu hatası"})
+
+    async def _route(self, method, target, headers, body):
+        url = urlsplit(target)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        parts = [p for p in url.path.split("/") if p]
+
+        if method == "GET":
+            etag = self.etag(target)
+            if etag in [t.strip() for t in headers.get("if-none-match", "").split(",")]:
+                return Response(304, headers={"ETag": etag})
+            response = await self._get(parts, query)
+            response.headers["ETag"] = etag
+            return response
+
+        repo = self._scoped(query)
+        if method == "POST" and parts == ["tasks"]:
+            fields = validate_fields(self._json(body), required=("title",))
+            list_id = repo.scope.list_id
+            if list_id is None:
+                # Liste verilmezse kullanıcının ilk listesi (arayüzdeki varsayılanla aynı)
+                lists = await asyncio.to_thread(user_lists, self.pool, repo.scope.owner_id)
+                if not lists:
+                    raise HTTPError(404, f"Kullanıcı #{repo.scope.owner_id} bulunamadı")
+                list_id = lists[0].id
+            task_id = await repo.add(
+                fields["title"].strip(), fields.get("description"), fields.get("deadline"),
+                fields.get("priority", "Low"), fields.get("progress", 0), list_id,
+            )
+            return Response(201, await repo.get(task_id), {"Location": f"/tasks/{task_id}"})
+
+        if method == "POST" and parts == ["tasks", "bulk"]:
+            return Response(200, {"changed": await self._bulk(repo, self._json(body))})
+
+        task_id = self._task_id(parts)
+        if method == "PATCH" and len(parts) == 2:
+            fields = validate_fields(self._json(body))
+            if "title" in fields:
+                fields["title"] = fields["title"].strip()
+            await self._existing(repo, task_id)
+            if fields:
+                await repo.update(task_id, **fields)
+            return Response(200, await repo.get(task_id))
+
+        if method == "POST" and len(parts) == 3 and parts[2] == "complete":
+            completed = self._json(body).get("completed", True)
+            if not isinstance(completed, bool):
+                raise HTTPError(400, "'completed' true ya da false olmalı")
+            await self._existing(repo, task_id)
+            await repo.mark_complete(task_id, completed)
+            return Response(200, await repo.get(task_id))
+
+        if method == "DELETE" and len(parts) == 2:
+            await self._existing(repo, task_id)
+            await repo.delete(task_id)
+            return Response(204)
+
+        raise HTTPError(405, f"{method} {url.path} desteklenmiyor")
+
+    async def _get(self, parts, query):
+        repo = self._scoped(query)
+        if parts == ["tasks"]:
+            limit = _int_param(query, "limit", DEFAULT_PAGE_SIZE, 1, MAX_PAGE_SIZE)
+            after = decode_cursor(query["cursor"]) if query.get("cursor") else None
+            tasks, next_after = await repo.page(parse_filter(query), limit, after)
+            return Response(200, {
+                "tasks": tasks,
+                "next_cursor": encode_cursor(next_after) if next_after is not None else None,
+            })
+        if parts == ["tasks", "next"]:
+            limit = _int_param(query, "limit", NEXT_UP_SIZE, 1, MAX_PAGE_SIZE)
+            return Response(200, {"tasks": await repo.next_up(limit)})
+        if parts == ["summary"]:
+            return Response(200, await repo.summary())
+        task_id = self._task_id(parts)
+        if len(parts) == 2:
+            return Response(200, await self._existing(repo, task_id))
+        raise HTTPError(404, "Bulunamadı")
+
+    async def _bulk(self, repo, body):
+        action = body.get("action")
+        ids = _task_ids(body)
+        if action == "complete":
+            return await repo.complete_many(ids, True)
+        if action == "reopen":
+            return await repo.complete_many(ids, False)
+        if action == "delete":
+            return await repo.delete_many(ids)
+        if action == "update":
+            fields = validate_fields(body.get("fields", {}))
+            if "title" in fields:
+                raise HTTPError(400, "Başlık toplu olarak değiştirilemez")
+            return await repo.update_many(ids, **fields)
+        raise HTTPError(400, "'action' şunlardan biri olmalı: complete, reopen, delete, update")
+
+    @staticmethod
+    def _json(body):
+        try:
+            data = json.loads(body or b"{}")
+        except ValueError:
+            raise HTTPError(400, "Gövde geçerli bir JSON değil") from None
+        if not isinstance(data, dict):
+            raise HTTPError(400, "Gövde bir JSON nesnesi olmalı")
+        return data
+
+    @staticmethod
+    def _task_id(parts):
+        if len(parts) < 2 or parts[0] != "tasks" or not parts[1].isdigit():
+            raise HTTPError(404, "Bulunamadı")
+        return int(parts[1])
+
+    @staticmethod
+    async def _existing(repo, task_id):
+        task = await repo.get(task_id)
+        if task is None:
+            raise HTTPError(404, f"Görev #{task_id} bulunamadı")
+        return task
+
+
+# ============================================================
+# HTTP
+# ============================================================
+
+def render(response, accept_encoding=""):
+    """Yanıtın durum satırı, başlıkları ve gövdesi (bayt)."""
+    headers = dict(response.headers)
+    body = b""
+    if response.payload is not None:
+        body = json.dumps(response.payload, ensure_ascii=False, separators=(",", ":")).encode()
+        headers["Content-Type"] = "application/json; charset=utf-8"
+        headers["Vary"] = "Accept-Encoding"
+        if len(body) >= GZIP_MIN_BYTES and "gzip" in accept_encoding:
+            body = gzip.compress(body, compresslevel=5)
+            headers["Content-Encoding"] = "gzip"
+    headers["Content-Length"] = str(len(body))
+    lines = [f"HTTP/1.1 {response.status} {REASONS.get(response.status, '')}"]
+    lines += [f"{k}: {v}" for k, v in headers.items()]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+
+async def read_request(reader):
+    """(yöntem, hedef, sürüm, başlıklar, gövde); bağlantı kapandıysa ``None``."""
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError:
+        return None
+    request_line, *header_lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, target, version = request_line.split(" ")
+    except ValueError:
+        raise HTTPError(400, "Geçersiz istek satırı") from None
+    headers = {}
+    for line in header_lines:
+        if ":" in line:
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+    if "chunked" in headers.get("transfer-encoding", ""):
+        raise HTTPError(411, "Content-Length gerekli")
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        raise HTTPError(400, "Geçersiz Content-Length") from None
+    if length > MAX_BODY_BYTES:
+        raise HTTPError(413, "Gövde çok büyük")
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), target, version, headers, body
+
+
+async def serve_connection(api, reader, writer):
+    """Bir bağlantıdaki istekleri sırayla yanıtlar (HTTP/1.1 keep-alive)."""
+    try:
+        while True:
+            try:
+                request = await read_request(reader)
+            except HTTPError as e:
+                writer.write(render(Response(e.status, {"error": e.message}, {"Connection": "close"})))
+                break
+            except (asyncio.LimitOverrunError, ValueError):
+                writer.write(render(Response(400, {"error": "Başlıklar çok büyük"}, {"Connection": "close"})))
+                break
+            if request is None:
+                break
+            method, target, version, headers, body = request
+            response = await api.handle(method, target, headers, body)
+            keep_alive = (
+                headers.get("connection", "").lower() != "close"
+                if version == "HTTP/1.1" else headers.get("connection", "").lower() == "keep-alive"
+            )
+            if not keep_alive:
+                response.headers["Connection"] = "close"
+            writer.write(render(response, headers.get("accept-encoding", "")))
+            await writer.drain()
+            log.debug("%s %s → %s", method, target, response.status)
+            if not keep_alive:
+                break
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(pool, host="127.0.0.1", port=8502, ready=None):
+    """API sunucusunu çalıştırır (iptal edilene kadar).
+
+    ``ready`` verilirse sunucu dinlemeye başlayınca gerçek port ile çağrılır
+    (``port=0`` ile rastgele port seçen testler için).
+    """
+    api = TaskApi(pool)
+    server = await asyncio.start_server(lambda r, w: serve_connection(api, r, w), host, port)
+    bound = server.sockets[0].getsockname()[1]
+    log.info("API http://%s:%s adresinde dinliyor", host, bound)
+    if ready:
+        ready(bound)
+    async with server:
+        await server.serve_forever()
@@ -1,83 +1,123 @@
 import streamlit as st
-import sqlite3
-from datetime import datetime, date, timedelta
-import pandas as pd
-import plotly.express as px
+import html
+import json
+import logging
 import os
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime, date, timedelta
+from storage import (
+    DB_PATH, ConnectionPool, ResultCache, TaskFilter, migrate,
+    DeadlineNotifier, LogSink, MemorySink, WebhookSink, Metrics, RerunProfile,
+    CachedTaskRepository, SQLiteTaskRepository, Scope,
+    create_list, get_or_create_user, user_lists, weekly_activity,
+    deleted_tasks, progress_history, restore_task, task_history, time_at_progress, undo_last_change,
+    similar_tasks, urgency_days, utc_today,
+)
+from storage.accounts import DEFAULT_USER_NAME
+from storage.bulk import detect_format, export_tasks, import_tasks
+from storage.queries import NO_DEADLINE_DAYS, PRIORITY_DAYS, REMAINING_DAYS
+
+# ============================================================
+# ÖLÇÜMLER
+# ============================================================
+
+@st.cache_resource
+def get_metrics():
+    # Süreç geneli bölüm/sorgu ölçümleri (geliştirici paneli ve Prometheus çıktısı)
+    return Metrics()
+
+metrics = get_metrics()
+metrics.incr("reruns")
+profile = RerunProfile(metrics)  # Bu yeniden çalıştırmanın bölüm dökümü
+st.session_state["reruns"] = st.session_state.get("reruns", 0) + 1
+
+# ?debug=1 ya da TODO_DEBUG=1 ile geliştirici paneli açılır
+DEBUG = st.query_params.get("debug") == "1" or os.environ.get("TODO_DEBUG") == "1"
+PROFILE_LOG = os.environ.get("TODO_PROFILE_LOG")  # "1" = stderr, aksi halde dosya yolu
+
+@st.cache_resource
+def get_profile_logger():
+    # Her yeniden çalıştırmanın dökümü bir JSON satırı olarak yazılır
+    logger = logging.getLogger("todo.profile")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.addHandler(logging.StreamHandler() if PROFILE_LOG == "1" else logging.FileHandler(PROFILE_LOG))
+    return logger
 
 # ============================================================
 # DATABASE AYARLARI
 # ============================================================
 
-# Not: Colab/Drive yolu kontrolü yerinde bırakılmıştır.
-DB_PATH = "/content/drive/MyDrive/Colab Notebooks/to-do-list/tasks.db" if os.path.exists("/content/drive/MyDrive/Colab Notebooks/to-do-list") else "tasks.db"
+@st.cache_resource
+def get_pool():
+    # Tüm oturumlar tek havuzu paylaşır: eşzamanlı okuyucular, tek yazıcı (WAL)
+    pool = ConnectionPool(DB_PATH, metrics=get_metrics())
+    migrate(pool)  # Eski veritabanları açılışta yerinde yükseltilir
+    return pool
+
+pool = get_pool()
 
 @st.cache_resource
-def get_conn():
-    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
-    conn.row_factory = sqlite3.Row
-    cur = conn.cursor()
-    cur.execute("""
-    CREATE TABLE IF NOT EXISTS tasks (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        title TEXT NOT NULL,
-        description TEXT,
-        deadline TEXT,
-        priority TEXT,
-        progress INTEGER DEFAULT 0,
-        is_completed INTEGER DEFAULT 0,
-        created_at TEXT,
-        completed_at TEXT,
-        notified INTEGER DEFAULT 0
-    )
-    """)
-    conn.commit()
-    return conn
+def get_cache():
+    # Havuzun her yazması ve başka süreçlerin yazmaları veri sürümünü değiştirir
+    p = get_pool()
+    return ResultCache(version_probe=lambda: p.version)
 
-conn = get_conn()
+cache = get_cache()
+
+# Tüm veri erişimi depo üzerinden; okumalar önbellekten sunulur. Oturumun
+# kullanıcı/listesi kenar çubuğunda seçilince depo o bölüme daraltılır.
+base_repo = CachedTaskRepository(SQLiteTaskRepository(pool), cache)
+
+@st.cache_resource
+def get_notifier():
+    # Süreç başına tek zamanlayıcı; toast'lar oturumlara bellekteki kuyruktan dağıtılır
+    sinks = [LogSink(), MemorySink()]
+    if os.environ.get("TODO_WEBHOOK_URL"):
+        sinks.append(WebhookSink(os.environ["TODO_WEBHOOK_URL"]))
+    notifier = DeadlineNotifier(get_pool(), sinks=sinks, interval=60)
+    notifier.start()
+    return notifier
+
+notifier = get_notifier()
+profile.lap("resources")
 
 # ============================================================
 # YARDIMCI FONKSİYONLAR
 # ============================================================
 
-# Orijinal fonksiyonlar: add_task, fetch_tasks, update_task, delete_task, mark_complete, human_timedelta
+def timed_read(name, read, *args):
+    """Bir depo okumasını bu çalıştırmanın profil dökümüne "query:<ad>" olarak yazar."""
+    with profile.section(f"query:{name}"):
+        return read(*args)
 
-def add_task(title, description, deadline, priority, progress):
-    now = datetime.utcnow().isoformat()
-    conn.execute(
-        "INSERT INTO tasks (title,description,deadline,priority,progress,created_at) VALUES (?,?,?,?,?,?)",
-        (title, description, deadline, priority, progress, now),
-    )
-    conn.commit()
-
-def fetch_tasks(where=None, params=()):
-    q = "SELECT * FROM tasks"
-    if where:
-        q += " WHERE " + where
-    # Tamamlananlar en sona, son tarih olmayanlar en başa (tamamlanmamışlar içinde)
-    q += " ORDER BY is_completed, (CASE WHEN deadline IS NULL THEN 0 ELSE 1 END), deadline, priority DESC" 
-    cur = conn.execute(q, params)
-    return [dict(r) for r in cur.fetchall()]
-
-def update_task(task_id, **fields):
-    if not fields:
+# Bir parça (st.fragment) tek başına yeniden çalışınca betiğin kalanı çalışmaz;
+# ölçümler o zaman parçanın kendi dökümüne yazılır. Tam çalıştırmanın sonunda False olur.
+full_run = True
+fragment_run = None
+
+@contextmanager
+def fragment_profile(name):
+    """Parça tek başına yeniden çalışıyorsa yeni bir profil dökümü açar ve sonunda loglar."""
+    global profile, fragment_run
+    if full_run or fragment_run:
+        yield
         return
-    assignments = ", ".join([f"{k}=?" for k in fields.keys()])
-    params = list(fields.values()) + [task_id]
-    conn.execute(f"UPDATE tasks SET {assignments} WHERE id=?", params)
-    conn.commit()
-
-def delete_task(task_id):
-    conn.execute("DELETE FROM tasks WHERE id=?", (task_id,))
-    conn.commit()
-
-def mark_complete(task_id, completed=True):
-    if completed:
-        now = datetime.utcnow().isoformat()
-        conn.execute("UPDATE tasks SET is_completed=1, progress=100, completed_at=? WHERE id=?", (now, task_id))
-    else:
-        conn.execute("UPDATE tasks SET is_completed=0, progress=0, completed_at=NULL WHERE id=?", (task_id,))
-    conn.commit()
+    fragment_run, profile = name, RerunProfile(metrics)
+    try:
+        yield
+    finally:
+        fragment_run = None
+        metrics.incr("fragment_reruns")
+        st.session_state["fragment_reruns"] = st.session_state.get("fragment_reruns", 0) + 1
+        if PROFILE_LOG:
+            get_profile_logger().info(json.dumps({"fragment": name, **profile.as_dict()}, ensure_ascii=False))
+
+def load_plotly():
+    """plotly.express'i ilk grafik çiziminde yükler; soğuk açılışa eklenmez."""
+    import plotly.express as px
+    return px
 
 def human_timedelta(td):
     days = td.days
@@ -110,6 +150,140 @@ def format_date(date_str):
     except:
         return date_str
 
+def card_html(task):
+    """Bir görev kartının tüm içeriğini tek bir HTML bloğu olarak üretir."""
+    priority = task.get("priority") or "Low"
+    card_class = f"task-card {priority.lower()}" + (" completed" if task["is_completed"] else "")
+    progress_val = int(task.get("progress") or 0)
+
+    parts = [f'<div class="{card_class}">']
+    parts.append(f"<div class='task-title'>{html.escape(task['title'])}</div>")
+    desc = task.get("description") or ""
+    if desc:
+        parts.append(f"<div class='task-description'>{html.escape(desc).replace(chr(10), '<br>')}</div>")
+    parts.append(f"<div class='task-info'><b>Öncelik:</b> {get_priority_color(priority)}</div>")
+    parts.append(f"<div class='task-info'><b>Son Tarih:</b> {format_date(task.get('deadline'))}</div>")
+    parts.append(
+        f"<div class='task-progress'><div class='task-progress-track'>"
+        f"<div class='task-progress-bar' style='width: {progress_val}%'></div></div>"
+        f"<span>{progress_val}%</span></div>"
+    )
+    parts.append("</div>")
+    return "".join(parts)
+
+def render_task_card(task, selectable=False):
+    """Kartı tek bir markdown öğesi + tek satır aksiyon butonuyla çizer."""
+    tid = int(task["id"])
+    if selectable:
+        st.checkbox(
+            "Seç", value=tid in selected_ids(), key=f"sel_{tid}_{st.session_state.get('selection_gen', 0)}",
+            on_change=toggle_selected, args=(tid,),
+        )
+    st.markdown(card_html(task), unsafe_allow_html=True)
+
+    # Aksiyon Butonları (Tek bir satırda toplandı). Eylemler geri çağrıdır: yazma,
+    # çalışma alanı parçası yeniden çizilmeden önce yapılır (tıklama başına tek çalıştırma)
+    btn_cols = st.columns(3)
+    
+    # Tamamlama/Geri Al Butonu
+    with btn_cols[0]:
+        if task["is_completed"]:
+            st.button("↩️ Geri Al", key=f"undo_{tid}", use_container_width=True,
+                      on_click=set_completed, args=(tid, False))
+        else:
+            st.button("✔️ Tamamla", key=f"done_{tid}", type="primary", use_container_width=True,
+                      on_click=set_completed, args=(tid, True))
+    
+    # Düzenle Butonu
+    with btn_cols[1]:
+        st.button("✏️ Düzenle", key=f"edit_{tid}", use_container_width=True,
+                  on_click=st.session_state.update, kwargs={"edit_id": tid})
+            
+    # Sil Butonu
+    with btn_cols[2]:
+        st.button("🗑️ Sil", key=f"del_{tid}", type="secondary", use_container_width=True,
+                  on_click=delete_task, args=(tid,))
+
+def set_completed(tid, completed):
+    repo.mark_complete(tid, completed=completed)
+    st.session_state["flash_message"] = "Görev tamamlandı! 🎉" if completed else "Görev yeniden açıldı."
+
+def delete_task(tid):
+    repo.delete(tid)
+    selected_ids().discard(tid)
+    if st.session_state.get("edit_id") == tid:
+        del st.session_state["edit_id"]
+    st.session_state["flash_message"] = "Görev silindi. 🗑️"
+
+def undo_change(tid):
+    restored = undo_last_change(pool, tid, scope)
+    st.session_state["flash_message"] = "Son değişiklik geri alındı. ↩️" if restored else "Geri alınacak değişiklik yok."
+
+def restore_deleted(tid):
+    try:
+        restore_task(pool, tid, scope)
+        st.session_state["flash_message"] = "Görev geri yüklendi. ♻️"
+    except ValueError as e:
+        st.session_state["flash_message"] = f"Geri yükleme hatası: {e}"
+
+# Toplu işlemler: seçim oturumda kimlik kümesi olarak tutulur. Eylemler on_click
+# geri çağrılarıyla çalışır; yazma sayfa çizilmeden önce tek işlemde yapılır ve
+# her toplu işlem için yalnızca bir yeniden çalıştırma olur.
+
+def selected_ids():
+    return st.session_state.setdefault("selected_ids", set())
+
+def reset_selection(ids=()):
+    st.session_state["selected_ids"] = set(ids)
+    # Onay kutusu anahtarları kuşak numarası içerir; kuşak değişince hepsi yeni seçimle çizilir
+    st.session_state["selection_gen"] = st.session_state.get("selection_gen", 0) + 1
+
+def toggle_selected(tid):
+    selected_ids().symmetric_difference_update({tid})
+
+def run_bulk(action, message, **fields):
+    ids = sorted(selected_ids())
+    if not ids:
+        return
+    changed = action(ids, **fields)
+    reset_selection()
+    st.session_state["bulk_confirm_delete"] = False
+    st.session_state["flash_message"] = message.format(n=changed)
+
+def render_bulk_toolbar(visible_tasks, filtered_total):
+    """Seçim ve toplu eylem butonları."""
+    selected = selected_ids()
+    with st.container(border=True):
+        st.caption(f"☑️ {len(selected)} görev seçili")
+        sel_cols = st.columns(3)
+        with sel_cols[0]:
+            st.button("Sayfadakileri Seç", key="bulk_select_page", use_container_width=True,
+                      on_click=reset_selection, args=(selected | {int(t["id"]) for t in visible_tasks},))
+        with sel_cols[1]:
+            st.button(f"Filtredeki {filtered_total} Görevi Seç", key="bulk_select_all", use_container_width=True,
+                      on_click=lambda: reset_selection(repo.ids(task_filter)))
+        with sel_cols[2]:
+            st.button("Seçimi Temizle", key="bulk_clear", use_container_width=True, on_click=reset_selection)
+
+        act_cols = st.columns(4)
+        with act_cols[0]:
+            st.button("✔️ Tamamla", key="bulk_done", type="primary", use_container_width=True, disabled=not selected,
+                      on_click=run_bulk, args=(repo.complete_many, "{n} görev tamamlandı. 🎉"))
+        with act_cols[1]:
+            st.button("↩️ Geri Al", key="bulk_undo", use_container_width=True, disabled=not selected,
+                      on_click=run_bulk, args=(repo.complete_many, "{n} görev yeniden açıldı."),
+                      kwargs={"completed": False})
+        with act_cols[2]:
+            new_priority = st.selectbox("Yeni öncelik", ["Low","Medium","High"], key="bulk_priority",
+                                        label_visibility="collapsed")
+            st.button("🎯 Önceliği Uygula", key="bulk_reprioritize", use_container_width=True, disabled=not selected,
+                      on_click=run_bulk, args=(repo.update_many, "{n} görevin önceliği güncellendi."),
+                      kwargs={"priority": new_priority})
+        with act_cols[3]:
+            confirm = st.checkbox("Silmeyi onayla", key="bulk_confirm_delete")
+            st.button("🗑️ Sil", key="bulk_delete", use_container_width=True, disabled=not (selected and confirm),
+                      on_click=run_bulk, args=(repo.delete_many, "{n} görev silindi. 🗑️"))
+
 # ============================================================
 # UYGULAMA ARAYÜZÜ
 # ============================================================
@@ -231,6 +405,25 @@ h2, h3, h4, p, label, div, span {
 .task-card.low { border-left-color: #06D6A0; }
 .task-card.completed { border-left-color: #4ECDC4; opacity: 0.85; }
 
+.task-progress {
+    display: flex;
+    align-items: center;
+    gap: 10px;
+    margin-top: 8px;
+    font-size: 0.9em;
+}
+.task-progress-track {
+    flex: 1;
+    height: 8px;
+    border-radius: 4px;
+    background: rgba(0,0,0,0.12);
+    overflow: hidden;
+}
+.task-progress-bar {
+    height: 100%;
+    background: linear-gradient(90deg, #667eea, #764ba2);
+}
+
 /* ========================================================== */
 /* GRAFİKLER (ORTALAMA + FULLSCREEN BUTONU GİZLEME) */
 /* ========================================================== */
@@ -297,19 +490,133 @@ button[kind="secondary"]:hover {
 """, unsafe_allow_html=True)
 
 
+profile.lap("page_setup")
+
 # ============================================================
 # SİDEBAR
 # ============================================================
 
 st.sidebar.header("⚙️ Ayarlar ve Filtreler")
+
+# Kullanıcı oturumun kimliğinden gelir: giriş yapılandırıldıysa st.user, yoksa
+# adresteki tek ?user= değeri. Başka kullanıcılar listelenmez, seçilemez.
+if st.user.get("is_logged_in"):
+    identity = st.user.get("email") or st.user.get("name")
+else:
+    identity = (st.query_params.get("user") or "").strip() or DEFAULT_USER_NAME
+if st.session_state.get("identity") != identity:
+    st.session_state["identity"] = identity
+    st.session_state["user"] = get_or_create_user(pool, identity)
+user = st.session_state["user"]
+st.sidebar.caption(f"👤 {user.name}")
+
+ALL_LISTS = "Tüm Listeler"
+lists = cache.get_or_compute("lists", user.id, lambda: user_lists(pool, user.id))
+list_names = [l.name for l in lists] + [ALL_LISTS]
+requested_list = st.query_params.get("list")
+list_name = st.sidebar.selectbox(
+    "🗂️ Liste", list_names, index=list_names.index(requested_list) if requested_list in list_names else 0
+)
+current_list = None if list_name == ALL_LISTS else lists[list_names.index(list_name)]
+st.query_params["list"] = list_name
+if not st.user.get("is_logged_in"):
+    st.query_params["user"] = user.name
+
+scope = Scope(user.id, current_list.id if current_list else None)
+repo = base_repo.scoped(scope)
+if st.session_state.get("scope") != scope:
+    # Başka bir bölüme geçince seçim ve düzenleme durumu taşınmaz
+    st.session_state["scope"] = scope
+    st.session_state.pop("edit_id", None)
+    reset_selection()
+
+with st.sidebar.expander("➕ Liste Ekle"):
+    new_list = st.text_input("Yeni liste adı", key="new_list_name")
+    if st.button("Liste Ekle", key="add_list", use_container_width=True) and new_list.strip():
+        try:
+            created = create_list(pool, user.id, new_list)
+            st.query_params["list"] = created.name
+            st.rerun()
+        except ValueError as e:
+            st.error(str(e))
+
+search_text = st.sidebar.text_input("🔎 Ara", placeholder="Başlık veya açıklamada ara...")
 show_completed = st.sidebar.checkbox("Tamamlanan Görevleri Göster", value=True)
 priority_filter = st.sidebar.multiselect("Öncelik Seviyesi", ["Low","Medium","High"], default=["Low","Medium","High"])
 due_filter = st.sidebar.radio("Vade Durumu", ["Hepsi","Gecikenler","Bugün","7 Gün İçinde"], index=0)
+page_size = st.sidebar.selectbox("Sayfa Başına Görev", [10, 20, 50, 100], index=1)
+list_mode = st.sidebar.radio("Liste Görünümü", ["Sayfalı", "Daha Fazla Yükle"], index=0, horizontal=True)
+
+# Arayüz etiketlerini sorgu oluşturucunun vade anahtarlarına eşle
+DUE_KEYS = {"Hepsi": "all", "Gecikenler": "overdue", "Bugün": "today", "7 Gün İçinde": "week"}
+task_filter = TaskFilter(
+    show_completed=show_completed,
+    priorities=priority_filter,
+    due=DUE_KEYS[due_filter],
+    today=date.today(),  # Önbellek anahtarı gün değişince yenilensin
+    search=search_text.strip(),
+)
+
+# Toplu içe / dışa aktarma
+EXPORT_MIME = {"csv": "text/csv", "jsonl": "application/x-ndjson", "parquet": "application/vnd.apache.parquet"}
+
+with st.sidebar.expander("📦 İçe / Dışa Aktar"):
+    upload = st.file_uploader("Görev dosyası", type=["csv", "jsonl", "ndjson", "parquet"])
+    if current_list is None:
+        st.caption("İçe aktarmak için bir liste seçin.")
+    elif upload is not None and st.button("📥 İçe Aktar", use_container_width=True):
+        try:
+            result = import_tasks(pool, upload, fmt=detect_format(upload.name), skip_invalid=True, scope=scope)
+            st.success(f"{result.inserted} görev eklendi.")
+            if result.skipped:
+                st.warning(f"{result.skipped} geçersiz kayıt atlandı.")
+                st.caption("\n\n".join(result.errors[:10]))
+        except Exception as e:
+            st.error(f"İçe aktarma hatası: {e}")
+
+    export_format = st.selectbox("Dışa aktarma biçimi", ["csv", "jsonl", "parquet"])
+
+    def export_file(fmt=export_format, scope=scope):
+        # Yalnızca tıklanınca çalışır; satırlar parça parça geçici dosyaya yazılır.
+        # Streamlit hazır dosyayı sunarken belleğe alır; sabit bellek yalnızca CLI'da.
+        target = tempfile.TemporaryFile()
+        export_tasks(pool, target, fmt, scope=scope)
+        target.seek(0)
+        return target
+
+    st.download_button(
+        "⬇️ Dışa Aktar", data=export_file, file_name=f"tasks.{export_format}",
+        mime=EXPORT_MIME[export_format], on_click="ignore", use_container_width=True,
+    )
+
+# Zamanlayıcının ürettiği son tarih bildirimlerinden bu kullanıcınkileri bir kez göster.
+# Yeni oturum sürecin eski bildirimlerini yeniden göstermez; açıldığı andan sonrakiler gelir.
+toast_sink = next(s for s in notifier.sinks if isinstance(s, MemorySink))
+new_notes = toast_sink.since(st.session_state.setdefault("notify_seq", toast_sink.last_seq))
+for seq, note in new_notes[-5:]:
+    if note.owner_id in (None, user.id):
+        st.toast(note.message)
+if new_notes:
+    st.session_state["notify_seq"] = new_notes[-1][0]
+
+profile.lap("sidebar")
 
 # ============================================================
 # GÖREV EKLEME FORMU
 # ============================================================
 
+def add_pending_task():
+    try:
+        repo.add(**st.session_state.pop("pending_task"))
+        st.session_state["flash_message"] = "Görev başarıyla eklendi! 🎉"
+    except Exception as e:
+        st.session_state["flash_message"] = f"Veritabanı hatası: {e}"
+    st.session_state.pop("pending_similar", None)
+
+def discard_pending_task():
+    st.session_state.pop("pending_task", None)
+    st.session_state.pop("pending_similar", None)
+
 st.subheader("➕ Yeni Görev Ekle")
 with st.expander("Yeni Görev Formunu Aç"): # Formu varsayılan olarak kapalı hale getirerek ana görünümü temizledik
     with st.form("add_task_form", clear_on_submit=True):
@@ -317,6 +624,10 @@ with st.expander("Yeni Görev Formunu Aç"): # Formu varsayılan olarak kapalı
         title = st.text_input("Görev Başlığı *", placeholder="Örn: Raporu bitir, Müşteriye mail at...")
         description = st.text_area("Açıklama", placeholder="Birden fazla satır ekleyebilirsin...", height=100)
 
+        target_list = current_list
+        if current_list is None:
+            target_list = st.selectbox("Liste", lists, format_func=lambda l: l.name)
+
         st.write("**Detaylar**")
         col1, col2, col3 = st.columns(3)
         with col1:
@@ -336,254 +647,435 @@ with st.expander("Yeni Görev Formunu Aç"): # Formu varsayılan olarak kapalı
             if not title.strip():
                 st.error("Başlık boş olamaz.")
             else:
-                try:
-                    add_task(title.strip(), description.strip(), deadline.isoformat() if deadline else None, priority, progress)
-                    st.success("Görev başarıyla eklendi! 🎉")
-                    st.rerun()
-                except Exception as e:
-                    st.error(f"Veritabanı hatası: {e}")
-                    
+                new_task = dict(
+                    title=title.strip(), description=description.strip(),
+                    deadline=deadline.isoformat() if deadline else None, priority=priority, progress=progress,
+                    list_id=target_list.id,
+                )
+                # Eklemeden önce aynı listedeki açık görevlerde benzer başlık aranır
+                similar = timed_read("similar_tasks", similar_tasks, pool, new_task["title"], Scope(user.id, target_list.id))
+                if similar:
+                    st.session_state["pending_task"] = new_task
+                    st.session_state["pending_similar"] = similar
+                else:
+                    try:
+                        repo.add(**new_task)
+                        st.success("Görev başarıyla eklendi! 🎉")
+                        st.rerun()
+                    except Exception as e:
+                        st.error(f"Veritabanı hatası: {e}")
+
+    # Benzer görev bulunduysa ekleme onaya bekler (form gönderimde temizlendiği için oturumda tutulur)
+    if "pending_task" in st.session_state:
+        st.warning(
+            "Bu listede benzer açık görevler var:\n\n" + "\n".join(
+                f"- **{html.escape(t.title)}** (%{t.score * 100:.0f} benzer)" for t in st.session_state["pending_similar"]
+            )
+        )
+        confirm_cols = st.columns(2)
+        confirm_cols[0].button("➕ Yine de Ekle", type="primary", use_container_width=True, on_click=add_pending_task)
+        confirm_cols[1].button("✖️ Vazgeç", use_container_width=True, on_click=discard_pending_task)
+
 st.markdown("---")
+profile.lap("add_form")
 
 # ============================================================
 # GÖREVLERİN LİSTESİ
 # ============================================================
 
-tasks = fetch_tasks()
-df = pd.DataFrame(tasks)
-df_filtered = df.copy()
-
-if df_filtered.empty:
-    st.info("Henüz görev eklenmemiş. Lütfen yukarıdaki formu kullanarak bir görev ekleyin. ⬆️")
-else:
-    # Filtreleme mantığı
-    if not show_completed:
-        df_filtered = df_filtered[df_filtered["is_completed"] == 0]
-        
-    df_filtered = df_filtered[df_filtered["priority"].isin(priority_filter)]
-    
-    today = date.today()
-    # Tarihleri kontrol edilebilir hale getir
-    df_filtered["deadline_date"] = pd.to_datetime(df_filtered["deadline"], errors="coerce").dt.date
-    deadlines = df_filtered["deadline_date"]
-
-    if due_filter == "Gecikenler":
-        df_filtered = df_filtered[(deadlines < today) & (df_filtered["is_completed"] == 0)]
-    elif due_filter == "Bugün":
-        df_filtered = df_filtered[deadlines == today]
-    elif due_filter == "7 Gün İçinde":
-        df_filtered = df_filtered[(deadlines >= today) & (deadlines <= (today + timedelta(days=7)))]
-    # 'Hepsi' filtresi için ek bir koşul gerekmez
-    
-    
-    st.subheader(f"📋 Görev Listesi ({len(df_filtered)} Görev)")
-    
-    if df_filtered.empty:
-        st.info("Seçili filtrelere uygun görev bulunamadı.")
+def render_task_list():
+    """Filtrelenmiş ve sayfalanmış görev kartları (toplu işlem araç çubuğuyla)."""
+    if timed_read("count", repo.count) == 0:
+        st.info("Henüz görev eklenmemiş. Lütfen yukarıdaki formu kullanarak bir görev ekleyin. ⬆️")
     else:
-        # Görünümü iyileştirmek için görevler 2 sütunda listeleniyor
-        task_cols = st.columns(2)
-        
-        for i, row in df_filtered.iterrows():
-            tid = int(row["id"])
-            col_index = i % 2
-            
-            # Kartın stilini belirle
-            priority_class = row['priority'].lower()
-            completed_class = " completed" if row["is_completed"] else ""
-            card_class = f"task-card {priority_class}{completed_class}"
-
-            # Görevi kart içerisinde göster
-            with task_cols[col_index]:
-                with st.container():
-                    st.markdown(f'<div class="{card_class}">', unsafe_allow_html=True)
-                    
-                    st.markdown(f"<div class='task-title'>{row['title']}</div>", unsafe_allow_html=True)
-                    
-                    desc = (row.get("description") or "").replace("\n", "  \n")
-                    if desc:
-                        st.markdown(f"<div class='task-description'>{desc}</div>", unsafe_allow_html=True)
-                        
-                    # Detaylar
-                    st.markdown(f"<div class='task-info'>**Öncelik:** {get_priority_color(row['priority'])}</div>", unsafe_allow_html=True)
-                    
-                    deadline_display = format_date(row.get("deadline"))
-                    st.markdown(f"<div class='task-info'>**Son Tarih:** {deadline_display}</div>", unsafe_allow_html=True)
-
-                    # İlerleme Çubuğu ve Yüzde
-                    progress_val = int(row.get("progress") or 0)
-                    progress_col, percent_col = st.columns([4,1])
-                    with progress_col:
-                        st.progress(progress_val)
-                    with percent_col:
-                        st.markdown(f"<p style='font-size: 0.9em; margin-top: -10px; text-align: right;'>{progress_val}%</p>", unsafe_allow_html=True)
-                    
-                    # Aksiyon Butonları (Tek bir satırda toplandı)
-                    btn_cols = st.columns(3)
-                    
-                    # Tamamlama/Geri Al Butonu
-                    with btn_cols[0]:
-                        if row["is_completed"]:
-                            if st.button("↩️ Geri Al", key=f"undo_{tid}", use_container_width=True):
-                                mark_complete(tid, completed=False)
-                                st.rerun()
-                        else:
-                            if st.button("✔️ Tamamla", key=f"done_{tid}", type="primary", use_container_width=True):
-                                mark_complete(tid, completed=True)
-                                st.success("Görev tamamlandı! 🎉")
-                                st.rerun()
-                    
-                    # Düzenle Butonu
-                    with btn_cols[1]:
-                        if st.button("✏️ Düzenle", key=f"edit_{tid}", use_container_width=True):
-                            st.session_state["edit_id"] = tid
-                            st.rerun()
-                            
-                    # Sil Butonu
-                    with btn_cols[2]:
-                        if st.button("🗑️ Sil", key=f"del_{tid}", type="secondary", use_container_width=True):
-                            delete_task(tid)
-                            st.warning("Görev silindi. 🗑️")
-                            st.rerun()
-                            
-                    st.markdown('</div>', unsafe_allow_html=True)
-        st.markdown('<div style="clear: both;"></div>', unsafe_allow_html=True) # Sütunları temizle
+        # Filtreleme, sıralama ve sayfalama SQLite'ta yapılır
+        filtered_total = timed_read("count", repo.count, task_filter)
+        page_count = max(1, -(-filtered_total // page_size))
+        if st.session_state.get("page", 1) > page_count:
+            st.session_state["page"] = page_count
+
+        st.subheader(f"📋 Görev Listesi ({filtered_total} Görev)")
+        bulk_mode = st.toggle("☑️ Toplu İşlem Modu", key="bulk_mode")
+
+        if filtered_total == 0:
+            st.info("Seçili filtrelere uygun görev bulunamadı.")
+        else:
+            if list_mode == "Daha Fazla Yükle":
+                # Filtre değişince pencere ilk sayfaya döner
+                window_key = (task_filter, page_size)
+                if st.session_state.get("window_key") != window_key:
+                    st.session_state["window_key"] = window_key
+                    st.session_state["loaded_pages"] = 1
+                loaded_pages = min(st.session_state["loaded_pages"], page_count)
+                # Her sayfa ayrı önbellek kaydıdır; "daha fazla" yalnızca yeni sayfayı sorgular
+                visible_tasks = [
+                    task
+                    for p in range(loaded_pages)
+                    for task in timed_read("list", repo.list, task_filter, page_size, p * page_size)
+                ]
+            else:
+                if page_count > 1:
+                    page = st.number_input(f"Sayfa (toplam {page_count})", min_value=1, max_value=page_count, step=1, key="page")
+                else:
+                    page = 1
+                visible_tasks = timed_read("list", repo.list, task_filter, page_size, (page - 1) * page_size)
+
+            profile.lap("list_query")
+
+            if bulk_mode:
+                render_bulk_toolbar(visible_tasks, filtered_total)
+
+            # Görünümü iyileştirmek için görevler 2 sütunda listeleniyor
+            task_cols = st.columns(2)
+            for i, task in enumerate(visible_tasks):
+                with task_cols[i % 2]:
+                    render_task_card(task, selectable=bulk_mode)
+            profile.lap("cards")
+
+            if list_mode == "Daha Fazla Yükle" and len(visible_tasks) < filtered_total:
+                st.caption(f"{len(visible_tasks)} / {filtered_total} görev gösteriliyor")
+                st.button("⬇️ Daha Fazla Yükle", use_container_width=True,
+                          on_click=st.session_state.update, kwargs={"loaded_pages": loaded_pages + 1})
+
+    profile.lap("task_list")
+
+# ============================================================
+# SIRADAKİ GÖREVLER
+# ============================================================
+
+# "Sıradaki" bölümünde gösterilen en acil görev sayısı
+NEXT_UP = 5
+URGENCY_HELP = (
+    "Son tarih yakınlığı, öncelik, kalan iş ve görevin yaşından hesaplanır (gün). "
+    f"Her öncelik basamağı {PRIORITY_DAYS} gün, yapılmamış iş en fazla {REMAINING_DAYS} gün öne çeker; "
+    f"son tarihi olmayan görev {NO_DEADLINE_DAYS} günlük sayılır. 0'ın üstü gecikmiş demektir."
+)
 
+def urgency_label(task):
+    """Aciliyet puanı (gün): etkin son tarihten bu yana geçen süre; eksi değer kalan pay."""
+    days = urgency_days(task["urgency"], int(datetime.now().timestamp()))
+    icon = "🔥" if days >= 3 else "⏰" if days >= 0 else "⏳"
+    return f"{icon} Aciliyet {days:+.1f}"
+
+def render_next_up():
+    """En acil açık görevler; indeksten ilk N satır okunur, liste sıralanmaz."""
+    upcoming = timed_read("next_up", repo.next_up, NEXT_UP)
+    if upcoming:
+        with st.expander(f"🎯 Sıradaki ({len(upcoming)})", expanded=True):
+            for task in upcoming:
+                tid = int(task["id"])
+                cols = st.columns([4, 2, 1])
+                cols[0].markdown(
+                    f"**{html.escape(task['title'])}** · {get_priority_color(task['priority'])} · %{task['progress']}"
+                    + (f" · 📅 {format_date(task['deadline'])}" if task["deadline"] else "")
+                )
+                cols[1].caption(urgency_label(task), help=URGENCY_HELP)
+                cols[2].button("✔️", key=f"next_done_{tid}", help="Tamamla", use_container_width=True,
+                               on_click=set_completed, args=(tid, True))
+    profile.lap("next_up")
 
 # ============================================================
 # GÖREV DÜZENLEME FORMU (Modal benzeri bir görünüm için expander)
 # ============================================================
 
-if "edit_id" in st.session_state:
-    eid = st.session_state["edit_id"]
-    row = conn.execute("SELECT * FROM tasks WHERE id=?", (eid,)).fetchone()
-    
-    if row:
-        st.markdown("---")
-        st.subheader("✍️ Görevi Düzenle")
-        
-        # Streamlit'te modal olmadığı için bir expander içinde düzenleme formu daha iyi bir kullanıcı deneyimi sunar.
-        with st.form(f"edit_form_{eid}"):
-            st.info(f"Düzenlenen Görev ID: **{eid}** - Başlık: **{row['title']}**")
-            
-            col_edit1, col_edit2 = st.columns(2)
-            with col_edit1:
-                new_title = st.text_input("Başlık", value=row["title"])
-                new_desc = st.text_area("Açıklama", value=row["description"] or "", height=100)
-            
-            with col_edit2:
-                # Son tarih varsayılan değerleri
-                default_dead = date.fromisoformat(row["deadline"]) if row["deadline"] else date.today()
-                set_deadline = st.checkbox("Son tarih belirle", value=bool(row["deadline"]))
-                new_dead = st.date_input("Son tarih", value=default_dead)
-                
-                # Öncelik varsayılan değeri
-                priorities = ["Low","Medium","High"]
-                default_priority_index = priorities.index(row["priority"] or "Low")
-                new_priority = st.selectbox("Öncelik", priorities, index=default_priority_index)
-                
-                # İlerleme varsayılan değeri
-                new_prog = st.slider("Tamamlanma (%)", 0, 100, int(row["progress"] or 0))
+def render_edit_form():
+    """Seçili görevin düzenleme formu; kaydetme/iptal yalnızca çalışma alanını yeniler."""
+    if "edit_id" in st.session_state:
+        eid = st.session_state["edit_id"]
+        row = repo.get(eid)
 
+        if row:
             st.markdown("---")
-            col_btns = st.columns(3)
-            with col_btns[0]:
-                save = st.form_submit_button("💾 Kaydet ve Kapat", type="primary", use_container_width=True)
-            with col_btns[1]:
-                cancel = st.form_submit_button("❌ İptal", use_container_width=True)
-            
-            if save:
-                if not new_title.strip():
-                    st.error("Başlık boş olamaz.")
-                else:
-                    try:
-                        update_task(
-                            eid,
-                            title=new_title.strip(),
-                            description=new_desc.strip(),
-                            deadline=new_dead.isoformat() if set_deadline else None,
-                            priority=new_priority,
-                            progress=int(new_prog),
-                            is_completed=1 if int(new_prog) == 100 else 0, # İlerleme %100 ise tamamlandı olarak işaretle
-                            completed_at=datetime.utcnow().isoformat() if int(new_prog) == 100 else None
-                        )
-                        st.success("Görev başarıyla güncellendi! ✅")
-                    except Exception as e:
-                        st.error(f"Güncelleme hatası: {e}")
+            st.subheader("✍️ Görevi Düzenle")
+
+            # Streamlit'te modal olmadığı için bir expander içinde düzenleme formu daha iyi bir kullanıcı deneyimi sunar.
+            with st.form(f"edit_form_{eid}"):
+                st.info(f"Düzenlenen Görev ID: **{eid}** - Başlık: **{row['title']}**")
+
+                col_edit1, col_edit2 = st.columns(2)
+                with col_edit1:
+                    new_title = st.text_input("Başlık", value=row["title"])
+                    new_desc = st.text_area("Açıklama", value=row["description"] or "", height=100)
+
+                with col_edit2:
+                    # Son tarih varsayılan değerleri
+                    default_dead = date.fromisoformat(row["deadline"]) if row["deadline"] else date.today()
+                    set_deadline = st.checkbox("Son tarih belirle", value=bool(row["deadline"]))
+                    new_dead = st.date_input("Son tarih", value=default_dead)
+
+                    # Öncelik varsayılan değeri
+                    priorities = ["Low","Medium","High"]
+                    default_priority_index = priorities.index(row["priority"] or "Low")
+                    new_priority = st.selectbox("Öncelik", priorities, index=default_priority_index)
+
+                    # İlerleme varsayılan değeri
+                    new_prog = st.slider("Tamamlanma (%)", 0, 100, int(row["progress"] or 0))
+
+                st.markdown("---")
+                col_btns = st.columns(3)
+                with col_btns[0]:
+                    save = st.form_submit_button("💾 Kaydet ve Kapat", type="primary", use_container_width=True)
+                with col_btns[1]:
+                    cancel = st.form_submit_button("❌ İptal", use_container_width=True)
+
+                if save:
+                    if not new_title.strip():
+                        st.error("Başlık boş olamaz.")
+                    else:
+                        try:
+                            repo.update(
+                                eid,
+                                title=new_title.strip(),
+                                description=new_desc.strip(),
+                                deadline=new_dead.isoformat() if set_deadline else None,
+                                priority=new_priority,
+                                progress=int(new_prog),
+                                is_completed=1 if int(new_prog) == 100 else 0, # İlerleme %100 ise tamamlandı olarak işaretle
+                                completed_at=datetime.utcnow().isoformat() if int(new_prog) == 100 else None
+                            )
+                            st.session_state["flash_message"] = "Görev başarıyla güncellendi! ✅"
+                        except Exception as e:
+                            st.session_state["flash_message"] = f"Güncelleme hatası: {e}"
+                        del st.session_state["edit_id"]
+                        st.rerun(scope="fragment")
+
+                if cancel:
                     del st.session_state["edit_id"]
-                    st.rerun()
-            
-            if cancel:
-                del st.session_state["edit_id"]
-                st.rerun()
-            
-        st.markdown("---")
+                    st.rerun(scope="fragment")
+
+            if st.toggle("📜 Değişiklik Geçmişi", key=f"history_{eid}"):
+                render_history(eid)
+
+            st.markdown("---")
+
+    profile.lap("edit_form")
+
+# Geçmiş olaylarındaki alan adlarının görünen karşılıkları
+FIELD_LABELS = {
+    "title": "Başlık", "description": "Açıklama", "deadline": "Son tarih", "priority": "Öncelik",
+    "progress": "İlerleme", "is_completed": "Durum", "completed_at": "Tamamlanma", "list_id": "Liste",
+}
+
+def describe_event(event):
+    if event.kind == "insert":
+        return "Oluşturuldu"
+    if event.kind == "delete":
+        return "Silindi"
+    return ", ".join(
+        f"{FIELD_LABELS[k]}: {old} → {new}" for k, (old, new) in event.data.items() if k in FIELD_LABELS
+    )
+
+def render_history(eid):
+    """Görevin ilerleme grafiği, son olayları ve geri alma düğmesi."""
+    points = timed_read("progress_history", progress_history, pool, eid, scope)
+    if len(points) > 1:
+        px = load_plotly()
+        fig_progress = px.line(
+            {"Zaman": [at for at, _ in points], "İlerleme": [p for _, p in points]},
+            x="Zaman", y="İlerleme", line_shape="hv", markers=True, title="İlerleme Geçmişi",
+        )
+        fig_progress.update_yaxes(range=[0, 100])
+        st.plotly_chart(fig_progress, use_container_width=True)
+        spent = time_at_progress(points)
+        st.caption(" · ".join(
+            f"%{p}: {human_timedelta(timedelta(seconds=s))}" for p, s in sorted(spent.items()) if s >= 60
+        ))
+
+    events = timed_read("task_history", task_history, pool, eid, scope, 10)
+    for event in reversed(events):
+        st.caption(f"{datetime.fromisoformat(event.at):%d %b %Y %H:%M} — {describe_event(event)}")
+    if events and events[-1].kind == "update":
+        st.button("↩️ Son Değişikliği Geri Al", key=f"history_undo_{eid}", on_click=undo_change, args=(eid,))
+
+def render_deleted():
+    """Son silinen görevler; her biri aynı kimlikle geri yüklenebilir."""
+    recent = cache.get_or_compute("deleted", scope, lambda: deleted_tasks(pool, scope, limit=5))
+    if recent:
+        with st.expander(f"🗑️ Son Silinenler ({len(recent)})"):
+            for event in recent:
+                cols = st.columns([4, 1])
+                cols[0].markdown(f"**{html.escape(event.data['title'])}** · {format_date(event.at)}")
+                cols[1].button("♻️ Geri Yükle", key=f"restore_{event.task_id}", use_container_width=True,
+                               on_click=restore_deleted, args=(event.task_id,))
 
 # ============================================================
 # ANALİZ BÖLÜMÜ
 # ============================================================
 
-st.markdown("---")
-st.subheader("📈 Görev Analizi")
+# Grafikler toplanmış satırlardan kurulur ve o satırlarla anahtarlanarak süreç
+# boyunca saklanır: veri değişmedikçe figür yeniden kurulmaz, tüm oturumlar aynı
+# nesneyi paylaşır. Aynı figür her seferinde bayt bayt aynı tanımı üretir;
+# Streamlit tarayıcının önbelleğindeki öğeleri yalnızca özetiyle (hash) gönderir
+# (bkz. .streamlit/config.toml, ``global.minCachedMessageSize``).
+FIGURE_CACHE_SIZE = 64
+PRIORITY_COLORS = {'High': 'red', 'Medium': 'orange', 'Low': 'green'}
+STATUS_LABELS = {0: "Beklemede", 1: "Tamamlandı"}
+STATUS_COLORS = {'Tamamlandı': '#00b300', 'Beklemede': '#4682b4'}
+TREND_COLORS = {'Eklenen': '#4682b4', 'Tamamlanan': '#00b300'}
 
-if not df.empty:
-    
-    # Metrikler
-    total = len(df)
-    completed = len(df[df["is_completed"] == 1])
-    
-    metric_cols = st.columns(4)
-    with metric_cols[0]:
-        st.metric("Toplam Görev", total, delta="Tüm zamanlar")
-    with metric_cols[1]:
-        st.metric("Tamamlanan", completed, delta=f"{(completed/total*100):.1f}%" if total else "0.0%")
-    with metric_cols[2]:
-        st.metric("Beklemede", total - completed)
-    
-    # Ortalama Tamamlanma Süresi
-    durations = []
-    for t in tasks:
-        if t.get("completed_at") and t.get("created_at"):
-            try:
-                a = datetime.fromisoformat(t["created_at"])
-                b = datetime.fromisoformat(t["completed_at"])
-                durations.append(b - a)
-            except:
-                pass
-    
-    with metric_cols[3]:
-        if durations:
-            avg = sum((d.total_seconds() for d in durations)) / len(durations)
-            avg_td = timedelta(seconds=avg)
-            st.metric("Ortalama Tamamlanma Süresi", human_timedelta(avg_td))
-        else:
-            st.metric("Ortalama Tamamlanma Süresi", "N/A", delta="Tamamlanan görev yok")
+@st.cache_resource(max_entries=FIGURE_CACHE_SIZE, show_spinner=False)
+def priority_figure(rows):
+    names, values = zip(*rows) if rows else ((), ())
+    return load_plotly().pie(names=names, values=values, title="Öncelik Dağılımı",
+                             color_discrete_map=PRIORITY_COLORS)
+
+@st.cache_resource(max_entries=FIGURE_CACHE_SIZE, show_spinner=False)
+def status_figure(rows):
+    completed, values = zip(*rows) if rows else ((), ())
+    return load_plotly().pie(names=[STATUS_LABELS[c] for c in completed], values=values,
+                             title="Tamamlanma Durumu", color_discrete_map=STATUS_COLORS)
+
+@st.cache_resource(max_entries=FIGURE_CACHE_SIZE, show_spinner=False)
+def trend_figure(periods, added, completed, weekly):
+    fig = load_plotly().bar(
+        {"Dönem": periods, "Eklenen": added, "Tamamlanan": completed},
+        x="Dönem", y=["Eklenen", "Tamamlanan"], barmode="group",
+        title="Haftalık Görev Akışı" if weekly else "Son 30 Günün Görev Akışı",
+        color_discrete_map=TREND_COLORS,
+    )
+    fig.update_layout(legend_title_text="", yaxis_title="Görev")
+    return fig
+
+@st.fragment
+def render_charts():
+    """Grafikler; aç/kapa ve zaman aralığı seçimi yalnızca bu parçayı yeniden çalıştırır."""
+    with fragment_profile("charts"):
+        # Grafikler isteğe bağlı: plotly yalnızca ilk figür kurulurken yüklenir
+        if st.toggle("📊 Grafikleri Göster", key="show_charts"):
+            chart_cols = st.columns(2)
+
+            # 1. Grafik: Öncelik Dağılımı
+            with chart_cols[0]:
+                priority_rows = timed_read("priority_distribution", repo.priority_distribution)
+                st.plotly_chart(priority_figure(tuple(priority_rows)), use_container_width=True)
+                profile.lap("chart_priority")
 
+            # 2. Grafik: Durum Dağılımı
+            with chart_cols[1]:
+                status_rows = timed_read("status_distribution", repo.status_distribution)
+                st.plotly_chart(status_figure(tuple(status_rows)), use_container_width=True)
+                profile.lap("chart_status")
 
+            # 3. Grafik: Eklenen / tamamlanan görevler (günlük özetlerden, maliyet gün sayısı kadar)
+            period = st.radio(
+                "Zaman Aralığı", ["Günlük", "Haftalık"], horizontal=True, key="trend_period",
+                help="Günler UTC'ye göre sayılır (özet tablosunun gün sınırı).",
+            )
+            weekly = period == "Haftalık"
+            # Pencere, günlük özetlerle aynı gün sınırından (UTC) hesaplanır
+            today = utc_today()
+            start = today - timedelta(weeks=25, days=today.weekday()) if weekly else today - timedelta(days=29)
+            activity = timed_read("daily_activity", repo.daily_activity, start)
+            counts = {d: (c, k) for d, c, k in (weekly_activity(activity) if weekly else activity)}
+            periods = tuple(start + timedelta(days=i) for i in range(0, (today - start).days + 1, 7 if weekly else 1))
+            fig_trend = trend_figure(
+                periods,
+                tuple(counts.get(p, (0, 0))[0] for p in periods),
+                tuple(counts.get(p, (0, 0))[1] for p in periods),
+                weekly,
+            )
+            st.plotly_chart(fig_trend, use_container_width=True)
+            profile.lap("chart_trend")
+
+def render_analytics():
+    """Özet metrikler; grafikler kendi parçalarında çizilir."""
     st.markdown("---")
-    
-    chart_cols = st.columns(2)
-    
-    # 1. Grafik: Öncelik Dağılımı
-    with chart_cols[0]:
-        fig_priority = px.pie(
-            df, 
-            names="priority", 
-            title="Öncelik Dağılımı",
-            color_discrete_map={'High':'red', 'Medium':'orange', 'Low':'green'}
-        )
-        st.plotly_chart(fig_priority, use_container_width=True)
-
-    # 2. Grafik: Durum Dağılımı
-    with chart_cols[1]:
-        status_df = df.copy()
-        status_df["Durum"] = status_df["is_completed"].apply(lambda x: "Tamamlandı" if x == 1 else "Beklemede")
-        fig_status = px.pie(
-            status_df, 
-            names="Durum", 
-            title="Tamamlanma Durumu",
-            color_discrete_map={'Tamamlandı':'#00b300', 'Beklemede':'#4682b4'}
+    st.subheader("📈 Görev Analizi")
+
+    # Metrikler ve dağılımlar SQL'de toplanır; Plotly'ye yalnızca özet satırlar gider
+    summary = timed_read("summary", repo.summary)
+
+    if summary["total"]:
+
+        # Metrikler
+        total = summary["total"]
+        completed = summary["completed"]
+
+        metric_cols = st.columns(4)
+        with metric_cols[0]:
+            st.metric("Toplam Görev", total, delta="Tüm zamanlar")
+        with metric_cols[1]:
+            st.metric("Tamamlanan", completed, delta=f"{(completed/total*100):.1f}%" if total else "0.0%")
+        with metric_cols[2]:
+            st.metric("Beklemede", summary["pending"])
+
+        # Ortalama Tamamlanma Süresi
+        with metric_cols[3]:
+            if summary["avg_completion_seconds"] is not None:
+                avg_td = timedelta(seconds=summary["avg_completion_seconds"])
+                st.metric("Ortalama Tamamlanma Süresi", human_timedelta(avg_td))
+            else:
+                st.metric("Ortalama Tamamlanma Süresi", "N/A", delta="Tamamlanan görev yok")
+
+
+        st.markdown("---")
+        profile.lap("analytics")
+
+        render_charts()
+
+        st.markdown("---")
+
+# ============================================================
+# ÇALIŞMA ALANI
+# ============================================================
+
+@st.fragment
+def task_workspace():
+    """Sıradakiler, liste, düzenleme formu ve metrikler tek bir parçadır (``st.fragment``).
+
+    Kart, toplu işlem, sayfa ve düzenleme eylemleri yalnızca bu parçayı yeniden
+    çalıştırır: CSS, kenar çubuğu ve ekleme formu yeniden çizilmez. Metrikler
+    de parçanın içinde olduğundan eylemle birlikte güncellenir.
+    """
+    with fragment_profile("workspace"):
+        # Son eylemin sonucu (geri çağrılar ve düzenleme formu bırakır)
+        if "flash_message" in st.session_state:
+            st.toast(st.session_state.pop("flash_message"))
+        render_next_up()
+        render_task_list()
+        render_deleted()
+        render_edit_form()
+        render_analytics()
+
+task_workspace()
+
+# Önbellek istatistikleri (kenar çubuğunun altında)
+cache_stats = cache.stats()
+st.sidebar.caption(
+    f"🗄️ Önbellek: {cache_stats['hits']} isabet / {cache_stats['misses']} ıskalama "
+    f"· {cache_stats['entries']} kayıt"
+)
+
+# ============================================================
+# GELİŞTİRİCİ PANELİ
+# ============================================================
+
+profile.lap("footer")
+rerun_report = {"session_reruns": st.session_state["reruns"], **profile.as_dict()}
+
+if PROFILE_LOG:
+    get_profile_logger().info(json.dumps(rerun_report, ensure_ascii=False))
+
+if DEBUG:
+    with st.sidebar.expander("🛠️ Geliştirici Paneli", expanded=True):
+        st.caption(f"Oturumdaki yeniden çalıştırma: {st.session_state['reruns']} "
+                   f"(+{st.session_state.get('fragment_reruns', 0)} parça) · "
+                   f"bu çalıştırma: {rerun_report['total_ms']:.1f} ms")
+        st.dataframe(rerun_report["sections"], hide_index=True, use_container_width=True)
+
+        snap = metrics.snapshot()
+        top_queries = sorted(snap["queries"].items(), key=lambda kv: kv[1]["total_ms"], reverse=True)[:10]
+        st.write("**En pahalı sorgular (süreç geneli)**")
+        st.dataframe(
+            [{"sql": sql[:80], **stats} for sql, stats in top_queries],
+            hide_index=True, use_container_width=True,
         )
-        st.plotly_chart(fig_status, use_container_width=True)
-        
-    st.markdown("---")
\ No newline at end of file
+        st.write("**Önbellek**", cache.stats())
+
+        dl_cols = st.columns(2)
+        with dl_cols[0]:
+            st.download_button("Prometheus", metrics.to_prometheus(), file_name="metrics.txt", use_container_width=True)
+        with dl_cols[1]:
+            st.download_button("JSON", metrics.to_json(), file_name="metrics.json", use_container_width=True)
+
+full_run = False
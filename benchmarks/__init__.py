@@ -0,0 +1 @@
+"""Görev deposu ve sayfa çizimi için performans ölçümleri."""
@@ -0,0 +1,208 @@
+"""Görev deposu ve sayfa çizimi için ölçüm düzeneği.
+
+Her veri boyutu için sentetik bir veritabanı üretilir ve ölçümler ayrı bir
+alt süreçte yapılır (önbellekler ve bellek ölçümü boyutlar arasında karışmaz).
+Bir yeniden çalıştırmanın aşamaları tek tek zamanlanır; Streamlit kuruluysa
+``AppTest`` ile tüm sayfa başsız (headless) olarak da çalıştırılır. Sonuç
+gecikme yüzdelikleri (ms) ve tepe bellek kullanımıyla JSON olarak yazılır.
+
+Aşamalar 1 numaralı kullanıcının listesinde ölçülür. ``--tasks-per-owner`` ile
+görevler kişi başı o kadar görev düşecek şekilde kullanıcılara dağıtılır;
+böylece tek kullanıcının sorgu süresinin tablonun toplam boyutundan bağımsız
+olduğu görülebilir.
+
+Örnek:
+    python -m benchmarks.run --sizes 1000,10000,100000 --out bench.json
+    python -m benchmarks.run --sizes 10000,1000000 --tasks-per-owner 50 --no-app
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+from storage import (
+    DB_PATH, DEFAULT_LIST_ID, DEFAULT_OWNER_ID, ConnectionPool, Scope, SQLiteTaskRepository, TaskFilter, similar_tasks,
+)
+
+from .synthetic import seed_database
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+PAGE_SIZE = 20
+
+
+# ============================================================
+# AŞAMALAR
+# ============================================================
+
+def _page(repo, f, offset=0):
+    return repo.count(f), repo.list(f, limit=PAGE_SIZE, offset=offset)
+
+
+def _analytics(repo):
+    return repo.summary(), repo.priority_distribution(), repo.status_distribution()
+
+
+def stages(repo, size):
+    """Ölçülecek aşamalar: ad → argümansız çağrılabilir (önbelleksiz depo üzerinde)."""
+    today = date.today()
+    return {
+        "list_first_page": lambda: _page(repo, TaskFilter(today=today)),
+        "list_deep_page": lambda: _page(repo, TaskFilter(today=today), offset=max(0, size // 2)),
+        "filter_open_overdue": lambda: _page(repo, TaskFilter(show_completed=False, due="overdue", today=today)),
+        "filter_high_week": lambda: _page(repo, TaskFilter(priorities=("High",), due="week", today=today)),
+        "search": lambda: _page(repo, TaskFilter(search="rapor", today=today)),
+        "analytics": lambda: _analytics(repo),
+        "trend_30d": lambda: repo.daily_activity(today - timedelta(days=29)),
+        "duplicate_check": lambda: similar_tasks(repo.pool, "Raporu bitir", repo.scope),
+        "next_up": lambda: repo.next_up(10),
+    }
+
+
+# ============================================================
+# ÖLÇÜM
+# ============================================================
+
+def percentiles(samples_ms):
+    ordered = sorted(samples_ms)
+
+    def pick(q):
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 3)
+
+    return {
+        "n": len(ordered),
+        "min": round(ordered[0], 3),
+        "p50": pick(0.50),
+        "p90": pick(0.90),
+        "p99": pick(0.99),
+        "max": round(ordered[-1], 3),
+    }
+
+
+def measure(fn, repeat):
+    """Süreleri (ms) ve ayrı bir turda tracemalloc tepe belleğini (KiB) ölçer."""
+    fn()  # Isınma: sayfa önbelleği / hazırlanmış ifadeler
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    result = percentiles(samples)
+    result["peak_kib"] = round(peak / 1024, 1)
+    return result
+
+
+def measure_app(db_path, repeat):
+    """Tüm sayfayı AppTest ile çalıştırır: soğuk ilk çalıştırma + sıcak tekrarlar."""
+    try:
+        from streamlit.testing.v1 import AppTest
+    except ImportError:
+        return {"skipped": "streamlit kurulu değil"}
+
+    # storage.DB_PATH içe aktarmada okunur; üst süreç TODO_DB_PATH'i ortamda verir
+    if os.path.abspath(DB_PATH) != os.path.abspath(db_path):
+        return {"error": f"TODO_DB_PATH ({DB_PATH}) ölçülen veritabanını göstermiyor"}
+    at = AppTest.from_file(APP_PATH, default_timeout=600)
+    started = time.perf_counter()
+    at.run()
+    cold = (time.perf_counter() - started) * 1000
+    if at.exception:
+        return {"error": at.exception[0].message}
+
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        at.run()
+        samples.append((time.perf_counter() - started) * 1000)
+    return {"cold_ms": round(cold, 3), "warm": percentiles(samples)}
+
+
+def run_worker(db_path, size, repeat, with_app):
+    pool = ConnectionPool(db_path)
+    # Uygulamanın açılışta seçtiği bölüm: varsayılan kullanıcının varsayılan listesi
+    repo = SQLiteTaskRepository(pool).scoped(Scope(DEFAULT_OWNER_ID, DEFAULT_LIST_ID))
+    scope_size = repo.count()
+    report = {"size": size, "scope_size": scope_size, "stages": {}}
+    for name, fn in stages(repo, scope_size).items():
+        report["stages"][name] = measure(fn, repeat)
+    pool.close()
+    if with_app:
+        report["app_rerun"] = measure_app(db_path, max(3, repeat // 4))
+    # Linux'ta KiB cinsinden
+    report["peak_rss_mb"] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Görev deposu ölçümleri")
+    parser.add_argument("--sizes", default="1000,10000,100000", help="Virgülle ayrılmış görev sayıları")
+    parser.add_argument("--repeat", type=int, default=20, help="Aşama başına tekrar")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--data-dir", help="Üretilen veritabanlarını burada tut ve yeniden kullan")
+    parser.add_argument("--tasks-per-owner", type=int, help="Görevleri kişi başı bu kadar olacak şekilde kullanıcılara dağıt")
+    parser.add_argument("--no-app", action="store_true", help="AppTest sayfa ölçümünü atla")
+    parser.add_argument("--out", help="JSON çıktı dosyası (varsayılan: standart çıktı)")
+    parser.add_argument("--worker", nargs=2, metavar=("DB", "SIZE"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        db_path, size = args.worker
+        json.dump(run_worker(db_path, int(size), args.repeat, not args.no_app), sys.stdout)
+        return 0
+
+    data_dir = args.data_dir or tempfile.mkdtemp(prefix="todo-bench-")
+    os.makedirs(data_dir, exist_ok=True)
+    results = []
+    for size in (int(s) for s in args.sizes.split(",") if s.strip()):
+        owners = -(-size // args.tasks_per_owner) if args.tasks_per_owner else 1
+        suffix = f"-o{owners}" if owners > 1 else ""
+        db_path = os.path.join(data_dir, f"bench-{size}-{args.seed}{suffix}.db")
+        if not os.path.exists(db_path):
+            print(f"{size} görev üretiliyor...", file=sys.stderr)
+            started = time.perf_counter()
+            seed_database(db_path, size, seed=args.seed, owners=owners)
+            print(f"  {time.perf_counter() - started:.1f} sn", file=sys.stderr)
+
+        print(f"{size} görev ölçülüyor...", file=sys.stderr)
+        cmd = [sys.executable, "-m", "benchmarks.run", "--worker", db_path, str(size), "--repeat", str(args.repeat)]
+        if args.no_app:
+            cmd.append("--no-app")
+        env = dict(os.environ, TODO_DB_PATH=db_path)
+        out = subprocess.run(cmd, check=True, capture_output=True, text=True,
+                             cwd=os.path.dirname(APP_PATH), env=env).stdout
+        results.append(json.loads(out))
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "seed": args.seed,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as fh:
+            fh.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""Soğuk açılış bütçesi ölçümü.
+
+Her tekrar yeni bir Python sürecinde (küçük, geçici bir veritabanıyla) yapılır:
+``storage`` ve ``streamlit`` içe aktarma süreleri, sayfanın ilk çizimi ve
+grafiklerin ilk açılışı ayrı ayrı ölçülür. İlk çizimden sonra ağır modüllerin
+(plotly.express, pandas, pyarrow) yüklenmemiş olması ve toplam açılışın bütçeyi
+aşmaması beklenir; aksi halde çıkış kodu 1'dir (CI ve sağlık kontrolleri için).
+
+Örnek:
+    python -m benchmarks.startup --budget-ms 2500 --repeat 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+# Streamlit kendi içinde plotly.graph_objects'i yükler; uygulamanın ertelediği
+# maliyet plotly.express (numpy ile) ve veri çerçevesi kütüphaneleridir
+HEAVY_MODULES = ("plotly.express", "pandas", "pyarrow")
+
+
+def run_worker():
+    """Tek bir soğuk açılışı ölçer (bu süreç yalnızca bir kez kullanılır)."""
+    timings = {}
+    started = time.perf_counter()
+    import storage  # noqa: F401
+    timings["import_storage_ms"] = (time.perf_counter() - started) * 1000
+
+    t = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+    timings["import_streamlit_ms"] = (time.perf_counter() - t) * 1000
+
+    at = AppTest.from_file(APP_PATH, default_timeout=120)
+    t = time.perf_counter()
+    at.run()
+    timings["first_run_ms"] = (time.perf_counter() - t) * 1000
+    timings["startup_ms"] = (time.perf_counter() - started) * 1000
+    if at.exception:
+        return {"error": at.exception[0].message}
+    loaded = [m for m in HEAVY_MODULES if m in sys.modules]
+
+    # Grafikler açılınca ertelenen maliyet ödenir
+    t = time.perf_counter()
+    at.toggle(key="show_charts").set_value(True).run()
+    timings["charts_first_run_ms"] = (time.perf_counter() - t) * 1000
+    return {"timings": timings, "heavy_after_first_run": loaded}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Soğuk açılış bütçesi")
+    parser.add_argument("--budget-ms", type=float, default=2500.0, help="İçe aktarma + ilk çizim için üst sınır (medyan)")
+    parser.add_argument("--repeat", type=int, default=3, help="Yeni süreçte tekrar sayısı")
+    parser.add_argument("--tasks", type=int, default=100, help="Geçici veritabanındaki görev sayısı")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        json.dump(run_worker(), sys.stdout)
+        return 0
+
+    from .synthetic import seed_database  # storage'ı işçiden önce yüklemesin
+
+    runs = []
+    with tempfile.TemporaryDirectory(prefix="todo-startup-") as tmp:
+        for i in range(args.repeat):
+            # Veri boyutu açılışı etkilemesin diye küçük; analiz bölümü için boş değil
+            db_path = os.path.join(tmp, f"startup-{i}.db")
+            seed_database(db_path, args.tasks)
+            env = dict(os.environ, TODO_DB_PATH=db_path)
+            out = subprocess.run(
+                [sys.executable, "-m", "benchmarks.startup", "--worker"],
+                check=True, capture_output=True, text=True, cwd=os.path.dirname(APP_PATH), env=env,
+            ).stdout
+            result = json.loads(out)
+            if "error" in result:
+                print(json.dumps(result, ensure_ascii=False), file=sys.stderr)
+                return 1
+            runs.append(result)
+
+    medians = {
+        key: round(statistics.median(r["timings"][key] for r in runs), 1)
+        for key in runs[0]["timings"]
+    }
+    heavy = sorted({m for r in runs for m in r["heavy_after_first_run"]})
+    report = {
+        "budget_ms": args.budget_ms,
+        "median": medians,
+        "heavy_after_first_run": heavy,
+        "ok": medians["startup_ms"] <= args.budget_ms and not heavy,
+    }
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    return 0 if report["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
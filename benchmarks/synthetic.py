@@ -0,0 +1,129 @@
+"""Gerçekçi dağılımlarla sentetik görev verisi üretir.
+
+Dağılımlar:
+- öncelik: %45 Low, %35 Medium, %20 High
+- son tarih: %15 yok; diğerleri bugünün etrafında (-30, +60 gün), yakın
+  tarihler daha olası
+- tamamlanma: oluşturma tarihi eski olanlar daha olası tamamlanmış; tamamlanma
+  süresi saatlerden haftalara uzanır
+- ilerleme: açık görevlerde 10'un katları, çoğunluk düşük yüzdelerde
+- sahip: ``owners`` kullanıcıya sırayla dağıtılır (her birinin tek listesi)
+
+Örnek:
+    python -m benchmarks.synthetic bench.db 100000
+    python -m benchmarks.synthetic multi.db 1000000 --owners 20000   # kişi başı 50 görev
+"""
+
+import argparse
+import random
+import sys
+from datetime import date, datetime, timedelta
+
+from storage import DEFAULT_LIST_ID, DEFAULT_OWNER_ID, ConnectionPool, migrate
+from storage.codec import DAY, PRIORITY_RANK, date_to_epoch, datetime_to_epoch
+
+_VERBS = ["Hazırla", "Gözden geçir", "Gönder", "Bitir", "Planla", "Ara", "Güncelle", "Test et", "Yaz", "Düzelt"]
+_NOUNS = [
+    "raporu", "sunumu", "bütçeyi", "müşteri mailini", "faturayı", "sprint planını", "toplantı notlarını",
+    "tasarım taslağını", "veritabanı yedeğini", "kod incelemesini", "sözleşmeyi", "haftalık özeti",
+    "ürün yol haritasını", "test senaryolarını", "kullanıcı geri bildirimlerini", "dokümantasyonu",
+]
+_DETAILS = [
+    "Öncelikle eksik verileri tamamla.", "Ekiple paylaşmadan önce kontrol et.",
+    "Son sürümü klasöre yükle.", "Yönetime özet çıkar.", "Geri bildirimleri not al.",
+    "Gerekirse ek süre iste.", "İlgili kişileri bilgilendir.",
+]
+
+
+def generate_tasks(n, seed=42, today=None):
+    """``tasks`` sütun sırasında (id hariç) kodlanmış satırlar üretir."""
+    rng = random.Random(seed)
+    today = today or date.today()
+    now = datetime.combine(today, datetime.min.time()) + timedelta(hours=12)
+    priorities = list(PRIORITY_RANK.values())
+
+    for i in range(n):
+        title = f"{rng.choice(_NOUNS).capitalize()} {rng.choice(_VERBS).lower()} #{i}"
+        description = " ".join(rng.sample(_DETAILS, rng.randint(1, 3))) if rng.random() < 0.6 else None
+        priority = rng.choices(priorities, weights=[45, 35, 20])[0]
+
+        age_days = rng.expovariate(1 / 45)
+        created = now - timedelta(days=age_days, seconds=rng.randint(0, 86399))
+
+        if rng.random() < 0.15:
+            deadline = None
+        else:
+            offset = int(rng.triangular(-30, 60, 3))
+            deadline = date_to_epoch(today + timedelta(days=offset))
+
+        # Eski görevlerin tamamlanmış olma olasılığı daha yüksek
+        done = rng.random() < min(0.9, 0.2 + age_days / 90)
+        if done:
+            progress = 100
+            duration = timedelta(hours=rng.lognormvariate(3, 1.2))
+            completed_at = datetime_to_epoch(min(created + duration, now))
+        else:
+            progress = min(90, int(rng.expovariate(1 / 25)) // 10 * 10)
+            completed_at = None
+
+        notified = 0
+        if not done and deadline is not None:
+            today_e = date_to_epoch(today)
+            notified = 2 if deadline < today_e else (1 if deadline < today_e + DAY else 0)
+
+        yield (title, description, deadline, priority, progress, int(done),
+               datetime_to_epoch(created), completed_at, notified)
+
+
+def seed_owners(pool, owners):
+    """Varsayılan kullanıcıya ek olarak ``owners - 1`` kullanıcı ve birer liste ekler.
+
+    Kimlikler sıralıdır: k. kullanıcının listesi de k numaralıdır.
+    """
+    with pool.write() as conn:
+        conn.executemany(
+            "INSERT INTO users (id, name, created_at) VALUES (?, ?, 0)",
+            ((k, f"kullanici{k}") for k in range(DEFAULT_OWNER_ID + 1, owners + 1)),
+        )
+        conn.executemany(
+            "INSERT INTO lists (id, owner_id, name, created_at) VALUES (?, ?, 'Genel', 0)",
+            ((k, k) for k in range(DEFAULT_LIST_ID + 1, owners + 1)),
+        )
+
+
+def seed_database(path, n, seed=42, batch_size=10000, owners=1):
+    """``path``'teki veritabanını şemayla oluşturur ve ``n`` görevi ``owners`` kullanıcıya dağıtır."""
+    pool = ConnectionPool(path)
+    migrate(pool)
+    seed_owners(pool, owners)
+    sql = ("INSERT INTO tasks (title,description,deadline,priority,progress,is_completed,"
+           "created_at,completed_at,notified,owner_id,list_id) VALUES (?,?,?,?,?,?,?,?,?,?,?)")
+    batch = []
+    for i, row in enumerate(generate_tasks(n, seed=seed)):
+        owner = 1 + i % owners
+        batch.append(row + (owner, owner))
+        if len(batch) >= batch_size:
+            with pool.write() as conn:
+                conn.executemany(sql, batch)
+            batch.clear()
+    if batch:
+        with pool.write() as conn:
+            conn.executemany(sql, batch)
+    with pool.write() as conn:
+        conn.execute("ANALYZE")
+    pool.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sentetik görev verisi üret")
+    parser.add_argument("path")
+    parser.add_argument("count", type=int)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--owners", type=int, default=1, help="Görevlerin dağıtılacağı kullanıcı sayısı")
+    args = parser.parse_args(argv)
+    seed_database(args.path, args.count, seed=args.seed, owners=args.owners)
+    print(f"{args.count} görev eklendi: {args.path}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Yazma yolunda değişiklik geçmişinin maliyeti ve bütçesi.
+
+Aynı sentetik veritabanının iki kopyası hazırlanır: biri olduğu gibi, diğeri
+geçmiş tetikleyicileri (``tasks_audit_*``) kaldırılmış olarak. Her kopyada
+tek görevlik yazmalar (ekleme, ilerleme güncelleme, tamamlama, silme) depo
+üzerinden tek tek zamanlanır. Geçmişin medyan ek maliyeti işlem başına
+bütçeyi aşarsa çıkış kodu 1'dir (CI ve sağlık kontrolleri için).
+
+Örnek:
+    python -m benchmarks.writes --tasks 100000 --ops 2000 --budget-us 50
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+from storage import DEFAULT_LIST_ID, DEFAULT_OWNER_ID, ConnectionPool, Scope, SQLiteTaskRepository
+
+from .synthetic import seed_database
+
+AUDIT_TRIGGERS = ("tasks_audit_ai", "tasks_audit_ad", "tasks_audit_au")
+
+
+def _time_us(fn):
+    started = time.perf_counter()
+    fn()
+    return (time.perf_counter() - started) * 1e6
+
+
+def measure_writes(path, ops, seed=42):
+    """İşlem adı → mikrosaniye cinsinden örnekler."""
+    pool = ConnectionPool(path)
+    repo = SQLiteTaskRepository(pool).scoped(Scope(DEFAULT_OWNER_ID, DEFAULT_LIST_ID))
+    rnd = random.Random(seed)
+    with pool.read() as conn:
+        ids = [r[0] for r in conn.execute("SELECT id FROM tasks ORDER BY id")]
+    samples = {"add": [], "update_progress": [], "complete": [], "delete": []}
+    for _ in range(ops):
+        task_id = rnd.choice(ids)
+        samples["update_progress"].append(_time_us(lambda: repo.update(task_id, progress=rnd.randrange(100))))
+        completed = not repo.get(task_id)["is_completed"]
+        samples["complete"].append(_time_us(lambda: repo.mark_complete(task_id, completed)))
+        new_ids = []
+        samples["add"].append(_time_us(lambda: new_ids.append(repo.add("Ölçüm görevi", "açıklama", None, "Medium"))))
+        samples["delete"].append(_time_us(lambda: repo.delete(new_ids[0])))
+    with pool.read() as conn:
+        event_bytes = conn.execute("SELECT AVG(LENGTH(data)) FROM task_events WHERE kind = 'update'").fetchone()[0]
+    pool.close()
+    return samples, event_bytes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Değişiklik geçmişinin yazma maliyeti")
+    parser.add_argument("--tasks", type=int, default=100000, help="Sentetik veritabanındaki görev sayısı")
+    parser.add_argument("--ops", type=int, default=2000, help="İşlem türü başına ölçüm sayısı")
+    parser.add_argument("--budget-us", type=float, default=50.0, help="İşlem başına medyan ek maliyet üst sınırı")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="todo-writes-") as tmp:
+        audited = os.path.join(tmp, "audited.db")
+        plain = os.path.join(tmp, "plain.db")
+        seed_database(audited, args.tasks)
+        shutil.copy(audited, plain)
+        pool = ConnectionPool(plain)
+        with pool.write() as conn:
+            for name in AUDIT_TRIGGERS:
+                conn.execute(f"DROP TRIGGER {name}")
+        pool.close()
+
+        plain_samples, _ = measure_writes(plain, args.ops)
+        audited_samples, event_bytes = measure_writes(audited, args.ops)
+
+    ops = {}
+    for name in plain_samples:
+        base = statistics.median(plain_samples[name])
+        with_history = statistics.median(audited_samples[name])
+        ops[name] = {
+            "p50_us": round(base, 1),
+            "p50_with_history_us": round(with_history, 1),
+            "overhead_us": round(with_history - base, 1),
+        }
+    report = {
+        "tasks": args.tasks,
+        "budget_us": args.budget_us,
+        "ops": ops,
+        "avg_update_event_bytes": round(event_bytes or 0, 1),
+        "ok": all(o["overhead_us"] <= args.budget_us for o in ops.values()),
+    }
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    return 0 if report["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,307 @@
+"""Komut satırı araçları.
+
+Örnekler:
+    python manage.py import gorevler.csv
+    python manage.py import eski.jsonl --skip-invalid
+    python manage.py import is.csv --user ayse --list İş
+    python manage.py export yedek.parquet
+    python manage.py export - --format csv > gorevler.csv
+    python manage.py migrate
+    python manage.py rollup-rebuild
+    python manage.py history-compact --days 90
+    python manage.py restore 42
+    python manage.py notify --webhook http://localhost:9000/hook
+    python manage.py serve-api --port 8502
+    python manage.py backup yedekler/
+    python manage.py check --fts
+    python manage.py maintain --backup-dir yedekler/
+    python manage.py maintain --convert
+    python manage.py maintain --history-days 0   # geçmişe dokunma
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+from storage import (
+    DB_PATH, SCHEMA_VERSION, ConnectionPool, DeadlineNotifier, LogSink, Scope, WebhookSink,
+    compact_history, get_or_create_list, get_or_create_user, list_users, migrate, rebuild_rollups, restore_task,
+    user_lists,
+)
+from storage.codec import DAY, now_epoch
+from storage.maintenance import analyze, backup, checkpoint, compact, database_stats, integrity_check
+from storage.bulk import FORMATS, BulkImportError, detect_format, export_tasks, import_tasks
+
+
+def open_pool(args):
+    pool = ConnectionPool(args.db)
+    migrate(pool)
+    return pool
+
+
+def resolve_scope(pool, args, create):
+    """--user/--list adlarını bir ``Scope``'a çevirir; verilmezse ``None`` (tüm tablo)."""
+    if not args.user:
+        if args.list:
+            raise SystemExit("Hata: --list için --user da verilmeli")
+        return None
+    if create:
+        user = get_or_create_user(pool, args.user)
+        task_list = get_or_create_list(pool, user.id, args.list) if args.list else user_lists(pool, user.id)[0]
+        return Scope(user.id, task_list.id)
+    user = next((u for u in list_users(pool) if u.name.casefold() == args.user.casefold()), None)
+    if user is None:
+        raise SystemExit(f"Hata: kullanıcı bulunamadı: {args.user}")
+    if not args.list:
+        return Scope(user.id)
+    task_list = next((l for l in user_lists(pool, user.id) if l.name.casefold() == args.list.casefold()), None)
+    if task_list is None:
+        raise SystemExit(f"Hata: liste bulunamadı: {args.list}")
+    return Scope(user.id, task_list.id)
+
+
+def cmd_migrate(args):
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    start, end = migrate(ConnectionPool(args.db))
+    if start == end:
+        print(f"Şema güncel (sürüm {end})", file=sys.stderr)
+    else:
+        print(f"Şema {start} → {end} sürümüne yükseltildi", file=sys.stderr)
+    return 0
+
+
+def cmd_rollup_rebuild(args):
+    pool = open_pool(args)
+    started = time.perf_counter()
+    with pool.write() as conn:
+        rollup, daily = rebuild_rollups(conn)
+    print(
+        f"Analiz özetleri yeniden kuruldu: {rollup} özet, {daily} gün satırı "
+        f"({time.perf_counter() - started:.2f} sn)", file=sys.stderr,
+    )
+    return 0
+
+
+def cmd_history_compact(args):
+    pool = open_pool(args)
+    removed, written = compact_history(pool, now_epoch() - args.days * DAY, purge_deleted=not args.keep_deleted)
+    print(f"Geçmiş sıkıştırıldı: {removed} olay silindi, {written} olay yazıldı", file=sys.stderr)
+    return 0
+
+
+def cmd_restore(args):
+    pool = open_pool(args)
+    try:
+        task = restore_task(pool, args.task_id)
+    except ValueError as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 1
+    print(f"Görev #{task['id']} geri yüklendi: {task['title']}", file=sys.stderr)
+    return 0
+
+
+def cmd_import(args):
+    pool = open_pool(args)
+    started = time.perf_counter()
+    try:
+        result = import_tasks(
+            pool, args.path, fmt=args.format,
+            batch_size=args.batch_size, skip_invalid=args.skip_invalid,
+            scope=resolve_scope(pool, args, create=True),
+        )
+    except BulkImportError as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - started
+    print(f"{result.inserted} görev eklendi, {result.skipped} kayıt atlandı ({elapsed:.2f} sn)", file=sys.stderr)
+    for message in result.errors:
+        print(f"  {message}", file=sys.stderr)
+    return 0
+
+
+def cmd_export(args):
+    fmt = args.format or detect_format(args.path)
+    if args.path == "-" and fmt == "parquet":
+        print("Hata: Parquet standart çıktıya yazılamaz", file=sys.stderr)
+        return 1
+    pool = open_pool(args)
+    started = time.perf_counter()
+    written = export_tasks(pool, args.path, fmt, batch_size=args.batch_size, scope=resolve_scope(pool, args, create=False))
+    print(f"{written} görev dışa aktarıldı ({time.perf_counter() - started:.2f} sn)", file=sys.stderr)
+    return 0
+
+
+def cmd_notify(args):
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    sinks = [LogSink()]
+    if args.webhook:
+        sinks.append(WebhookSink(args.webhook))
+    notifier = DeadlineNotifier(open_pool(args), sinks=sinks, interval=args.interval)
+    if not args.loop:
+        while len(notifier.poll_once()) >= notifier.batch_size:
+            pass
+        return 0
+    notifier.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        notifier.stop()
+    return 0
+
+
+def cmd_serve_api(args):
+    import asyncio
+
+    from api import serve  # Yalnızca bu komut sunucuyu yükler
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    pool = open_pool(args)
+    try:
+        asyncio.run(serve(pool, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        pool.close()
+    return 0
+
+
+def _mib(n):
+    return f"{n / 1024 / 1024:.1f} MiB"
+
+
+def cmd_backup(args):
+    pool = open_pool(args)
+    started = time.perf_counter()
+    path = backup(pool, args.dest, pages=args.pages)
+    print(f"Yedek yazıldı: {path} ({_mib(os.path.getsize(path))}, {time.perf_counter() - started:.2f} sn)",
+          file=sys.stderr)
+    return 0
+
+
+def cmd_check(args):
+    pool = open_pool(args)
+    problems = integrity_check(pool, quick=args.quick, fts=args.fts)
+    for message in problems:
+        print(message, file=sys.stderr)
+    return 0 if problems == ["ok"] else 1
+
+
+def cmd_maintain(args):
+    pool = open_pool(args)
+    before = database_stats(pool)
+    if args.check:
+        problems = integrity_check(pool, quick=True)
+        if problems != ["ok"]:
+            for message in problems:
+                print(message, file=sys.stderr)
+            print("Hata: bütünlük denetimi başarısız, bakım yapılmadı", file=sys.stderr)
+            return 1
+    if args.backup_dir:
+        print(f"Yedek: {backup(pool, args.backup_dir)}", file=sys.stderr)
+    if args.history_days:
+        # Geçmiş önce katlanır; boşalan sayfalar aynı çalıştırmada atılır
+        removed, written = compact_history(pool, now_epoch() - args.history_days * DAY)
+        print(f"Geçmiş sıkıştırıldı: {removed} olay silindi, {written} olay yazıldı", file=sys.stderr)
+    freed, remaining = compact(pool, max_pages=args.max_pages, convert=args.convert)
+    analyze(pool, analysis_limit=args.analysis_limit)
+    checkpoint(pool)
+    after = database_stats(pool)
+    print(
+        f"Sıkıştırma: {freed} boş sayfa atıldı, {remaining} kaldı (auto_vacuum={after['auto_vacuum']}); "
+        f"dosya {_mib(before['file_bytes'])} → {_mib(after['file_bytes'])}, "
+        f"WAL {_mib(before['wal_bytes'])} → {_mib(after['wal_bytes'])}",
+        file=sys.stderr,
+    )
+    if after["auto_vacuum"] != "incremental":
+        print("Not: auto_vacuum kapalı, boş sayfalar atılmadı; bir kez --convert ile dönüştürün", file=sys.stderr)
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Görev veritabanı araçları")
+    parser.add_argument("--db", default=DB_PATH, help=f"SQLite dosyası (varsayılan: {DB_PATH})")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("migrate", help=f"Şemayı güncel sürüme ({SCHEMA_VERSION}) yükselt")
+    p.set_defaults(func=cmd_migrate)
+
+    p = sub.add_parser("rollup-rebuild", help="Analiz özet tablolarını görevlerden yeniden hesapla (onarım)")
+    p.set_defaults(func=cmd_rollup_rebuild)
+
+    p = sub.add_parser("history-compact", help="Eski değişiklik geçmişini gün başına katla, eski silinenleri at")
+    p.add_argument("--days", type=int, default=90, help="Bu kadar günden eski olaylar sıkıştırılır")
+    p.add_argument("--keep-deleted", action="store_true", help="Silinmiş görevlerin geçmişini atma")
+    p.set_defaults(func=cmd_history_compact)
+
+    p = sub.add_parser("restore", help="Silinmiş bir görevi geçmişinden aynı kimlikle geri yükle")
+    p.add_argument("task_id", type=int)
+    p.set_defaults(func=cmd_restore)
+
+    p = sub.add_parser("import", help="CSV / JSONL / Parquet dosyasından görev içe aktar")
+    p.add_argument("path", help="Kaynak dosya ('-' = standart girdi)")
+    p.add_argument("--format", choices=FORMATS, help="Belirtilmezse uzantıdan bulunur")
+    p.add_argument("--batch-size", type=int, default=5000)
+    p.add_argument("--skip-invalid", action="store_true", help="Geçersiz kayıtları atla ve raporla")
+    p.add_argument("--user", help="Hedef kullanıcı (yoksa oluşturulur; varsayılan: varsayılan kullanıcı)")
+    p.add_argument("--list", help="Hedef liste (yoksa oluşturulur; varsayılan: kullanıcının ilk listesi)")
+    p.set_defaults(func=cmd_import)
+
+    p = sub.add_parser("export", help="Görevleri CSV / JSONL / Parquet olarak dışa aktar")
+    p.add_argument("path", help="Hedef dosya ('-' = standart çıktı)")
+    p.add_argument("--format", choices=FORMATS, help="Belirtilmezse uzantıdan bulunur")
+    p.add_argument("--batch-size", type=int, default=5000)
+    p.add_argument("--user", help="Yalnızca bu kullanıcının görevleri")
+    p.add_argument("--list", help="Yalnızca bu listenin görevleri (--user ile)")
+    p.set_defaults(func=cmd_export)
+
+    p = sub.add_parser("notify", help="Son tarihi gelen/geçen görevleri bildir (cron için tek tur)")
+    p.add_argument("--webhook", help="Bildirimlerin POST edileceği adres")
+    p.add_argument("--loop", action="store_true", help="Tek tur yerine sürekli çalış")
+    p.add_argument("--interval", type=float, default=60.0, help="--loop ile tarama aralığı (sn)")
+    p.set_defaults(func=cmd_notify)
+
+    p = sub.add_parser("serve-api", help="REST/JSON API sunucusunu çalıştır (arayüzden ayrı süreç)")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8502)
+    p.set_defaults(func=cmd_serve_api)
+
+    p = sub.add_parser("backup", help="Canlı veritabanının tutarlı anlık görüntüsünü al (çevrimiçi yedekleme API'si)")
+    p.add_argument("dest", help="Hedef dosya ya da klasör (klasörse ad zaman damgasıyla üretilir)")
+    p.add_argument("--pages", type=int, default=1024, help="Adım başına kopyalanan sayfa sayısı")
+    p.set_defaults(func=cmd_backup)
+
+    p = sub.add_parser("check", help="Bütünlük denetimi (sorun varsa çıkış kodu 1)")
+    p.add_argument("--quick", action="store_true", help="İndeks içeriklerini karşılaştırmadan hızlı denetim")
+    p.add_argument("--fts", action="store_true", help="Tam metin indekslerinin tutarlılığını da denetle")
+    p.set_defaults(func=cmd_check)
+
+    p = sub.add_parser("maintain", help="Boş sayfaları at, istatistikleri yenile, WAL'ı aktar (uygulama çalışırken)")
+    p.add_argument("--backup-dir", help="Önce bu klasöre yedek al")
+    p.add_argument("--check", action="store_true", help="Önce hızlı bütünlük denetimi yap; sorun varsa dur")
+    p.add_argument("--max-pages", type=int, help="En fazla bu kadar boş sayfa at")
+    p.add_argument(
+        "--history-days", type=int, default=90,
+        help="Bu kadar günden eski geçmişi sıkıştır (history-compact gibi); 0 = atla",
+    )
+    p.add_argument(
+        "--convert", action="store_true",
+        help="auto_vacuum kapalı eski dosyayı tek seferlik tam VACUUM ile dönüştür (süresince yazmalar bekler)",
+    )
+    p.add_argument("--analysis-limit", type=int, default=1000, help="ANALYZE için indeks başına örnek satır")
+    p.set_defaults(func=cmd_maintain)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command == "import" and args.path == "-" and not args.format:
+        args.format = "jsonl"
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
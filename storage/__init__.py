@@ -0,0 +1,26 @@
+"""Görev deposu için Streamlit'ten bağımsız yardımcılar."""
+
+from .db import DB_PATH, ConnectionPool
+from .migrations import SCHEMA_VERSION, migrate
+from .codec import PRIORITIES, decode_task, encode_fields, utc_today
+from .queries import (
+    DUE_FILTERS, Scope, TaskFilter, build_select, build_count, build_ids, urgency_days, urgency_key,
+)
+from .analytics import (
+    task_summary, priority_distribution, status_distribution, daily_activity, weekly_activity, rebuild_rollups,
+)
+from .cache import ResultCache
+from .accounts import (
+    DEFAULT_LIST_ID, DEFAULT_OWNER_ID, TaskList, User,
+    create_list, get_or_create_list, get_or_create_user, list_users, user_lists,
+)
+from .duplicates import SimilarTask, similar_tasks
+from .history import (
+    TaskEvent, compact_history, deleted_tasks, progress_history, restore_task, task_history, time_at_progress,
+    undo_last_change,
+)
+from .notify import DeadlineNotifier, LogSink, MemorySink, WebhookSink
+from .metrics import Metrics, RerunProfile
+from .repository import (
+    TaskRepository, SQLiteTaskRepository, MemoryTaskRepository, CachedTaskRepository, AsyncTaskRepository,
+)
@@ -0,0 +1,85 @@
+"""Kullanıcılar ve görev listeleri.
+
+Her görev bir kullanıcının (``owner_id``) bir listesine (``list_id``) aittir.
+Şema 3'e yükseltilen veritabanlarındaki mevcut görevler varsayılan
+kullanıcının "Genel" listesine düşer. Yeni kullanıcı açıldığında ona da bir
+"Genel" listesi oluşturulur.
+"""
+
+import sqlite3
+from dataclasses import dataclass
+
+from .codec import now_epoch
+
+DEFAULT_OWNER_ID = 1
+DEFAULT_USER_NAME = "varsayılan"
+DEFAULT_LIST_ID = 1
+DEFAULT_LIST_NAME = "Genel"
+
+
+@dataclass(frozen=True)
+class User:
+    id: int
+    name: str
+
+
+@dataclass(frozen=True)
+class TaskList:
+    id: int
+    owner_id: int
+    name: str
+
+
+def _clean(name, what):
+    name = (name or "").strip()
+    if not name:
+        raise ValueError(f"{what} adı boş olamaz")
+    return name
+
+
+def list_users(pool):
+    with pool.read() as conn:
+        return [User(r["id"], r["name"]) for r in conn.execute("SELECT id, name FROM users ORDER BY id")]
+
+
+def get_or_create_user(pool, name):
+    """Adıyla kullanıcıyı döndürür; yoksa varsayılan listesiyle birlikte oluşturur."""
+    name = _clean(name, "Kullanıcı")
+    with pool.write() as conn:
+        row = conn.execute("SELECT id, name FROM users WHERE name = ?", (name,)).fetchone()
+        if row:
+            return User(row["id"], row["name"])
+        cur = conn.execute("INSERT INTO users (name, created_at) VALUES (?, ?)", (name, now_epoch()))
+        conn.execute(
+            "INSERT INTO lists (owner_id, name, created_at) VALUES (?, ?, ?)",
+            (cur.lastrowid, DEFAULT_LIST_NAME, now_epoch()),
+        )
+        return User(cur.lastrowid, name)
+
+
+def user_lists(pool, owner_id):
+    with pool.read() as conn:
+        return [
+            TaskList(r["id"], r["owner_id"], r["name"])
+            for r in conn.execute("SELECT id, owner_id, name FROM lists WHERE owner_id = ? ORDER BY id", (owner_id,))
+        ]
+
+
+def create_list(pool, owner_id, name):
+    """Kullanıcıya yeni liste açar; aynı adda liste varsa ``ValueError``."""
+    name = _clean(name, "Liste")
+    try:
+        with pool.write() as conn:
+            cur = conn.execute(
+                "INSERT INTO lists (owner_id, name, created_at) VALUES (?, ?, ?)", (owner_id, name, now_epoch())
+            )
+    except sqlite3.IntegrityError:
+        raise ValueError(f"'{name}' adında bir liste zaten var") from None
+    return TaskList(cur.lastrowid, owner_id, name)
+
+
+def get_or_create_list(pool, owner_id, name):
+    for task_list in user_lists(pool, owner_id):
+        if task_list.name.casefold() == name.strip().casefold():
+            return task_list
+    return create_list(pool, owner_id, name)
@@ -0,0 +1,116 @@
+"""Görev Analizi bölümü için toplu (aggregate) SQL sorguları.
+
+Metrikler görev tablosu yerine özet tablolarından okunur: ``task_rollup``
+sahip/liste, öncelik ve durum başına sayıları ve tamamlanma süresi
+toplamlarını, ``task_daily`` ise gün başına eklenen/tamamlanan görev
+sayılarını tutar. Özetler ``tasks`` üzerindeki tetikleyicilerle her yazmada
+artımlı güncellenir (bkz. ``migrations.ROLLUP_TRIGGERS``); okuma maliyeti
+görev sayısına değil, özet satırı (öncelik × durum ya da gün) sayısına
+bağlıdır. ``rebuild_rollups`` özetleri görev tablosundan yeniden kurar.
+``scope`` verilirse yalnızca o bölüm sayılır.
+"""
+
+from datetime import date
+
+from .codec import DAY, date_to_epoch, epoch_to_date, priority_label
+from .queries import scope_where
+
+
+def _where(scope, *extra):
+    clauses, params = scope_where(scope)
+    clauses += [c for c, _ in extra]
+    params += [p for _, p in extra]
+    return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+
+def rebuild_rollups(conn):
+    """Özet tablolarını görev tablosundan baştan hesaplar; (özet, gün) satır sayıları.
+
+    Tetikleyicilerin dışında kalan bir değişiklikten (elle yapılan toplu SQL,
+    yarıda kalmış bir geri yükleme) sonra onarım içindir.
+    """
+    conn.execute("DELETE FROM task_rollup")
+    conn.execute("DELETE FROM task_daily")
+    rollup = conn.execute("""
+        INSERT INTO task_rollup (owner_id, list_id, priority, is_completed, tasks, duration_sum, duration_count)
+        SELECT owner_id, list_id, priority, is_completed, COUNT(*),
+               COALESCE(SUM(completed_at - created_at), 0), COUNT(completed_at - created_at)
+        FROM tasks
+        GROUP BY owner_id, list_id, priority, is_completed
+    """).rowcount
+    daily = conn.execute(f"""
+        INSERT INTO task_daily (owner_id, list_id, day, created, completed)
+        SELECT owner_id, list_id, day, SUM(created), SUM(completed) FROM (
+            SELECT owner_id, list_id, created_at - created_at % {DAY} AS day, 1 AS created, 0 AS completed
+            FROM tasks WHERE created_at IS NOT NULL
+            UNION ALL
+            SELECT owner_id, list_id, completed_at - completed_at % {DAY}, 0, 1
+            FROM tasks WHERE is_completed = 1 AND completed_at IS NOT NULL
+        )
+        GROUP BY owner_id, list_id, day
+    """).rowcount
+    return rollup, daily
+
+
+def task_summary(conn, scope=None):
+    """Toplam, tamamlanan, bekleyen sayıları ve ortalama tamamlanma süresi (sn)."""
+    where, params = _where(scope)
+    row = conn.execute(f"""
+        SELECT
+            COALESCE(SUM(tasks), 0),
+            COALESCE(SUM(tasks * is_completed), 0),
+            SUM(duration_sum),
+            SUM(duration_count)
+        FROM task_rollup{where}
+    """, params).fetchone()
+    total, completed, duration_sum, duration_count = row
+    return {
+        "total": total,
+        "completed": completed,
+        "pending": total - completed,
+        "avg_completion_seconds": duration_sum / duration_count if duration_count else None,
+    }
+
+
+def priority_distribution(conn, scope=None):
+    """Öncelik seviyesine göre görev sayıları: [(priority, count), ...]."""
+    where, params = _where(scope)
+    cur = conn.execute(
+        f"SELECT priority, SUM(tasks) FROM task_rollup{where} "
+        "GROUP BY priority HAVING SUM(tasks) > 0 ORDER BY priority", params
+    )
+    return [(priority_label(r[0]), r[1]) for r in cur.fetchall()]
+
+
+def status_distribution(conn, scope=None):
+    """Tamamlanma durumuna göre görev sayıları: [(is_completed, count), ...]."""
+    where, params = _where(scope)
+    cur = conn.execute(
+        f"SELECT is_completed, SUM(tasks) FROM task_rollup{where} "
+        "GROUP BY is_completed HAVING SUM(tasks) > 0 ORDER BY is_completed", params
+    )
+    return [(r[0], r[1]) for r in cur.fetchall()]
+
+
+def daily_activity(conn, scope=None, since=None):
+    """Gün başına eklenen ve tamamlanan görevler: [(date, created, completed), ...].
+
+    Yalnızca hareket olan günler döner; ``since`` (dahil) verilirse öncesi atlanır.
+    """
+    extra = [("day >= ?", date_to_epoch(since))] if since is not None else []
+    where, params = _where(scope, *extra)
+    cur = conn.execute(
+        f"SELECT day, SUM(created), SUM(completed) FROM task_daily{where} "
+        "GROUP BY day HAVING SUM(created) > 0 OR SUM(completed) > 0 ORDER BY day", params
+    )
+    return [(epoch_to_date(r[0]), r[1], r[2]) for r in cur.fetchall()]
+
+
+def weekly_activity(days):
+    """Günlük satırları pazartesiden başlayan haftalara toplar (O(gün))."""
+    weeks = {}
+    for day, created, completed in days:
+        monday = date.fromordinal(day.toordinal() - day.weekday())
+        c, d = weeks.get(monday, (0, 0))
+        weeks[monday] = (c + created, d + completed)
+    return [(week, c, d) for week, (c, d) in sorted(weeks.items())]
@@ -0,0 +1,298 @@
+"""Toplu içe/dışa aktarma: CSV, JSON Lines ve Parquet.
+
+Dosyalar satır satır (Parquet'te parti parti) okunur, doğrulanır ve
+``executemany`` ile büyük işlemler halinde eklenir; dışa aktarma da imleçten
+``fetchmany`` ile akar. Böylece milyon satırlık dosyalarda bile bellek
+kullanımı parti boyutuyla sınırlı kalır. Sütun şeması ``tasks`` tablosuyla
+aynıdır; içe aktarmada ``id`` yok sayılır ve yeni kimlikler atanır. Dosyalarda
+tarihler ISO metni, öncelik etiket olarak yer alır (veritabanında tam sayı).
+"""
+
+import csv
+import io
+import json
+import os
+import sys
+from dataclasses import dataclass, field
+from datetime import date, datetime
+
+from .codec import (
+    PRIORITIES, date_to_epoch, datetime_to_epoch, decode_task, now_epoch, priority_rank,
+)
+from .queries import scope_where
+
+COLUMNS = (
+    "id", "title", "description", "deadline", "priority", "progress",
+    "is_completed", "created_at", "completed_at", "notified",
+)
+IMPORT_COLUMNS = COLUMNS[1:]
+FORMATS = ("csv", "jsonl", "parquet")
+
+_SUFFIXES = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl", ".parquet": "parquet"}
+_INSERT_SQL = (
+    f"INSERT INTO tasks ({','.join(IMPORT_COLUMNS)}) "
+    f"VALUES ({','.join('?' * len(IMPORT_COLUMNS))})"
+)
+# Bir listeye içe aktarırken sahip ve liste sabit parametre olarak eklenir
+_SCOPED_INSERT_SQL = (
+    f"INSERT INTO tasks ({','.join(IMPORT_COLUMNS)},owner_id,list_id) "
+    f"VALUES ({','.join('?' * len(IMPORT_COLUMNS))},?,?)"
+)
+
+
+class BulkImportError(ValueError):
+    """Geçersiz bir kayıt; ``line`` kaynak dosyadaki kayıt numarasıdır."""
+
+    def __init__(self, line, message):
+        super().__init__(f"Kayıt {line}: {message}")
+        self.line = line
+
+
+@dataclass
+class ImportResult:
+    inserted: int = 0
+    skipped: int = 0
+    errors: list = field(default_factory=list)  # İlk 100 hata mesajı
+
+
+def detect_format(name):
+    """Dosya uzantısından biçimi bulur."""
+    fmt = _SUFFIXES.get(os.path.splitext(str(name))[1].lower())
+    if fmt is None:
+        raise ValueError(f"Biçim anlaşılamadı: {name!r} (desteklenen: {', '.join(FORMATS)})")
+    return fmt
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise RuntimeError("Parquet desteği için pyarrow gerekli: pip install pyarrow") from e
+    return pyarrow
+
+
+# ============================================================
+# DOĞRULAMA
+# ============================================================
+
+def _blank(value):
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+def _parse_deadline(value):
+    if _blank(value):
+        return None
+    if isinstance(value, (date, datetime)):
+        return date_to_epoch(value)
+    text = str(value).strip()
+    try:
+        return date_to_epoch(datetime.fromisoformat(text))
+    except ValueError:
+        return date_to_epoch(date.fromisoformat(text[:10]))
+
+
+def _parse_timestamp(value):
+    if _blank(value):
+        return None
+    if isinstance(value, datetime):
+        return datetime_to_epoch(value)
+    return datetime_to_epoch(str(value).strip())
+
+
+def _parse_flag(value):
+    if _blank(value):
+        return 0
+    if isinstance(value, str):
+        text = value.strip().lower()
+        if text in ("1", "true", "yes", "evet"):
+            return 1
+        if text in ("0", "false", "no", "hayır"):
+            return 0
+        raise ValueError(f"0/1 bekleniyordu: {value!r}")
+    return 1 if int(value) else 0
+
+
+def validate_record(record, line=0, now=None):
+    """Bir kaydı doğrular ve ``IMPORT_COLUMNS`` sırasında sütun değerleri döndürür."""
+    title = record.get("title")
+    if _blank(title):
+        raise BulkImportError(line, "title boş olamaz")
+
+    priority = record.get("priority")
+    priority = "Low" if _blank(priority) else str(priority).strip()
+    if priority not in PRIORITIES:
+        raise BulkImportError(line, f"geçersiz priority {priority!r} (beklenen: {', '.join(PRIORITIES)})")
+
+    try:
+        progress = 0 if _blank(record.get("progress")) else int(float(record["progress"]))
+    except (TypeError, ValueError):
+        raise BulkImportError(line, f"progress sayı olmalı: {record.get('progress')!r}")
+    if not 0 <= progress <= 100:
+        raise BulkImportError(line, f"progress 0-100 aralığında olmalı: {progress}")
+
+    try:
+        deadline = _parse_deadline(record.get("deadline"))
+        is_completed = _parse_flag(record.get("is_completed"))
+        notified = _parse_flag(record.get("notified"))
+        created_at = _parse_timestamp(record.get("created_at")) or now or now_epoch()
+        completed_at = _parse_timestamp(record.get("completed_at"))
+    except (TypeError, ValueError) as e:
+        raise BulkImportError(line, str(e))
+
+    # CSV NULL ile boş metni ayırt edemez (dışa aktarmada ikisi de ""); boş açıklama
+    # NULL sayılır, böylece dışa/içe aktarma döngüsü açıklamasız görevleri korur
+    description = record.get("description")
+    description = None if description is None or description == "" else str(description)
+
+    return (str(title).strip(), description, deadline, priority_rank(priority), progress,
+            is_completed, created_at, completed_at, notified)
+
+
+# ============================================================
+# OKUMA / YAZMA
+# ============================================================
+
+def _text_stream(source, mode):
+    """Yol, metin ya da ikili dosya nesnesini metin akışına çevirir."""
+    if isinstance(source, (str, os.PathLike)):
+        if str(source) == "-":
+            return (sys.stdin if "r" in mode else sys.stdout), False
+        return open(source, mode, newline="", encoding="utf-8-sig" if "r" in mode else "utf-8"), True
+    if isinstance(source, io.TextIOBase):
+        return source, False
+    encoding = "utf-8-sig" if "r" in mode else "utf-8"
+    return io.TextIOWrapper(source, encoding=encoding, newline="", write_through=True), False
+
+
+def iter_records(source, fmt, batch_size=5000):
+    """Kaynaktaki kayıtları ``(kayıt_no, dict)`` olarak akıtır."""
+    if fmt == "parquet":
+        pq = _require_pyarrow().parquet
+        line = 0
+        for batch in pq.ParquetFile(source).iter_batches(batch_size=batch_size):
+            for record in batch.to_pylist():
+                line += 1
+                yield line, record
+        return
+
+    stream, owned = _text_stream(source, "r")
+    try:
+        if fmt == "csv":
+            for line, record in enumerate(csv.DictReader(stream), start=1):
+                yield line, record
+        elif fmt == "jsonl":
+            for line, text in enumerate(stream, start=1):
+                if not text.strip():
+                    continue
+                try:
+                    record = json.loads(text)
+                except json.JSONDecodeError as e:
+                    raise BulkImportError(line, f"geçersiz JSON: {e}")
+                if not isinstance(record, dict):
+                    raise BulkImportError(line, "her satır bir JSON nesnesi olmalı")
+                yield line, record
+        else:
+            raise ValueError(f"Bilinmeyen biçim: {fmt!r}")
+    finally:
+        if owned:
+            stream.close()
+        elif isinstance(stream, io.TextIOWrapper) and stream is not sys.stdin:
+            stream.detach()
+
+
+def import_tasks(pool, source, fmt=None, batch_size=5000, skip_invalid=False, scope=None):
+    """Kayıtları doğrulayıp ``batch_size``'lık işlemlerle ekler.
+
+    ``skip_invalid`` kapalıyken ilk geçersiz kayıtta ``BulkImportError``
+    fırlatılır; o ana kadar işlenen partiler kalıcıdır. ``scope`` verilirse
+    görevler o kullanıcının o listesine eklenir (aksi halde varsayılan liste).
+    """
+    fmt = fmt or detect_format(getattr(source, "name", source))
+    now = now_epoch()
+    result = ImportResult()
+    batch = []
+
+    sql, extra = _INSERT_SQL, ()
+    if scope is not None:
+        with pool.read() as conn:
+            found = conn.execute(
+                "SELECT 1 FROM lists WHERE id = ? AND owner_id = ?", (scope.list_id, scope.owner_id)
+            ).fetchone()
+        if not found:
+            raise ValueError(f"Liste bulunamadı: {scope.list_id}")
+        sql, extra = _SCOPED_INSERT_SQL, (scope.owner_id, scope.list_id)
+
+    def flush():
+        with pool.write() as conn:
+            conn.executemany(sql, [row + extra for row in batch] if extra else batch)
+        result.inserted += len(batch)
+        batch.clear()
+
+    for line, record in iter_records(source, fmt, batch_size=batch_size):
+        try:
+            batch.append(validate_record(record, line, now=now))
+        except BulkImportError as e:
+            if not skip_invalid:
+                raise
+            result.skipped += 1
+            if len(result.errors) < 100:
+                result.errors.append(str(e))
+            continue
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
+    return result
+
+
+def export_tasks(pool, dest, fmt, batch_size=5000, scope=None):
+    """Görevleri (``scope`` verilirse yalnızca o bölümü) ``id`` sırasıyla ``dest``'e yazar.
+
+    Yazılan satır sayısını döndürür.
+    """
+    written = 0
+    clauses, params = scope_where(scope)
+    where = " WHERE " + " AND ".join(clauses) if clauses else ""
+    with pool.read() as conn:
+        cur = conn.execute(f"SELECT {','.join(COLUMNS)} FROM tasks{where} ORDER BY id", params)
+
+        def fetch():
+            return [tuple(decode_task(r).values()) for r in cur.fetchmany(batch_size)]
+
+        if fmt == "parquet":
+            pa = _require_pyarrow()
+            schema = pa.schema([
+                (name, pa.int64() if name in ("id", "progress", "is_completed", "notified") else pa.string())
+                for name in COLUMNS
+            ])
+            with pa.parquet.ParquetWriter(dest, schema) as writer:
+                while rows := fetch():
+                    columns = list(zip(*rows))
+                    writer.write_batch(pa.record_batch([list(c) for c in columns], schema=schema))
+                    written += len(rows)
+            return written
+
+        stream, owned = _text_stream(dest, "w")
+        try:
+            if fmt == "csv":
+                out = csv.writer(stream)
+                out.writerow(COLUMNS)
+                while rows := fetch():
+                    out.writerows(tuple(r) for r in rows)
+                    written += len(rows)
+            elif fmt == "jsonl":
+                while rows := fetch():
+                    stream.writelines(
+                        json.dumps(dict(zip(COLUMNS, r)), ensure_ascii=False) + "\n" for r in rows
+                    )
+                    written += len(rows)
+            else:
+                raise ValueError(f"Bilinmeyen biçim: {fmt!r}")
+            stream.flush()
+        finally:
+            if owned:
+                stream.close()
+            elif isinstance(stream, io.TextIOWrapper) and stream is not sys.stdout:
+                stream.detach()
+    return written
@@ -0,0 +1,85 @@
+"""Sorgu sonuçları için sürüm anahtarlı LRU önbellek.
+
+Her kayıt, sorgu adı + parametreler + veri sürümü ile anahtarlanır. Veri sürümü
+iki parçadan oluşur: yazma yardımcılarının her işlemde artırdığı süreç içi
+sayaç ve (verildiyse) ``PRAGMA data_version`` gibi başka süreçlerin yazmalarını
+yakalayan bir yoklama fonksiyonu. Yazma olmadıkça aynı anahtar tekrar üretilir
+ve sorgu veritabanına hiç gitmez; eski sürüme ait kayıtlar LRU ile düşer.
+"""
+
+import threading
+from collections import OrderedDict
+
+
+class ResultCache:
+    """İş parçacığı güvenli, kayıt ve satır sınırlı LRU sonuç önbelleği.
+
+    Dönen değerler oturumlar arasında paylaşılır; çağıranlar değiştirmemelidir.
+    """
+
+    def __init__(self, max_entries=256, max_rows=50_000, version_probe=None):
+        self.max_entries = max_entries
+        self.max_rows = max_rows
+        self._probe = version_probe
+        self._entries = OrderedDict()
+        self._rows = 0
+        self._local_version = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def version(self):
+        """Geçerli veri sürümü: (süreç içi yazma sayacı, dış sürüm)."""
+        external = self._probe() if self._probe else None
+        return (self._local_version, external)
+
+    def bump(self):
+        """Bir yazma işleminden sonra çağrılır; önceki tüm kayıtlar bayatlar."""
+        with self._lock:
+            self._local_version += 1
+
+    def get_or_compute(self, name, key, compute):
+        """Önbellekte varsa döndürür, yoksa ``compute()`` sonucunu saklar."""
+        full_key = (name, key, self.version)
+        with self._lock:
+            if full_key in self._entries:
+                self._entries.move_to_end(full_key)
+                self.hits += 1
+                return self._entries[full_key][0]
+            self.misses += 1
+
+        value = compute()
+        weight = len(value) if isinstance(value, (list, tuple)) else 1
+
+        with self._lock:
+            if full_key not in self._entries and weight <= self.max_rows:
+                self._entries[full_key] = (value, weight)
+                self._rows += weight
+                self._evict()
+        return value
+
+    def _evict(self):
+        while self._entries and (len(self._entries) > self.max_entries or self._rows > self.max_rows):
+            _, (_, weight) = self._entries.popitem(last=False)
+            self._rows -= weight
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._rows = 0
+
+    def stats(self):
+        """İsabet/ıskalama sayaçları ve doluluk bilgisi."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "rows": self._rows,
+            }
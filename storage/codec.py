@@ -0,0 +1,99 @@
+"""Veritabanı ile uygulama arasındaki değer dönüşümleri.
+
+Şema 2'den itibaren tarih/zamanlar tam sayı epoch saniyesi (UTC), öncelik ise
+tam sayı sıra değeri olarak saklanır. Uygulama ve dış biçimler (CSV/JSON)
+ise ISO metinleri ve "Low"/"Medium"/"High" etiketleriyle çalışmaya devam eder.
+"""
+
+import calendar
+from datetime import date, datetime, timedelta, timezone
+
+# Sıra değeri = demetteki konum; ``priority DESC`` böylece önem sırasıdır
+PRIORITIES = ("Low", "Medium", "High")
+PRIORITY_RANK = {label: rank for rank, label in enumerate(PRIORITIES)}
+
+DAY = 86400
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def priority_rank(label):
+    """"High" → 2; bilinmeyen etiket ``ValueError`` fırlatır."""
+    try:
+        return PRIORITY_RANK[label]
+    except KeyError:
+        raise ValueError(f"Geçersiz öncelik: {label!r}") from None
+
+
+def priority_label(rank):
+    return PRIORITIES[rank] if rank is not None else None
+
+
+def date_to_epoch(value):
+    """Tarihi (date, datetime ya da ISO metni) o günün UTC gece yarısı epoch'una çevirir."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.strip()) if len(value.strip()) > 10 else date.fromisoformat(value.strip())
+    if isinstance(value, datetime):
+        value = value.date()
+    return calendar.timegm(value.timetuple())
+
+
+def epoch_to_date(ts):
+    if ts is None:
+        return None
+    return (_EPOCH + timedelta(seconds=ts)).date()
+
+
+def datetime_to_epoch(value):
+    """Saf (naive) değerler UTC kabul edilir; ISO metni de kabul edilir."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.strip())
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return calendar.timegm(value.timetuple())
+
+
+def epoch_to_iso(ts):
+    if ts is None:
+        return None
+    return (_EPOCH + timedelta(seconds=ts)).isoformat()
+
+
+def now_epoch():
+    return calendar.timegm(datetime.utcnow().timetuple())
+
+
+def utc_today():
+    """``task_daily`` kovalarıyla aynı gün sınırı: şu anın UTC tarihi."""
+    return epoch_to_date(now_epoch())
+
+
+def decode_task(row):
+    """Bir ``tasks`` satırını uygulamanın kullandığı sözlüğe çevirir."""
+    task = dict(row)
+    if "deadline" in task:
+        d = epoch_to_date(task["deadline"])
+        task["deadline"] = d.isoformat() if d else None
+    if "priority" in task:
+        task["priority"] = priority_label(task["priority"])
+    for key in ("created_at", "completed_at"):
+        if key in task:
+            task[key] = epoch_to_iso(task[key])
+    return task
+
+
+def encode_fields(fields):
+    """Güncellenecek alanları (uygulama değerleri) sütun değerlerine çevirir."""
+    encoded = dict(fields)
+    if "deadline" in encoded:
+        encoded["deadline"] = date_to_epoch(encoded["deadline"])
+    if "priority" in encoded:
+        encoded["priority"] = priority_rank(encoded["priority"])
+    for key in ("created_at", "completed_at"):
+        if key in encoded:
+            encoded[key] = datetime_to_epoch(encoded[key])
+    return encoded
@@ -0,0 +1,166 @@
+"""SQLite bağlantı havuzu: eşzamanlı okuyucular, tek ve sıralı yazıcı.
+
+Streamlit her oturumu (ve her yeniden çalıştırmayı) ayrı bir iş parçacığında
+yürütür. Tek bir paylaşılan bağlantı yerine okuma için havuzdan alınan
+bağlantılar, yazma için kilitle korunan tek bir bağlantı kullanılır. WAL
+modunda okuyucular yazıcıyı, yazıcı da okuyucuları bekletmez.
+"""
+
+import logging
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from .metrics import instrumented_factory
+
+log = logging.getLogger(__name__)
+
+# Not: Colab/Drive yolu kontrolü yerinde bırakılmıştır. TODO_DB_PATH ile ezilebilir.
+_COLAB_DIR = "/content/drive/MyDrive/Colab Notebooks/to-do-list"
+DB_PATH = os.environ.get("TODO_DB_PATH") or (
+    os.path.join(_COLAB_DIR, "tasks.db") if os.path.exists(_COLAB_DIR) else "tasks.db"
+)
+
+
+class ConnectionPool:
+    """Okuyucu bağlantı havuzu + tek yazıcı bağlantısı.
+
+    ``read()`` havuzdan bir bağlantı ödünç verir (en fazla ``max_readers``
+    eşzamanlı). ``write()`` yazıcı kilidini alır, ``BEGIN IMMEDIATE`` ile
+    işlem açar ve blok sonunda tek bir ``COMMIT`` yapar.
+    """
+
+    def __init__(self, path=DB_PATH, max_readers=8, busy_timeout=5.0,
+                 cache_size_kib=16384, mmap_size=128 * 1024 * 1024, metrics=None):
+        self.path = path
+        # Verilirse her SQL ifadesinin süresi ve satır sayısı kaydedilir
+        self._factory = instrumented_factory(metrics) if metrics is not None else sqlite3.Connection
+        self.busy_timeout = busy_timeout
+        self.cache_size_kib = cache_size_kib
+        self.mmap_size = mmap_size
+
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_readers)
+        self._write_lock = threading.RLock()
+        self._write_depth = 0  # İç içe write() sayısı (yalnızca kilit sahibi değiştirir)
+        self._write_version = 0
+
+        self._writer = self._connect()
+        if self._writer.execute("PRAGMA page_count").fetchone()[0] == 0:
+            # Yeni dosya baştan artımlı boşaltmayla oluşturulur (WAL'dan önce
+            # ayarlanmalı); mevcut dosyalar ``compact(convert=True)`` ile dönüşür
+            self._writer.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        mode = self._writer.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+        if mode.lower() != "wal":
+            # Ör. bazı ağ/FUSE dosya sistemleri paylaşımlı belleği desteklemez
+            log.warning("WAL modu etkinleştirilemedi, %s ile devam ediliyor", mode)
+
+        # data_version bağlantıya özgüdür; sabit bir izleyici bağlantıdan okunur
+        self._watcher = self._connect()
+        self._watch_lock = threading.Lock()
+
+    def _connect(self):
+        conn = sqlite3.connect(
+            self.path,
+            timeout=self.busy_timeout,
+            check_same_thread=False,
+            isolation_level=None,  # İşlemler write() içinde elle yönetilir
+            factory=self._factory,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout * 1000)}")
+        conn.execute("PRAGMA synchronous=NORMAL")  # WAL ile güvenli
+        conn.execute(f"PRAGMA cache_size=-{int(self.cache_size_kib)}")
+        conn.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+
+    @contextmanager
+    def read(self):
+        """Okuma için havuzdan bir bağlantı ödünç verir."""
+        self._slots.acquire()
+        try:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._connect()
+            try:
+                yield conn
+            finally:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                self._idle.put(conn)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def write(self):
+        """Tek işlemlik yazma bloğu; iç içe çağrılar dıştaki işleme katılır."""
+        with self._write_lock:
+            conn = self._writer
+            if self._write_depth:
+                self._write_depth += 1
+                try:
+                    yield conn
+                finally:
+                    self._write_depth -= 1
+                return
+            # Derinlik in_transaction'a bakılarak değil açıkça izlenir: başarısız bir
+            # COMMIT'ten kalan açık işleme sonraki yazmalar sessizce katılmamalı
+            conn.execute("BEGIN IMMEDIATE")
+            self._write_depth = 1
+            try:
+                try:
+                    yield conn
+                except BaseException:
+                    self._rollback(conn)
+                    raise
+                try:
+                    conn.execute("COMMIT")
+                except BaseException:
+                    # Ör. SQLITE_BUSY ya da disk hatası: işlem açık kalmasın
+                    self._rollback(conn)
+                    raise
+            finally:
+                self._write_depth = 0
+            self._write_version += 1
+
+    @staticmethod
+    def _rollback(conn):
+        # Bazı hatalarda SQLite işlemi kendisi geri alır
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+
+    @contextmanager
+    def write_lock(self):
+        """Yazma kilidini alıp yazıcı bağlantısını işlem açmadan verir.
+
+        İşlem içinde çalışamayan komutlar içindir (``VACUUM``,
+        ``wal_checkpoint``); uygulamanın yazmaları bu sürede bekler, okuyucular
+        beklemez.
+        """
+        with self._write_lock:
+            yield self._writer
+
+    def data_version(self):
+        """``PRAGMA data_version``: başka bir bağlantı yazdığında değişir."""
+        with self._watch_lock:
+            return self._watcher.execute("PRAGMA data_version").fetchone()[0]
+
+    @property
+    def version(self):
+        """Önbellek anahtarları için veri sürümü (bu havuzun yazmaları, dış sürüm)."""
+        return (self._write_version, self.data_version())
+
+    def close(self):
+        with self._write_lock:
+            self._writer.close()
+        with self._watch_lock:
+            self._watcher.close()
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
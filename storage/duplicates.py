@@ -0,0 +1,134 @@
+"""Yeni görev eklenirken benzer (olası mükerrer) açık görevleri bulur.
+
+Açık görevlerin başlıkları ``task_titles`` FTS5 tablosunda trigram olarak
+indekslenir ve tetikleyicilerle güncel tutulur (bkz.
+``migrations.TITLE_INDEX_TRIGGERS``). Arama iki adımlıdır:
+
+1. Aday üretimi: başlığın trigramlarından en seyrek olanları seçilir (önek
+   filtresi). Jaccard benzerliği ``threshold`` üstündeki her başlık bu
+   trigramlardan en az birini içerir, bu yüzden yalnızca onların eşleşmeleri
+   okunur; yaygın trigramların (" bi", "ir ") uzun listelerine hiç girilmez.
+   Seyreklik kapsam içinde ölçülür. Eşleşen başlık sayısı ``CANDIDATES``'ı
+   aşarsa adaylar eşleştirdikleri seyrek trigram sayısına göre kademe kademe
+   alınır (önce hepsini içerenler); eski bir birebir kopya daha yeni kısmi
+   eşleşmelerin arkasında kalmaz.
+2. Sıralama: adaylar trigram kümelerinin Jaccard benzerliğiyle puanlanır.
+
+Böylece maliyet tablo boyutuna değil, aday sayısına bağlıdır; hiçbir zaman
+tüm satırlarla ikili karşılaştırma yapılmaz.
+"""
+
+import itertools
+import math
+from dataclasses import dataclass
+
+# Sıralanacak en fazla aday
+CANDIDATES = 100
+# Bir trigramın seyrekliği ölçülürken sayılacak en fazla eşleşme; bundan
+# yaygın trigramlar eşit sayılır (zaten önek filtresine girmezler)
+PROBE_LIMIT = 50
+# Kademeli aday seçiminde bir sorgudaki en fazla trigram grubu; daha çok
+# grup gerektiren ara kademeler atlanır
+MAX_GROUPS = 64
+
+_CANDIDATE_QUERY = "SELECT rowid, title FROM task_titles WHERE task_titles MATCH ? ORDER BY rowid DESC LIMIT ?"
+
+
+@dataclass(frozen=True)
+class SimilarTask:
+    id: int
+    title: str
+    score: float  # Jaccard benzerliği (0..1)
+
+
+def _normalize(text):
+    # FTS5 trigram tokenizer'ı gibi küçük harfe çevirir; "İ" tek karakter kalmalı
+    return " ".join((text or "").replace("İ", "I").lower().split())
+
+
+def title_trigrams(text):
+    """Başlığın trigram kümesi (boşluklar dahil, büyük/küçük harf duyarsız)."""
+    text = _normalize(text)
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def jaccard(a, b):
+    return len(a & b) / len(a | b) if a or b else 0.0
+
+
+def _phrase(gram):
+    return '"' + gram.replace('"', '""') + '"'
+
+
+def _scope_match(scope):
+    if scope is None:
+        return ""
+    token = f"<o{int(scope.owner_id)}>"
+    if scope.list_id is not None:
+        token += f" <l{int(scope.list_id)}>"
+    return f"scope : {_phrase(token)} AND "
+
+
+def _probe_scope(scope):
+    # Seyreklik yoklamaları yalnızca trigramları sıralar, sonuç döndürmez;
+    # tek belirteç (liste kimliği sahibi de belirler) ifadeyi ucuzlatır
+    if scope is None:
+        return ""
+    token = f"<l{int(scope.list_id)}>" if scope.list_id is not None else f"<o{int(scope.owner_id)}>"
+    return f"scope : {_phrase(token)} AND "
+
+
+def _any_of(scoped, groups):
+    """Gruplardan en az birinin tüm trigramlarını içeren başlıklar için MATCH ifadesi."""
+    return scoped + "title : (" + " OR ".join(
+        "(" + " AND ".join(_phrase(g) for g in group) + ")" for group in groups
+    ) + ")"
+
+
+def _ranked_candidates(conn, scoped, rare):
+    """En çok seyrek trigram eşleştiren ``CANDIDATES`` aday (eşitlikte en yeni önce)."""
+    found = {}
+    for need in range(len(rare), 0, -1):
+        groups = list(itertools.combinations(rare, need))
+        if len(groups) > MAX_GROUPS and need > 1:
+            continue
+        # Önceki kademelerin satırları da döner; sınır onları da sayar
+        for rowid, title in conn.execute(_CANDIDATE_QUERY, (_any_of(scoped, groups), CANDIDATES + len(found))):
+            found.setdefault(rowid, title)
+        if len(found) >= CANDIDATES:
+            break
+    return list(found.items())[:CANDIDATES]
+
+
+def similar_tasks(pool, title, scope=None, limit=5, threshold=0.5):
+    """``title``'a benzeyen açık görevler, en benzerden başlayarak: [SimilarTask, ...].
+
+    ``scope`` verilirse yalnızca o sahip/listenin görevleri aranır. Üç
+    karakterden kısa başlıklar için arama yapılmaz.
+    """
+    grams = title_trigrams(title)
+    if not grams:
+        return []
+    # Önek filtresi: J(A, B) >= t ise B, A'nın en seyrek n - ceil(t * n) + 1 trigramından birini içerir
+    prefix = len(grams) - math.ceil(threshold * len(grams)) + 1
+    with pool.read() as conn:
+        probe = _probe_scope(scope)
+        frequency = {
+            gram: conn.execute(
+                "SELECT COUNT(*) FROM (SELECT 1 FROM task_titles WHERE task_titles MATCH ? LIMIT ?)",
+                (f"{probe}title : {_phrase(gram)}", PROBE_LIMIT),
+            ).fetchone()[0]
+            for gram in grams
+        }
+        rare = [g for g in sorted(grams, key=lambda g: (frequency[g], g))[:prefix] if frequency[g]]
+        if not rare:
+            return []
+        scoped = _scope_match(scope)
+        rows = conn.execute(_CANDIDATE_QUERY, (_any_of(scoped, [(g,) for g in rare]), CANDIDATES + 1)).fetchall()
+        if len(rows) > CANDIDATES:
+            rows = _ranked_candidates(conn, scoped, rare)
+
+    scored = [SimilarTask(r[0], r[1], jaccard(grams, title_trigrams(r[1]))) for r in rows]
+    scored = [s for s in scored if s.score >= threshold]
+    scored.sort(key=lambda s: (-s.score, -s.id))
+    return scored[:limit]
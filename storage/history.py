@@ -0,0 +1,242 @@
+"""Görev değişiklik geçmişi: olaylar, geri alma, geri yükleme ve sıkıştırma.
+
+``task_events`` yalnızca eklenen bir tablodur; ``tasks`` üzerindeki
+tetikleyicilerle değişikliğin kendisiyle aynı işlemde yazılır (bkz.
+``migrations.AUDIT_TRIGGERS``), bu yüzden hiçbir yazma yolu atlanamaz.
+Ekleme ve silme olayları tam satırı, güncellemeler yalnızca değişen alanları
+``{"alan": [eski, yeni]}`` olarak tutar. Değerler veritabanı biçimindedir
+(epoch saniyesi, öncelik sırası); bu modülün döndürdükleri uygulama
+biçimindedir.
+
+Geri alma ve geri yükleme de birer değişikliktir ve geçmişe yeni olay olarak
+yazılır. ``compact_history`` eski güncellemeleri görev ve gün başına tek olaya
+katlar, uzun süre önce silinmiş görevlerin olaylarını atar.
+"""
+
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from itertools import groupby
+
+from .codec import DAY, decode_task, epoch_to_iso, now_epoch
+from .migrations import AUDIT_COLUMNS
+from .queries import scope_where
+
+INSERT = "insert"
+UPDATE = "update"
+DELETE = "delete"
+
+
+@dataclass(frozen=True)
+class TaskEvent:
+    id: int
+    task_id: int
+    at: str  # ISO zaman (UTC)
+    kind: str  # INSERT, UPDATE ya da DELETE
+    data: dict  # Ekleme/silme: tam satır; güncelleme: {alan: (eski, yeni)}
+
+
+def _decode_event(row):
+    data = json.loads(row["data"])
+    if row["kind"] == UPDATE:
+        old = decode_task({k: v[0] for k, v in data.items()})
+        new = decode_task({k: v[1] for k, v in data.items()})
+        data = {k: (old[k], new[k]) for k in data}
+    else:
+        data = decode_task(data)
+    return TaskEvent(row["id"], row["task_id"], epoch_to_iso(row["at"]), row["kind"], data)
+
+
+def _scope_sql(scope):
+    clauses, params = scope_where(scope)
+    return "".join(f" AND {c}" for c in clauses), params
+
+
+def _visible(conn, task_id, scope):
+    """Görev bölümde mi: canlı satıra, silinmişse son silme olayına bakılır."""
+    if scope is None:
+        return True
+    condition, params = _scope_sql(scope)
+    if conn.execute(f"SELECT 1 FROM tasks WHERE id = ?{condition}", [task_id, *params]).fetchone():
+        return True
+    row = conn.execute(
+        "SELECT data FROM task_events WHERE task_id = ? AND kind = 'delete' ORDER BY id DESC LIMIT 1", (task_id,)
+    ).fetchone()
+    if row is None:
+        return False
+    data = json.loads(row["data"])
+    return data["owner_id"] == scope.owner_id and scope.list_id in (None, data["list_id"])
+
+
+def task_history(pool, task_id, scope=None, limit=None):
+    """Görevin olayları, eskiden yeniye (``limit`` verilirse en yeni ``limit`` olay)."""
+    with pool.read() as conn:
+        if not _visible(conn, task_id, scope):
+            return []
+        sql = "SELECT * FROM task_events WHERE task_id = ? ORDER BY id DESC"
+        params = [task_id]
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        rows = conn.execute(sql, params).fetchall()
+    return [_decode_event(r) for r in reversed(rows)]
+
+
+def progress_history(pool, task_id, scope=None):
+    """İlerlemenin zaman içindeki değerleri: [(datetime, ilerleme), ...] (UTC, saat dilimli).
+
+    Görev hâlâ duruyorsa son nokta şimdiki zamandır; böylece son değerde
+    geçen süre de hesaba katılır.
+    """
+    with pool.read() as conn:
+        if not _visible(conn, task_id, scope):
+            return []
+        rows = conn.execute(
+            "SELECT at, kind, data FROM task_events WHERE task_id = ? ORDER BY id", (task_id,)
+        ).fetchall()
+        current = conn.execute("SELECT created_at, progress FROM tasks WHERE id = ?", (task_id,)).fetchone()
+
+    points = []
+    for row in rows:
+        data = json.loads(row["data"])
+        if row["kind"] == UPDATE:
+            if "progress" not in data:
+                continue
+            old, new = data["progress"]
+            if not points:
+                # Geçmiş bu güncellemeden önce başlamış: eski değer oluşturulmadan beri geçerliydi
+                start = current["created_at"] if current and current["created_at"] else row["at"]
+                points.append((start, old))
+            points.append((row["at"], new))
+        else:
+            points.append((row["at"], data["progress"]))
+    if current is not None:
+        if not points:
+            points.append((current["created_at"] or now_epoch(), current["progress"]))
+        points.append((max(now_epoch(), points[-1][0]), current["progress"]))
+    return [(datetime.fromtimestamp(at, timezone.utc), progress) for at, progress in points]
+
+
+def time_at_progress(points):
+    """``progress_history`` noktalarından her ilerleme değerinde geçen süre (sn)."""
+    totals = {}
+    for (at, progress), (next_at, _) in zip(points, points[1:]):
+        totals[progress] = totals.get(progress, 0) + (next_at - at).total_seconds()
+    return totals
+
+
+def undo_last_change(pool, task_id, scope=None):
+    """Görevin son güncellemesini geri alır; geri yüklenen alanlar ya da ``None``.
+
+    Geri alma da bir güncellemedir; art arda iki kez çağrılırsa değişikliği
+    yineler. Son olay bir güncelleme değilse (ör. yeni eklenmiş görev) bir şey
+    yapılmaz.
+    """
+    condition, params = _scope_sql(scope)
+    with pool.write() as conn:
+        if not conn.execute(f"SELECT 1 FROM tasks WHERE id = ?{condition}", [task_id, *params]).fetchone():
+            return None
+        row = conn.execute(
+            "SELECT kind, data FROM task_events WHERE task_id = ? ORDER BY id DESC LIMIT 1", (task_id,)
+        ).fetchone()
+        if row is None or row["kind"] != UPDATE:
+            return None
+        previous = {k: v[0] for k, v in json.loads(row["data"]).items()}
+        assignments = ", ".join(f"{k} = ?" for k in previous)
+        conn.execute(f"UPDATE tasks SET {assignments} WHERE id = ?", [*previous.values(), task_id])
+    return decode_task(previous)
+
+
+def deleted_tasks(pool, scope=None, limit=10):
+    """Geri yüklenebilir (silinmiş ve yeniden eklenmemiş) görevlerin son silme olayları."""
+    clauses, params = ["kind = 'delete'"], []
+    if scope is not None:
+        clauses.append("owner_id = ?")
+        params.append(scope.owner_id)
+        if scope.list_id is not None:
+            clauses.append("json_extract(data, '$.list_id') = ?")
+            params.append(scope.list_id)
+    with pool.read() as conn:
+        rows = conn.execute(f"""
+            SELECT * FROM task_events AS e
+            WHERE {" AND ".join(clauses)}
+              AND NOT EXISTS (SELECT 1 FROM tasks WHERE id = e.task_id)
+              AND e.id = (SELECT MAX(id) FROM task_events WHERE task_id = e.task_id)
+            ORDER BY id DESC LIMIT ?
+        """, [*params, int(limit)]).fetchall()
+    return [_decode_event(r) for r in rows]
+
+
+def restore_task(pool, task_id, scope=None):
+    """Silinmiş görevi son hâliyle ve aynı kimlikle geri ekler; geri yüklenen görev.
+
+    Görev hâlâ duruyorsa, silme olayı yoksa ya da listesi artık yoksa ``ValueError``.
+    """
+    with pool.write() as conn:
+        if conn.execute("SELECT 1 FROM tasks WHERE id = ?", (task_id,)).fetchone():
+            raise ValueError(f"Görev #{task_id} zaten mevcut")
+        row = conn.execute(
+            "SELECT kind, data FROM task_events WHERE task_id = ? ORDER BY id DESC LIMIT 1", (task_id,)
+        ).fetchone()
+        if row is None or row["kind"] != DELETE:
+            raise ValueError(f"Görev #{task_id} için silme kaydı bulunamadı")
+        data = json.loads(row["data"])
+        if scope is not None and (data["owner_id"] != scope.owner_id or scope.list_id not in (None, data["list_id"])):
+            raise ValueError(f"Görev #{task_id} için silme kaydı bulunamadı")
+        if not conn.execute(
+            "SELECT 1 FROM lists WHERE id = ? AND owner_id = ?", (data["list_id"], data["owner_id"])
+        ).fetchone():
+            raise ValueError("Görevin listesi artık yok")
+        columns = ("id",) + AUDIT_COLUMNS
+        conn.execute(
+            f"INSERT INTO tasks ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+            [task_id, *(data[c] for c in AUDIT_COLUMNS)],
+        )
+    return decode_task({"id": task_id, **data, "notified": 0})
+
+
+def compact_history(pool, before, purge_deleted=True):
+    """``before`` (epoch) öncesindeki geçmişi sıkıştırır; (silinen, yazılan) olay sayıları.
+
+    Aynı görevin aynı gündeki güncellemeleri tek olaya katlanır (alan başına
+    ilk eski ve son yeni değer; sonunda değişmeyen alanlar düşer). Böylece
+    günlük ilerleme geçmişi korunur, satır sayısı gün sayısıyla sınırlanır.
+    ``purge_deleted`` ile tüm olayları ``before``'dan eski olan silinmiş
+    görevlerin geçmişi tamamen atılır (bu görevler artık geri yüklenemez).
+    """
+    removed = written = 0
+    with pool.write() as conn:
+        if purge_deleted:
+            removed += conn.execute("""
+                DELETE FROM task_events WHERE task_id IN (
+                    SELECT task_id FROM task_events GROUP BY task_id
+                    HAVING MAX(at) < ? AND task_id NOT IN (SELECT id FROM tasks)
+                )
+            """, (before,)).rowcount
+
+        rows = conn.execute(
+            "SELECT id, task_id, owner_id, at, data FROM task_events "
+            "WHERE kind = 'update' AND at < ? ORDER BY task_id, id", (before,)
+        ).fetchall()
+        stale, folded = [], []
+        for _, group in groupby(rows, key=lambda r: (r["task_id"], r["at"] // DAY)):
+            group = list(group)
+            if len(group) == 1:
+                continue
+            merged = {}
+            for row in group:
+                for field, (old, new) in json.loads(row["data"]).items():
+                    merged[field] = [merged[field][0] if field in merged else old, new]
+            merged = {k: v for k, v in merged.items() if v[0] != v[1]}
+            stale.extend((r["id"],) for r in group)
+            last = group[-1]
+            if merged:
+                folded.append((last["id"], last["task_id"], last["owner_id"], last["at"], UPDATE, json.dumps(merged, separators=(",", ":"))))
+        # Katlanan olay grubun son kimliğini alır; olay sırası korunur
+        conn.executemany("DELETE FROM task_events WHERE id = ?", stale)
+        conn.executemany(
+            "INSERT INTO task_events (id, task_id, owner_id, at, kind, data) VALUES (?, ?, ?, ?, ?, ?)", folded
+        )
+        removed += len(stale)
+        written += len(folded)
+    return removed, written
@@ -0,0 +1,169 @@
+"""Canlı veritabanı üzerinde bakım: yedek, sıkıştırma, istatistik, bütünlük.
+
+Hepsi uygulama çalışırken güvenle çalıştırılabilir. WAL modunda okuyucular
+hiçbir adımda beklemez; yazmalar yalnızca kısa yazma işlemleri boyunca
+(sıkıştırmada parça parça) bekler.
+
+- ``backup``: SQLite çevrimiçi yedekleme API'si ile tutarlı anlık görüntü.
+  Kaynakta açık tutulan okuma işlemi sayesinde kopya tek bir ana aittir;
+  kopyalama sırasında gelen yazmalar yedeği yeniden başlatmaz.
+- ``compact``: silmelerden kalan boş sayfaları ``incremental_vacuum`` ile
+  parça parça dosyadan atar. Yeni veritabanları ``auto_vacuum=INCREMENTAL``
+  ile oluşturulur; eski bir dosya yalnızca ``convert=True`` ile, bir kez tam
+  ``VACUUM`` yapılarak dönüştürülür (süresince yazmalar bekler).
+- ``analyze``: sorgu planlayıcısının istatistiklerini (``sqlite_stat1``) yeniler.
+- ``integrity_check``: sayfa/indeks bütünlüğü ve isteğe bağlı FTS tutarlılığı.
+- ``checkpoint``: WAL dosyasını ana dosyaya aktarır.
+"""
+
+import os
+import sqlite3
+import time
+
+# İsteğe bağlı FTS bütünlük denetiminin çalıştığı tablolar
+FTS_TABLES = ("tasks_fts", "task_titles")
+
+AUTO_VACUUM_MODES = {0: "none", 1: "full", 2: "incremental"}
+
+
+def database_stats(pool):
+    """Dosya boyutları ve sayfa sayıları (bakım öncesi/sonrası karşılaştırma için)."""
+    with pool.read() as conn:
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        freelist = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        auto_vacuum = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+    wal = pool.path + "-wal"
+    return {
+        "page_size": page_size,
+        "page_count": page_count,
+        "freelist_count": freelist,
+        "free_bytes": freelist * page_size,
+        "auto_vacuum": AUTO_VACUUM_MODES.get(auto_vacuum, auto_vacuum),
+        "file_bytes": os.path.getsize(pool.path) if os.path.exists(pool.path) else 0,
+        "wal_bytes": os.path.getsize(wal) if os.path.exists(wal) else 0,
+    }
+
+
+def backup(pool, dest, pages=1024, pause=0.0, progress=None):
+    """``dest`` dosyasına tutarlı bir anlık görüntü yazar; yazılan yol.
+
+    ``dest`` bir klasörse dosya adı zaman damgasıyla üretilir. Kopya önce
+    geçici bir dosyaya yazılır ve tamamlanınca yerine taşınır; yarım kalan
+    yedek eski yedeğin üzerine yazılmaz. Görüntü tek dosyadır (WAL'sız).
+    ``pages`` her adımda kopyalanan sayfa sayısı, ``pause`` adımlar arası
+    bekleme (sn); ``progress(kalan, toplam)`` her adımdan sonra çağrılır.
+    """
+    if os.path.isdir(dest):
+        stem = os.path.splitext(os.path.basename(pool.path))[0]
+        dest = os.path.join(dest, f"{stem}-{time.strftime('%Y%m%d-%H%M%S')}.db")
+    partial = dest + ".partial"
+    if os.path.exists(partial):
+        os.remove(partial)
+
+    target = sqlite3.connect(partial)
+    try:
+        with pool.read() as conn:
+            # Okuma işlemi açık kaldıkça kaynak bu anın görüntüsünü gösterir
+            conn.execute("BEGIN")
+            conn.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+            conn.backup(
+                target, pages=pages, sleep=pause,
+                progress=(lambda status, remaining, total: progress(remaining, total)) if progress else None,
+            )
+        target.execute("PRAGMA journal_mode=DELETE")
+        ok = target.execute("PRAGMA quick_check").fetchone()[0]
+    finally:
+        target.close()
+    if ok != "ok":
+        os.remove(partial)
+        raise sqlite3.DatabaseError(f"Yedek doğrulanamadı: {ok}")
+    os.replace(partial, dest)
+    return dest
+
+
+def compact(pool, max_pages=None, step=512, convert=False):
+    """Boş sayfaları dosyadan atar; (atılan sayfa, kalan boş sayfa).
+
+    Her adım ``step`` sayfalık ayrı bir yazma işlemidir; uygulamanın yazmaları
+    adımlar arasında araya girer. ``max_pages`` verilirse en fazla o kadar
+    sayfa atılır. ``auto_vacuum`` kapalı bir veritabanında hiçbir şey yapılmaz;
+    ``convert`` verilirse bir kez tam ``VACUUM`` ile dönüştürülür (süresince
+    yazmalar bekler, okumalar beklemez) ve küçülen sayfa sayısı döndürülür.
+    """
+    with pool.read() as conn:
+        mode = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+        before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    if AUTO_VACUUM_MODES.get(mode) != "incremental":
+        if not convert:
+            return 0, before
+        with pool.write_lock() as conn:
+            pages = conn.execute("PRAGMA page_count").fetchone()[0]
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.execute("VACUUM")
+            return (
+                pages - conn.execute("PRAGMA page_count").fetchone()[0],
+                conn.execute("PRAGMA freelist_count").fetchone()[0],
+            )
+
+    freed = 0
+    while max_pages is None or freed < max_pages:
+        n = step if max_pages is None else min(step, max_pages - freed)
+        with pool.write() as conn:
+            free = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            if free == 0:
+                break
+            conn.execute(f"PRAGMA incremental_vacuum({int(n)})").fetchall()
+            freed += free - conn.execute("PRAGMA freelist_count").fetchone()[0]
+    with pool.read() as conn:
+        return freed, conn.execute("PRAGMA freelist_count").fetchone()[0]
+
+
+def analyze(pool, analysis_limit=None):
+    """Planlayıcı istatistiklerini yeniler.
+
+    ``analysis_limit`` verilirse her indeksten yaklaşık o kadar satır
+    örneklenir; büyük tablolarda yazma kilidi kısa tutulur.
+    """
+    with pool.write() as conn:
+        if analysis_limit is not None:
+            conn.execute(f"PRAGMA analysis_limit = {int(analysis_limit)}")
+        conn.execute("ANALYZE")
+
+
+def integrity_check(pool, quick=False, fts=False):
+    """Bütünlük denetimi; sorun yoksa ``["ok"]``, varsa sorun iletileri.
+
+    ``quick`` indeks içeriklerini tablolarla karşılaştırmaz (çok daha hızlı).
+    ``fts`` tam metin indekslerinin görev tablosuyla tutarlılığını da denetler;
+    bu denetim bir yazma komutudur ve süresince uygulamanın yazmaları bekler.
+    """
+    with pool.read() as conn:
+        pragma = "quick_check" if quick else "integrity_check"
+        problems = [r[0] for r in conn.execute(f"PRAGMA {pragma}")]
+        tables = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    if problems == ["ok"]:
+        problems = []
+    if fts:
+        for table in FTS_TABLES:
+            if table not in tables:
+                continue
+            try:
+                with pool.write() as conn:
+                    # rank = 1: harici içerikli indeks, içerik tablosuyla da karşılaştırılır
+                    conn.execute(f"INSERT INTO {table} ({table}, rank) VALUES ('integrity-check', 1)")
+            except sqlite3.DatabaseError as e:
+                problems.append(f"{table}: {e}")
+    return problems or ["ok"]
+
+
+def checkpoint(pool, mode="PASSIVE"):
+    """WAL çerçevelerini ana dosyaya aktarır; (meşgul, WAL çerçevesi, aktarılan).
+
+    ``PASSIVE`` okuyucuları ve yazıcıyı beklemez; ``TRUNCATE`` okuyucuların
+    bitmesini bekleyip WAL dosyasını sıfırlar.
+    """
+    if mode.upper() not in ("PASSIVE", "FULL", "RESTART", "TRUNCATE"):
+        raise ValueError(f"Geçersiz checkpoint modu: {mode}")
+    with pool.write_lock() as conn:
+        return tuple(conn.execute(f"PRAGMA wal_checkpoint({mode.upper()})").fetchone())
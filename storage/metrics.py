@@ -0,0 +1,256 @@
+"""Süre ve sorgu ölçümleri (profil çıkarmadan üretimde izleme için).
+
+- ``Metrics``: süreç genelinde bölüm süreleri, SQL ifadesi başına süre/satır
+  sayısı ve sayaçlar. Prometheus metin biçiminde ya da JSON olarak dışa verilir.
+- ``RerunProfile``: tek bir yeniden çalıştırmanın bölüm dökümü; ``lap()`` bir
+  önceki işaretten bu yana geçen süreyi verilen bölüme yazar.
+- ``InstrumentedConnection``: ``ConnectionPool``'a verildiğinde her ifadenin
+  çalıştırma + okuma süresini ve döndürdüğü satır sayısını kaydeder.
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+_IN_LIST = re.compile(r"\(\?(?:\s*,\s*\?)+\)")
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_sql(sql):
+    """Aynı ifadenin farklı uzunluktaki IN listelerini tek anahtarda toplar."""
+    return _IN_LIST.sub("(?, ...)", _SPACES.sub(" ", sql).strip())
+
+
+class _Stat:
+    __slots__ = ("count", "total", "max", "rows")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.rows = 0
+
+    def add(self, seconds, rows=0, calls=1):
+        self.count += calls
+        self.total += seconds
+        self.rows += rows
+        if seconds > self.max:
+            self.max = seconds
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "total_ms": round(self.total * 1000, 3),
+            "avg_ms": round(self.total * 1000 / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max * 1000, 3),
+            "rows": self.rows,
+        }
+
+
+class Metrics:
+    """İş parçacığı güvenli ölçüm kayıtları."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sections = {}
+        self._queries = {}
+        self._counters = {}
+
+    def record_section(self, name, seconds):
+        with self._lock:
+            self._sections.setdefault(name, _Stat()).add(seconds)
+
+    def record_query(self, sql, seconds, rows=0, calls=1):
+        key = normalize_sql(sql)
+        with self._lock:
+            self._queries.setdefault(key, _Stat()).add(seconds, rows, calls)
+
+    def incr(self, name, n=1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    @contextmanager
+    def section(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_section(name, time.perf_counter() - started)
+
+    def reset(self):
+        with self._lock:
+            self._sections.clear()
+            self._queries.clear()
+            self._counters.clear()
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "sections": {k: v.as_dict() for k, v in self._sections.items()},
+                "queries": {k: v.as_dict() for k, v in self._queries.items()},
+                "counters": dict(self._counters),
+            }
+
+    def to_json(self):
+        return json.dumps(self.snapshot(), ensure_ascii=False)
+
+    def to_prometheus(self, prefix="todo"):
+        """Prometheus metin biçimi (0.0.4)."""
+        snap = self.snapshot()
+        lines = []
+
+        def esc(value):
+            return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
+
+        lines.append(f"# TYPE {prefix}_section_seconds summary")
+        for name, s in snap["sections"].items():
+            lines.append(f'{prefix}_section_seconds_count{{section="{esc(name)}"}} {s["count"]}')
+            lines.append(f'{prefix}_section_seconds_sum{{section="{esc(name)}"}} {s["total_ms"] / 1000:.6f}')
+
+        lines.append(f"# TYPE {prefix}_query_seconds summary")
+        lines.append(f"# TYPE {prefix}_query_rows_total counter")
+        for sql, s in snap["queries"].items():
+            label = f'sql="{esc(sql[:200])}"'
+            lines.append(f"{prefix}_query_seconds_count{{{label}}} {s['count']}")
+            lines.append(f"{prefix}_query_seconds_sum{{{label}}} {s['total_ms'] / 1000:.6f}")
+            lines.append(f"{prefix}_query_rows_total{{{label}}} {s['rows']}")
+
+        for name, value in snap["counters"].items():
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            lines.append(f"{prefix}_{name}_total {value}")
+        return "\n".join(lines) + "\n"
+
+
+class RerunProfile:
+    """Tek bir yeniden çalıştırmanın bölüm süreleri (sıralı)."""
+
+    def __init__(self, metrics=None):
+        self.metrics = metrics
+        self.started = self._last = time.perf_counter()
+        self.sections = []  # [(ad, sn), ...]
+
+    def _add(self, name, seconds):
+        self.sections.append((name, seconds))
+        if self.metrics is not None:
+            self.metrics.record_section(name, seconds)
+
+    def lap(self, name):
+        """Son işaretten bu yana geçen süreyi ``name`` bölümüne yazar."""
+        now = time.perf_counter()
+        self._add(name, now - self._last)
+        self._last = now
+
+    @contextmanager
+    def section(self, name):
+        """İç içe ölçüm; turlardan bağımsızdır (ör. bir sorgu yardımcısı)."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._add(name, time.perf_counter() - started)
+
+    @property
+    def total(self):
+        return time.perf_counter() - self.started
+
+    def as_dict(self):
+        return {
+            "total_ms": round(self.total * 1000, 3),
+            "sections": [{"name": n, "ms": round(s * 1000, 3)} for n, s in self.sections],
+        }
+
+
+# ============================================================
+# SQLITE ENSTRÜMANTASYONU
+# ============================================================
+
+class InstrumentedCursor(sqlite3.Cursor):
+    """Çalıştırma ve okuma sürelerini, okunan satırları ``metrics``'e yazar."""
+
+    metrics = None
+
+    def execute(self, sql, parameters=()):
+        self._flush_iterated()
+        self._sql = sql
+        started = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            self.metrics.record_query(sql, time.perf_counter() - started, max(self.rowcount, 0))
+
+    def executemany(self, sql, seq_of_parameters):
+        self._flush_iterated()
+        self._sql = sql
+        started = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            self.metrics.record_query(sql, time.perf_counter() - started, max(self.rowcount, 0))
+
+    def _fetched(self, started, rows):
+        # Okuma süresi aynı ifadeye eklenir; çağrı sayısı artmaz
+        self.metrics.record_query(getattr(self, "_sql", "?"), time.perf_counter() - started, rows, calls=0)
+
+    def fetchone(self):
+        started = time.perf_counter()
+        row = super().fetchone()
+        self._fetched(started, 0 if row is None else 1)
+        return row
+
+    def fetchmany(self, size=None):
+        started = time.perf_counter()
+        rows = super().fetchmany(self.arraysize if size is None else size)
+        self._fetched(started, len(rows))
+        return rows
+
+    def fetchall(self):
+        started = time.perf_counter()
+        rows = super().fetchall()
+        self._fetched(started, len(rows))
+        return rows
+
+    def __next__(self):
+        # ``for r in conn.execute(...)`` ile okunan satırlar da sayılır. Satır
+        # başına kilit almamak için toplanır, imleç tükenince tek kayıt yazılır.
+        started = time.perf_counter()
+        try:
+            row = super().__next__()
+        except StopIteration:
+            self._iterated = getattr(self, "_iterated", 0.0) + time.perf_counter() - started
+            self._flush_iterated()
+            raise
+        self._iterated = getattr(self, "_iterated", 0.0) + time.perf_counter() - started
+        self._iterated_rows = getattr(self, "_iterated_rows", 0) + 1
+        return row
+
+    def _flush_iterated(self):
+        rows = getattr(self, "_iterated_rows", 0)
+        seconds = getattr(self, "_iterated", 0.0)
+        if rows or seconds:
+            self.metrics.record_query(getattr(self, "_sql", "?"), seconds, rows, calls=0)
+        self._iterated_rows, self._iterated = 0, 0.0
+
+    def close(self):
+        # Yarıda bırakılan yinelemenin okuduğu satırlar kaybolmasın
+        self._flush_iterated()
+        super().close()
+
+
+def instrumented_factory(metrics):
+    """``sqlite3.connect(factory=...)`` için ``metrics``'e bağlı bağlantı sınıfı."""
+    cursor_cls = type("InstrumentedCursor", (InstrumentedCursor,), {"metrics": metrics})
+
+    class InstrumentedConnection(sqlite3.Connection):
+        def cursor(self, factory=cursor_cls):
+            return super().cursor(factory)
+
+        def execute(self, sql, parameters=()):
+            return self.cursor().execute(sql, parameters)
+
+        def executemany(self, sql, seq_of_parameters):
+            return self.cursor().executemany(sql, seq_of_parameters)
+
+    return InstrumentedConnection
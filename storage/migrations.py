@@ -0,0 +1,461 @@
+"""Sürümlü şema geçişleri (``PRAGMA user_version``).
+
+Her geçiş tek bir yazma işleminde uygulanır ve sürüm numarası aynı işlemde
+yükseltilir; yarıda kalan bir geçiş veritabanını eski sürümünde bırakır.
+Mevcut ``tasks.db`` dosyaları uygulama açılışında yerinde yükseltilir.
+"""
+
+import logging
+
+from .analytics import rebuild_rollups
+from .queries import URGENCY_SQL
+
+log = logging.getLogger(__name__)
+
+
+# ============================================================
+# ORTAK DDL (güncel şema)
+# ============================================================
+
+INDEXES = [
+    # Liste sorgusu: önce sahip/liste bölümü, ardından filtre ve sıralama sütunları
+    """CREATE INDEX IF NOT EXISTS idx_tasks_scope
+       ON tasks (owner_id, list_id, is_completed, deadline, priority DESC)""",
+    # Bildirim zamanlayıcısı yalnızca açık görevlerde (notified, deadline) aralığını okur
+    """CREATE INDEX IF NOT EXISTS idx_tasks_notify
+       ON tasks (notified, deadline) WHERE is_completed = 0""",
+]
+
+TRIGGERS = [
+    # Son tarih değişince bildirim seviyesi sıfırlanır
+    """CREATE TRIGGER IF NOT EXISTS tasks_deadline_reset_notified
+       AFTER UPDATE OF deadline ON tasks
+       WHEN new.deadline IS NOT old.deadline AND new.notified != 0 BEGIN
+        UPDATE tasks SET notified = 0 WHERE id = new.id;
+    END""",
+]
+
+# Başlık ve açıklama üzerinde tam metin araması. İçerik ``tasks_fts_source``
+# görünümünden okunur (external content); indeks tetikleyicilerle eşzamanlı
+# tutulur. ``owner`` sütunu sahibin "o<id>" belirtecidir: bir kullanıcının
+# araması ``owner:"o7" ...`` ile FTS içinde o kullanıcının belgeleriyle
+# kesiştirilir, diğer kullanıcıların eşleşmeleri hiç okunmaz.
+FTS_SOURCE_VIEW = """
+CREATE VIEW IF NOT EXISTS tasks_fts_source AS
+SELECT id, title, description, 'o' || owner_id AS owner FROM tasks
+"""
+
+FTS_TABLE = """
+CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+    title, description, owner,
+    content='tasks_fts_source', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2',
+    prefix='2 3'
+)
+"""
+
+FTS_TRIGGERS = [
+    """CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks BEGIN
+        INSERT INTO tasks_fts (rowid, title, description, owner)
+        VALUES (new.id, new.title, new.description, 'o' || new.owner_id);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, title, description, owner)
+        VALUES ('delete', old.id, old.title, old.description, 'o' || old.owner_id);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS tasks_fts_au AFTER UPDATE OF title, description, owner_id ON tasks BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, title, description, owner)
+        VALUES ('delete', old.id, old.title, old.description, 'o' || old.owner_id);
+        INSERT INTO tasks_fts (rowid, title, description, owner)
+        VALUES (new.id, new.title, new.description, 'o' || new.owner_id);
+    END""",
+]
+
+# Analiz özetleri (bkz. ``analytics``). Günler UTC gün başı epoch saniyesidir.
+ROLLUP_TABLES = [
+    """CREATE TABLE IF NOT EXISTS task_rollup (
+        owner_id INTEGER NOT NULL,
+        list_id INTEGER NOT NULL,
+        priority INTEGER NOT NULL,
+        is_completed INTEGER NOT NULL,
+        tasks INTEGER NOT NULL DEFAULT 0,
+        duration_sum INTEGER NOT NULL DEFAULT 0,
+        duration_count INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (owner_id, list_id, priority, is_completed)
+    ) WITHOUT ROWID""",
+    """CREATE TABLE IF NOT EXISTS task_daily (
+        owner_id INTEGER NOT NULL,
+        list_id INTEGER NOT NULL,
+        day INTEGER NOT NULL,
+        created INTEGER NOT NULL DEFAULT 0,
+        completed INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (owner_id, list_id, day)
+    ) WITHOUT ROWID""",
+]
+
+
+def _rollup_upserts(row, sign):
+    """``row`` (new/old) satırının özetlere katkısını ``sign`` (1/-1) ile ekler."""
+    return f"""
+        INSERT INTO task_rollup (owner_id, list_id, priority, is_completed, tasks, duration_sum, duration_count)
+        VALUES ({row}.owner_id, {row}.list_id, {row}.priority, {row}.is_completed, {sign},
+                {sign} * COALESCE({row}.completed_at - {row}.created_at, 0),
+                {sign} * ({row}.completed_at - {row}.created_at IS NOT NULL))
+        ON CONFLICT (owner_id, list_id, priority, is_completed) DO UPDATE SET
+            tasks = tasks + excluded.tasks,
+            duration_sum = duration_sum + excluded.duration_sum,
+            duration_count = duration_count + excluded.duration_count;
+        INSERT INTO task_daily (owner_id, list_id, day, created)
+        SELECT {row}.owner_id, {row}.list_id, {row}.created_at - {row}.created_at % 86400, {sign}
+        WHERE {row}.created_at IS NOT NULL
+        ON CONFLICT (owner_id, list_id, day) DO UPDATE SET created = created + excluded.created;
+        INSERT INTO task_daily (owner_id, list_id, day, completed)
+        SELECT {row}.owner_id, {row}.list_id, {row}.completed_at - {row}.completed_at % 86400, {sign}
+        WHERE {row}.is_completed = 1 AND {row}.completed_at IS NOT NULL
+        ON CONFLICT (owner_id, list_id, day) DO UPDATE SET completed = completed + excluded.completed;"""
+
+
+# Özetler her yazmada artımlı güncellenir; ilerleme ya da başlık gibi analize
+# girmeyen sütunların güncellemesi tetikleyiciyi hiç çalıştırmaz
+ROLLUP_TRIGGERS = [
+    f"""CREATE TRIGGER IF NOT EXISTS tasks_rollup_ai AFTER INSERT ON tasks BEGIN{_rollup_upserts("new", 1)}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS tasks_rollup_ad AFTER DELETE ON tasks BEGIN{_rollup_upserts("old", -1)}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS tasks_rollup_au
+       AFTER UPDATE OF owner_id, list_id, priority, is_completed, created_at, completed_at ON tasks
+       BEGIN{_rollup_upserts("old", -1)}{_rollup_upserts("new", 1)}
+    END""",
+]
+
+# Değişiklik geçmişi (bkz. ``history``): yalnızca eklenen satırlar. Ekleme ve
+# silme olayları tam satırı, güncellemeler yalnızca değişen alanları
+# ``{"alan": [eski, yeni]}`` olarak tutar. ``notified`` bildirim zamanlayıcısının
+# iç durumudur, geçmişe girmez.
+AUDIT_COLUMNS = (
+    "title", "description", "deadline", "priority", "progress",
+    "is_completed", "created_at", "completed_at", "owner_id", "list_id",
+)
+
+AUDIT_TABLES = [
+    """CREATE TABLE IF NOT EXISTS task_events (
+        id INTEGER PRIMARY KEY,
+        task_id INTEGER NOT NULL,
+        owner_id INTEGER NOT NULL,
+        at INTEGER NOT NULL,
+        kind TEXT NOT NULL,
+        data TEXT NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_task_events_task ON task_events (task_id, id)",
+    # "Son silinenler" listesi; yalnızca silme olaylarında güncellenir
+    """CREATE INDEX IF NOT EXISTS idx_task_events_deleted
+       ON task_events (owner_id, id) WHERE kind = 'delete'""",
+]
+
+
+def _audit_row(row):
+    return "json_object(" + ", ".join(f"'{c}', {row}.{c}" for c in AUDIT_COLUMNS) + ")"
+
+
+_AUDIT_NOW = "CAST(strftime('%s', 'now') AS INTEGER)"
+_AUDIT_CHANGES = "\n            UNION ALL ".join(
+    f"SELECT '{c}' AS k, json_array(old.{c}, new.{c}) AS v WHERE new.{c} IS NOT old.{c}" for c in AUDIT_COLUMNS
+)
+
+AUDIT_TRIGGERS = [
+    f"""CREATE TRIGGER IF NOT EXISTS tasks_audit_ai AFTER INSERT ON tasks BEGIN
+        INSERT INTO task_events (task_id, owner_id, at, kind, data)
+        VALUES (new.id, new.owner_id, {_AUDIT_NOW}, 'insert', {_audit_row("new")});
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS tasks_audit_ad AFTER DELETE ON tasks BEGIN
+        INSERT INTO task_events (task_id, owner_id, at, kind, data)
+        VALUES (old.id, old.owner_id, {_AUDIT_NOW}, 'delete', {_audit_row("old")});
+    END""",
+    # Değer değiştirmeyen güncellemeler (ör. aynı başlığı yeniden kaydetmek) olay yazmaz
+    f"""CREATE TRIGGER IF NOT EXISTS tasks_audit_au AFTER UPDATE OF {", ".join(AUDIT_COLUMNS)} ON tasks BEGIN
+        INSERT INTO task_events (task_id, owner_id, at, kind, data)
+        SELECT new.id, new.owner_id, {_AUDIT_NOW}, 'update', json_group_object(k, json(v)) FROM (
+            {_AUDIT_CHANGES}
+        ) HAVING COUNT(*) > 0;
+    END""",
+]
+
+# Benzer başlık araması (bkz. ``duplicates``): yalnızca açık görevlerin
+# başlıkları trigram olarak indekslenir. ``scope`` sütunu "<o7> <l3>"
+# biçiminde sahip/liste belirteçleridir; trigram tokenizer alt dize eşleştirdiği
+# için "<o7>" ifadesi yalnızca sahip 7'ye uyar ("<o71>" değil).
+TITLE_INDEX_TABLE = """
+CREATE VIRTUAL TABLE IF NOT EXISTS task_titles USING fts5(title, scope, tokenize='trigram')
+"""
+
+_TITLE_SCOPE = "'<o' || {row}.owner_id || '> <l' || {row}.list_id || '>'"
+
+TITLE_INDEX_TRIGGERS = [
+    f"""CREATE TRIGGER IF NOT EXISTS tasks_titles_ai AFTER INSERT ON tasks WHEN new.is_completed = 0 BEGIN
+        INSERT INTO task_titles (rowid, title, scope) VALUES (new.id, new.title, {_TITLE_SCOPE.format(row="new")});
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS tasks_titles_ad AFTER DELETE ON tasks WHEN old.is_completed = 0 BEGIN
+        DELETE FROM task_titles WHERE rowid = old.id;
+    END""",
+    # Tamamlanan görev indeksten çıkar, yeniden açılan geri girer
+    f"""CREATE TRIGGER IF NOT EXISTS tasks_titles_au AFTER UPDATE OF title, is_completed, owner_id, list_id ON tasks BEGIN
+        DELETE FROM task_titles WHERE rowid = old.id AND old.is_completed = 0;
+        INSERT INTO task_titles (rowid, title, scope)
+        SELECT new.id, new.title, {_TITLE_SCOPE.format(row="new")} WHERE new.is_completed = 0;
+    END""",
+]
+
+# "Sıradaki" görünümü: ``urgency`` sanal (VIRTUAL) hesaplanmış sütundur, bu
+# indekslerde saklanır ve her yazmada SQLite tarafından güncel tutulur. İlk N
+# görev indeksin başından okunur; tablo sıralanmaz. Sütun şema 7'de eklendiği
+# için bu indeksler ``INDEXES``'ten ayrıdır (şema 3 onları sütun yokken kurar).
+URGENCY_INDEXES = [
+    """CREATE INDEX IF NOT EXISTS idx_tasks_next
+       ON tasks (owner_id, list_id, urgency) WHERE is_completed = 0""",
+    # Kullanıcının tüm listeleri (liste seçilmemiş bölüm)
+    """CREATE INDEX IF NOT EXISTS idx_tasks_next_owner
+       ON tasks (owner_id, urgency) WHERE is_completed = 0""",
+]
+
+# Şema 2'nin bağımlıları (sahip/liste sütunlarından önce); yalnızca _v2 kullanır
+_V2_INDEXES = [
+    """CREATE INDEX IF NOT EXISTS idx_tasks_status_deadline_priority
+       ON tasks (is_completed, deadline, priority DESC)""",
+    """CREATE INDEX IF NOT EXISTS idx_tasks_notify
+       ON tasks (notified, deadline) WHERE is_completed = 0""",
+]
+_V2_FTS_TABLE = """
+CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+    title, description,
+    content='tasks', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2',
+    prefix='2 3'
+)
+"""
+_V2_FTS_TRIGGERS = [
+    """CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks BEGIN
+        INSERT INTO tasks_fts (rowid, title, description) VALUES (new.id, new.title, new.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS tasks_fts_au AFTER UPDATE OF title, description ON tasks BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO tasks_fts (rowid, title, description) VALUES (new.id, new.title, new.description);
+    END""",
+]
+
+
+def _drop_tasks_dependents(conn):
+    """``tasks`` yeniden kurulmadan önce ona bağlı indeks ve tetikleyicileri kaldırır."""
+    for kind, name in conn.execute(
+        "SELECT type, name FROM sqlite_master WHERE tbl_name = 'tasks' AND type IN ('index', 'trigger') "
+        "AND name NOT LIKE 'sqlite_autoindex%'"
+    ).fetchall():
+        conn.execute(f"DROP {kind.upper()} IF EXISTS {name}")
+
+
+def _create_tasks_dependents(conn, indexes=INDEXES, fts_table=FTS_TABLE, fts_triggers=FTS_TRIGGERS,
+                             rollup_triggers=ROLLUP_TRIGGERS, audit_triggers=AUDIT_TRIGGERS,
+                             title_triggers=TITLE_INDEX_TRIGGERS):
+    for ddl in indexes + TRIGGERS + audit_triggers + title_triggers:
+        conn.execute(ddl)
+    conn.execute(fts_table)
+    for ddl in fts_triggers:
+        conn.execute(ddl)
+    conn.execute("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')")
+    for ddl in rollup_triggers:
+        conn.execute(ddl)
+    if rollup_triggers:
+        rebuild_rollups(conn)
+
+
+# ============================================================
+# GEÇİŞLER
+# ============================================================
+
+def _v1_baseline(conn):
+    """İlk şema: metin tarihler ve metin öncelik (sürümsüz veritabanlarıyla aynı)."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS tasks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            description TEXT,
+            deadline TEXT,
+            priority TEXT,
+            progress INTEGER DEFAULT 0,
+            is_completed INTEGER DEFAULT 0,
+            created_at TEXT,
+            completed_at TEXT,
+            notified INTEGER DEFAULT 0
+        )
+    """)
+    conn.execute("""CREATE INDEX IF NOT EXISTS idx_tasks_status_deadline_priority
+                    ON tasks (is_completed, deadline, priority DESC)""")
+
+
+def _v2_typed_columns(conn):
+    """Tarihleri epoch saniyesine, önceliği tam sayı sıraya çevirir.
+
+    Son tarih o günün UTC gece yarısıdır; ``date()`` hem "2025-01-01" hem de
+    saat içeren ISO değerlerini kabul eder. Çözülemeyen değerler NULL olur.
+    """
+    _drop_tasks_dependents(conn)
+    conn.execute("""
+        CREATE TABLE tasks_v2 (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            description TEXT,
+            deadline INTEGER,
+            priority INTEGER NOT NULL DEFAULT 0,
+            progress INTEGER NOT NULL DEFAULT 0,
+            is_completed INTEGER NOT NULL DEFAULT 0,
+            created_at INTEGER,
+            completed_at INTEGER,
+            notified INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    conn.execute("""
+        INSERT INTO tasks_v2 (id, title, description, deadline, priority, progress,
+                              is_completed, created_at, completed_at, notified)
+        SELECT id, title, description,
+               CAST(strftime('%s', date(deadline)) AS INTEGER),
+               CASE priority WHEN 'High' THEN 2 WHEN 'Medium' THEN 1 ELSE 0 END,
+               COALESCE(progress, 0),
+               COALESCE(is_completed, 0),
+               CAST(strftime('%s', created_at) AS INTEGER),
+               CAST(strftime('%s', completed_at) AS INTEGER),
+               COALESCE(notified, 0)
+        FROM tasks
+    """)
+    conn.execute("DROP TABLE tasks")
+    conn.execute("ALTER TABLE tasks_v2 RENAME TO tasks")
+    # Sahip/liste sütunları henüz yok; bağımlılar o sürümün hâliyle kurulur
+    _create_tasks_dependents(
+        conn, _V2_INDEXES, _V2_FTS_TABLE, _V2_FTS_TRIGGERS, rollup_triggers=[], audit_triggers=[], title_triggers=[],
+    )
+
+
+def _v3_owners_and_lists(conn):
+    """Kullanıcılar ve listeler; görevler ``owner_id``/``list_id`` ile bölümlenir.
+
+    Mevcut görevler varsayılan kullanıcının (1) varsayılan listesine (1) düşer.
+    ``ADD COLUMN`` sabit varsayılanla tabloyu yeniden yazmaz; zaman alan tek
+    adım, sahip belirteci eklenen FTS indeksinin yeniden kurulmasıdır.
+    """
+    conn.execute("""
+        CREATE TABLE users (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE COLLATE NOCASE,
+            created_at INTEGER NOT NULL
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE lists (
+            id INTEGER PRIMARY KEY,
+            owner_id INTEGER NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+            name TEXT NOT NULL COLLATE NOCASE,
+            created_at INTEGER NOT NULL,
+            UNIQUE (owner_id, name)
+        )
+    """)
+    conn.execute("INSERT INTO users (id, name, created_at) VALUES (1, 'varsayılan', strftime('%s', 'now'))")
+    conn.execute("INSERT INTO lists (id, owner_id, name, created_at) VALUES (1, 1, 'Genel', strftime('%s', 'now'))")
+    conn.execute("ALTER TABLE tasks ADD COLUMN owner_id INTEGER NOT NULL DEFAULT 1")
+    conn.execute("ALTER TABLE tasks ADD COLUMN list_id INTEGER NOT NULL DEFAULT 1")
+    _drop_tasks_dependents(conn)
+    conn.execute("DROP TABLE IF EXISTS tasks_fts")
+    conn.execute(FTS_SOURCE_VIEW)
+    _create_tasks_dependents(conn, rollup_triggers=[], audit_triggers=[], title_triggers=[])
+
+
+def _v4_rollups(conn):
+    """Analiz özet tabloları ve onları güncel tutan tetikleyiciler.
+
+    Özetler mevcut görevlerden bir kez hesaplanır; sonrasında her yazma
+    yalnızca ilgili birkaç özet satırını günceller.
+    """
+    for ddl in ROLLUP_TABLES + ROLLUP_TRIGGERS:
+        conn.execute(ddl)
+    rebuild_rollups(conn)
+
+
+def _v5_task_events(conn):
+    """Görev değişiklik geçmişi (``task_events``) ve onu yazan tetikleyiciler.
+
+    Mevcut görevler için geriye dönük olay yazılmaz; geçmiş bu sürümden
+    sonraki değişikliklerle başlar. Güncelleme olayları eski değerleri de
+    taşıdığından geri alma için başlangıç anlık görüntüsü gerekmez.
+    """
+    for ddl in AUDIT_TABLES + AUDIT_TRIGGERS:
+        conn.execute(ddl)
+
+
+def _v6_title_trigrams(conn):
+    """Açık görev başlıklarının trigram indeksi (benzer görev uyarısı için).
+
+    Mevcut açık görevler bir kez indekslenir; sonrasında tetikleyiciler
+    ekleme, silme, başlık değişikliği ve tamamlanmayla eşzamanlı tutar.
+    """
+    conn.execute(TITLE_INDEX_TABLE)
+    for ddl in TITLE_INDEX_TRIGGERS:
+        conn.execute(ddl)
+    conn.execute(f"""
+        INSERT INTO task_titles (rowid, title, scope)
+        SELECT id, title, {_TITLE_SCOPE.format(row="tasks")} FROM tasks WHERE is_completed = 0
+    """)
+
+
+def _v7_urgency(conn):
+    """Aciliyet anahtarı (``urgency``) sütunu ve "Sıradaki" indeksleri.
+
+    Sütun sanaldır, tablo yeniden yazılmaz; indeksler kurulurken açık görevler
+    için bir kez hesaplanır. Anahtarın sabitleri (``queries.URGENCY_SQL``)
+    şemaya gömülüdür; değişirlerse sütun yeni bir geçişle yeniden kurulmalıdır.
+    """
+    conn.execute(f"ALTER TABLE tasks ADD COLUMN urgency INTEGER GENERATED ALWAYS AS ({URGENCY_SQL}) VIRTUAL")
+    for ddl in URGENCY_INDEXES:
+        conn.execute(ddl)
+
+
+MIGRATIONS = [
+    _v1_baseline,
+    _v2_typed_columns,
+    _v3_owners_and_lists,
+    _v4_rollups,
+    _v5_task_events,
+    _v6_title_trigrams,
+    _v7_urgency,
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def schema_version(conn):
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(pool, target=SCHEMA_VERSION):
+    """Veritabanını ``target`` sürümüne yükseltir; (eski, yeni) sürümü döndürür."""
+    with pool.read() as conn:
+        start = schema_version(conn)
+    if start > SCHEMA_VERSION:
+        raise RuntimeError(
+            f"Veritabanı şema sürümü ({start}) bu uygulamadan yeni ({SCHEMA_VERSION})"
+        )
+
+    version = start
+    while version < target:
+        with pool.write() as conn:
+            # Başka bir süreç aynı anda yükseltmiş olabilir
+            version = schema_version(conn)
+            if version >= target:
+                break
+            step = MIGRATIONS[version]
+            log.info("Şema geçişi %d → %d: %s", version, version + 1, step.__name__)
+            step(conn)
+            conn.execute(f"PRAGMA user_version = {version + 1}")
+        version += 1
+    return start, version
@@ -0,0 +1,196 @@
+"""Son tarih bildirimleri için arka plan zamanlayıcısı.
+
+``notified`` sütunu bildirim seviyesini tutar: 0 = bildirim yok,
+1 = "bugün son gün" bildirildi, 2 = "gecikti" bildirildi. Zamanlayıcı yalnızca
+``idx_tasks_notify`` kısmi indeksi (tamamlanmamış görevlerde
+``(notified, deadline)``) üzerinden eşik geçen satırları okur ve seviyelerini
+toplu olarak günceller; arayüzün yeniden çalıştırmalarında tablo taranmaz.
+Son tarih değiştiğinde seviye bir tetikleyiciyle sıfırlanır.
+"""
+
+import json
+import logging
+import threading
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import date, datetime
+
+from .codec import DAY, date_to_epoch, epoch_to_date
+from .repository import _chunks
+
+log = logging.getLogger(__name__)
+
+DUE_TODAY = "due_today"
+OVERDUE = "overdue"
+
+
+@dataclass(frozen=True)
+class Notification:
+    task_id: int
+    title: str
+    deadline: str  # ISO tarih
+    kind: str  # DUE_TODAY ya da OVERDUE
+    created_at: str
+    owner_id: int = None  # Görevin sahibi (oturumlara yalnızca kendi bildirimleri gösterilir)
+
+    @property
+    def message(self):
+        if self.kind == OVERDUE:
+            return f"⏰ Gecikti: {self.title}"
+        return f"📅 Bugün son gün: {self.title}"
+
+
+# ============================================================
+# BİLDİRİM HEDEFLERİ (SINK)
+# ============================================================
+
+class LogSink:
+    """Bildirimleri ``logging`` ile yazar."""
+
+    def __init__(self, logger=log):
+        self.logger = logger
+
+    def emit(self, notifications):
+        for n in notifications:
+            self.logger.info("%s (görev #%s, son tarih %s)", n.message, n.task_id, n.deadline)
+
+
+class WebhookSink:
+    """Bildirimleri JSON listesi olarak bir HTTP uç noktasına POST eder."""
+
+    def __init__(self, url, timeout=5.0):
+        self.url = url
+        self.timeout = timeout
+
+    def emit(self, notifications):
+        import urllib.request  # http/ssl yüklemesi yalnızca webhook kullanılınca
+
+        body = json.dumps([asdict(n) for n in notifications], ensure_ascii=False).encode("utf-8")
+        req = urllib.request.Request(self.url, data=body, headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(req, timeout=self.timeout):
+            pass
+
+
+class MemorySink:
+    """Son bildirimleri sıra numarasıyla bellekte tutar (uygulama içi toast'lar için).
+
+    Her oturum gördüğü son sıra numarasını saklar ve ``since()`` ile yenileri alır.
+    """
+
+    def __init__(self, maxlen=100):
+        self._items = deque(maxlen=maxlen)
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def emit(self, notifications):
+        with self._lock:
+            for n in notifications:
+                self._seq += 1
+                self._items.append((self._seq, n))
+
+    @property
+    def last_seq(self):
+        return self._seq
+
+    def since(self, seq):
+        """``seq``'ten sonraki ``(sıra, bildirim)`` çiftleri."""
+        with self._lock:
+            return [(s, n) for s, n in self._items if s > seq]
+
+
+# ============================================================
+# ZAMANLAYICI
+# ============================================================
+
+class DeadlineNotifier:
+    """Son tarihi gelen/geçen görevleri periyodik olarak bulup bildirir."""
+
+    def __init__(self, pool, sinks=(), interval=60.0, batch_size=500):
+        self.pool = pool
+        self.sinks = list(sinks)
+        self.interval = interval
+        self.batch_size = batch_size
+        self._stop = threading.Event()
+        self._thread = None
+
+    def poll_once(self, today=None):
+        """Eşik geçen görevleri işaretler, bildirimleri hedeflere iletir ve döndürür."""
+        today = date_to_epoch(today or date.today())
+        tomorrow = today + DAY
+        now = datetime.utcnow().isoformat()
+
+        def note(r, kind):
+            return Notification(
+                r["id"], r["title"], epoch_to_date(r["deadline"]).isoformat(), kind, now, r["owner_id"],
+            )
+
+        # Aday seçimi okuyucu bağlantıda: çoğu turda eşik geçen görev yoktur ve
+        # yazma kilidi hiç alınmaz. Adaylar kısmi indeksten okunur.
+        with self.pool.read() as conn:
+            # Hiç bildirilmemiş ve son tarihi bugün ya da geçmiş olanlar
+            rows = conn.execute(
+                """SELECT id, title, deadline, owner_id FROM tasks
+                   WHERE is_completed = 0 AND notified = 0 AND deadline < ?
+                   ORDER BY deadline LIMIT ?""",
+                (tomorrow, self.batch_size),
+            ).fetchall()
+            candidates = [note(r, OVERDUE if r["deadline"] < today else DUE_TODAY) for r in rows]
+
+            # "Bugün" bildirilmiş, artık gecikmiş olanlar
+            rows = conn.execute(
+                """SELECT id, title, deadline, owner_id FROM tasks
+                   WHERE is_completed = 0 AND notified = 1 AND deadline < ?
+                   ORDER BY deadline LIMIT ?""",
+                (today, self.batch_size),
+            ).fetchall()
+            candidates += [note(r, OVERDUE) for r in rows]
+
+        if not candidates:
+            return []
+
+        # İşaretleme koşullu: seviyesi bu arada yükselen (başka bir süreç
+        # bildirdi), tamamlanan ya da son tarihi değişen görevler güncellenmez
+        # ve bildirilmez. Yalnızca RETURNING ile dönen satırlar bildirilir.
+        claimed = set()
+        with self.pool.write() as conn:
+            for kind, level in ((DUE_TODAY, 1), (OVERDUE, 2)):
+                ids = [n.task_id for n in candidates if n.kind == kind]
+                for chunk in _chunks(ids):
+                    claimed.update(r[0] for r in conn.execute(
+                        f"""UPDATE tasks SET notified = ?
+                            WHERE id IN ({','.join('?' * len(chunk))})
+                              AND is_completed = 0 AND notified < ? AND deadline < ?
+                            RETURNING id""",
+                        [level, *chunk, level, tomorrow if kind == DUE_TODAY else today],
+                    ))
+        found = [n for n in candidates if n.task_id in claimed]
+
+        if found:
+            for sink in self.sinks:
+                try:
+                    sink.emit(found)
+                except Exception:
+                    log.exception("Bildirim hedefi başarısız: %r", sink)
+        return found
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                # Birikmiş iş varsa beklemeden sonraki partiye geç
+                while len(self.poll_once()) >= self.batch_size and not self._stop.is_set():
+                    pass
+            except Exception:
+                log.exception("Bildirim taraması başarısız")
+            self._stop.wait(self.interval)
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="deadline-notifier", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
@@ -0,0 +1,241 @@
+"""Kenar çubuğu filtrelerini parametreli SQL sorgularına çevirir.
+
+Filtreleme, sıralama ve sayfalama SQLite tarafında yapılır; böylece her
+yeniden çalıştırmada tüm tablo belleğe alınmaz. Sorgular bir ``Scope`` ile
+sahip/liste bölümüne daraltılır; sıralama ``idx_tasks_scope`` indeksiyle
+(``owner_id, list_id`` önekinden sonra) birebir örtüşür, bu yüzden bir
+kullanıcının sorgusu tablonun toplam boyutundan bağımsızdır. Arama metni
+verildiğinde ``tasks_fts`` ile birleştirilip bm25'e göre sıralanır.
+"""
+
+import re
+from dataclasses import dataclass
+from datetime import date
+
+from .codec import DAY, PRIORITIES, date_to_epoch, priority_rank
+
+DUE_FILTERS = ("all", "overdue", "today", "week")
+
+# Tamamlananlar en sona; SQLite artan sıralamada NULL'ları zaten en başa koyar,
+# bu yüzden son tarihi olmayanlar tamamlanmamışlar içinde ilk sırada kalır.
+# Öncelik tam sayı sıra değeridir: DESC, High > Medium > Low demektir.
+ORDER_BY = "is_completed, deadline, priority DESC, id"
+
+# Arama yapılırken sonuçlar alaka düzeyine göre sıralanır (başlık eşleşmesi 10 kat
+# ağırlıklı, sahip belirteci puana katılmaz)
+SEARCH_ORDER_BY = "bm25(tasks_fts, 10.0, 1.0, 0.0), tasks.id"
+
+# "Sıradaki" sırası: aciliyet anahtarı görevin etkin son tarihidir (epoch sn),
+# küçük olan önce gelir. Son tarihi olmayan görev oluşturulduktan
+# NO_DEADLINE_DAYS gün sonra bitecekmiş gibi sayılır. Her öncelik basamağı
+# PRIORITY_DAYS gün, yapılmamış iş (%100 - ilerleme) en fazla REMAINING_DAYS
+# gün öne çeker; görev AGE_DIVISOR gün yaşlandıkça bir gün daha öne gelir.
+# Anahtarın zamanla değişen kısmı tüm görevler için aynıdır (yaş herkes için
+# aynı hızla artar), bu yüzden sıra zaman geçtikçe değişmez: anahtar saklanıp
+# indekslenebilir ve hiç tazelenmesi gerekmez. Sabitler şemaya gömülüdür
+# (bkz. ``migrations._v7_urgency``); değişirlerse yeni bir şema geçişi gerekir.
+NO_DEADLINE_DAYS = 14
+PRIORITY_DAYS = 3
+REMAINING_DAYS = 2
+AGE_DIVISOR = 10
+
+_CREATED = "COALESCE(created_at, deadline, 0)"
+URGENCY_SQL = (
+    f"COALESCE(deadline, {_CREATED} + {NO_DEADLINE_DAYS * DAY}) - priority * {PRIORITY_DAYS * DAY}"
+    f" - (100 - progress) * {REMAINING_DAYS * DAY // 100} + {_CREATED} / {AGE_DIVISOR}"
+)
+
+
+def urgency_key(row):
+    """``URGENCY_SQL``'in Python karşılığı (veritabanı biçimindeki satır için)."""
+    created = next((v for v in (row["created_at"], row["deadline"]) if v is not None), 0)
+    deadline = row["deadline"] if row["deadline"] is not None else created + NO_DEADLINE_DAYS * DAY
+    return (deadline - row["priority"] * PRIORITY_DAYS * DAY
+            - (100 - row["progress"]) * (REMAINING_DAYS * DAY // 100) + created // AGE_DIVISOR)
+
+
+def urgency_days(key, now):
+    """``now`` anındaki aciliyet (gün): etkin son tarihin kaç gün geçtiği; eksi değer kalan pay."""
+    return (now + now // AGE_DIVISOR - key) / DAY
+
+
+@dataclass(frozen=True)
+class TaskFilter:
+    """Görev listesinin filtre durumu (hash'lenebilir, önbellek anahtarı olabilir)."""
+
+    show_completed: bool = True
+    priorities: tuple = PRIORITIES
+    due: str = "all"
+    today: date = None
+    search: str = ""
+
+    def __post_init__(self):
+        if self.due not in DUE_FILTERS:
+            raise ValueError(f"Geçersiz vade filtresi: {self.due!r}")
+        object.__setattr__(self, "priorities", tuple(self.priorities))
+
+
+@dataclass(frozen=True)
+class Scope:
+    """Görevlerin sahip/liste bölümü. ``list_id=None`` sahibin tüm listeleridir."""
+
+    owner_id: int
+    list_id: int = None
+
+
+def scope_where(scope):
+    """Bölüm koşulları ve parametreleri: ([ifade, ...], [değer, ...])."""
+    if scope is None:
+        return [], []
+    if scope.list_id is None:
+        return ["owner_id = ?"], [scope.owner_id]
+    return ["owner_id = ?", "list_id = ?"], [scope.owner_id, scope.list_id]
+
+
+def fts_query(text, scope=None):
+    """Serbest metni güvenli bir FTS5 sorgusuna çevirir.
+
+    Her kelime tırnak içine alınıp önek eşleşmesine açılır ve tüm kelimeler
+    başlık/açıklamada birlikte aranır: ``"rapor bit"`` →
+    ``{title description} : ("rapor"* "bit"*)``. Bölüm verilirse sahip
+    belirteci eklenir; eşleşmeler FTS içinde o sahibe daraltılır.
+    """
+    terms = re.findall(r"\w+", text or "")
+    if not terms:
+        return ""
+    match = "{title description} : (" + " ".join(f'"{t}"*' for t in terms) + ")"
+    if scope is not None:
+        match = f'owner : "o{int(scope.owner_id)}" AND {match}'
+    return match
+
+
+def _from_clause(f):
+    """Arama varsa FTS tablosuyla birleştirilmiş FROM ifadesi.
+
+    CROSS JOIN, SQLite'ta birleştirme sırasını sabitler: önce FTS eşleşmeleri
+    bulunur, ardından görevler rowid ile okunur. Aksi halde planlayıcı filtre
+    indeksini dış döngü seçip her satır için MATCH çalıştırabiliyor.
+    """
+    if fts_query(f.search):
+        return "tasks_fts CROSS JOIN tasks ON tasks.id = tasks_fts.rowid"
+    return "tasks"
+
+
+def build_where(f, scope=None):
+    """Filtreye karşılık gelen WHERE ifadesini ve parametrelerini döndürür."""
+    clauses, params = [], []
+
+    match = fts_query(f.search, scope)
+    if match:
+        clauses.append("tasks_fts MATCH ?")
+        params.append(match)
+
+    scope_clauses, scope_params = scope_where(scope)
+    clauses += scope_clauses
+    params += scope_params
+
+    if not f.show_completed:
+        clauses.append("is_completed = 0")
+
+    if set(f.priorities) != set(PRIORITIES):
+        if f.priorities:
+            clauses.append("priority IN (" + ",".join("?" * len(f.priorities)) + ")")
+            params.extend(priority_rank(p) for p in f.priorities)
+        else:
+            clauses.append("0")
+
+    # Son tarihler gün başı epoch saniyesidir; karşılaştırmalar indeksten
+    # karşılanan tam sayı aralıklarıdır.
+    today = date_to_epoch(f.today or date.today())
+    if f.due == "overdue":
+        clauses.append("deadline < ? AND is_completed = 0")
+        params.append(today)
+    elif f.due == "today":
+        clauses.append("deadline >= ? AND deadline < ?")
+        params += [today, today + DAY]
+    elif f.due == "week":
+        clauses.append("deadline >= ? AND deadline < ?")
+        params += [today, today + 8 * DAY]
+
+    where = " WHERE " + " AND ".join(clauses) if clauses else ""
+    return where, params
+
+
+def build_select(f, limit=None, offset=0, scope=None):
+    """Filtrelenmiş, sıralı ve isteğe bağlı olarak sayfalanmış SELECT sorgusu."""
+    source = _from_clause(f)
+    where, params = build_where(f, scope)
+    order_by = SEARCH_ORDER_BY if source != "tasks" else ORDER_BY
+    sql = f"SELECT tasks.* FROM {source}{where} ORDER BY {order_by}"
+    if limit is not None:
+        sql += " LIMIT ? OFFSET ?"
+        params += [int(limit), int(offset)]
+    return sql, params
+
+
+def keyset_ranges(after):
+    """``ORDER_BY`` sırasında ``after`` satırından sonrası, art arda gelen dört aralık.
+
+    ``after`` son satırın sıralama sütunlarıdır: (is_completed, deadline,
+    priority, id), veritabanı biçiminde. Son tarih NULL olabilir (NULL'lar
+    önce gelir) ve öncelik azalan sıradadır; tek bir OR ifadesi indekste
+    atlama yapamadığı için koşul, her biri ``idx_tasks_scope`` içinde ayrı bir
+    aralık olan parçalara bölünür: [(ifade, [değer, ...]), ...].
+    """
+    completed, deadline, priority, task_id = after
+    if deadline is None:
+        same, later, deadline_params = "deadline IS NULL", "deadline IS NOT NULL", []
+    else:
+        same, later, deadline_params = "deadline = ?", "deadline > ?", [deadline]
+    return [
+        (f"is_completed = ? AND {same} AND priority = ? AND tasks.id > ?",
+         [completed, *deadline_params, priority, task_id]),
+        (f"is_completed = ? AND {same} AND priority < ?", [completed, *deadline_params, priority]),
+        (f"is_completed = ? AND {later}", [completed, *deadline_params]),
+        ("is_completed > ?", [completed]),
+    ]
+
+
+def build_page(f, after=None, scope=None):
+    """Anahtar küme (keyset) sayfası: [(sql, parametreler), ...].
+
+    Her sorgu son parametre olarak ``LIMIT`` değerini (sayfada kalan satır
+    sayısı) bekler; sorgular sırayla çalıştırılıp sonuçları sayfa dolana
+    kadar art arda eklenir. OFFSET'in aksine atlanan satırlar okunmaz; sayfa
+    maliyeti konumdan bağımsızdır ve sayfalar arasında eklenen/silinen
+    görevler satır kaydırmaz. Arama yapılırken de liste sırası kullanılır
+    (bm25 sırası kararlı bir anahtar vermez).
+    """
+    where, params = build_where(f, scope)
+    select = f"SELECT tasks.* FROM {_from_clause(f)}"
+    if after is None:
+        return [(f"{select}{where} ORDER BY {ORDER_BY} LIMIT ?", params)]
+    return [
+        (f"{select}{where + ' AND ' if where else ' WHERE '}{clause} ORDER BY {ORDER_BY} LIMIT ?",
+         params + extra)
+        for clause, extra in keyset_ranges(after)
+    ]
+
+
+def page_key(row):
+    """Satırın (veritabanı biçiminde) ``keyset_where`` anahtarı."""
+    return (row["is_completed"], row["deadline"], row["priority"], row["id"])
+
+
+def build_next(limit, scope=None):
+    """En acil ``limit`` açık görev; ``idx_tasks_next`` sırasıyla okunur, sıralama yapılmaz."""
+    clauses, params = scope_where(scope)
+    where = "".join(f" AND {c}" for c in clauses)
+    return f"SELECT * FROM tasks WHERE is_completed = 0{where} ORDER BY urgency, id LIMIT ?", params + [int(limit)]
+
+
+def build_count(f, scope=None):
+    """Filtreye uyan görev sayısını veren COUNT sorgusu."""
+    where, params = build_where(f, scope)
+    return f"SELECT COUNT(*) FROM {_from_clause(f)}{where}", params
+
+
+def build_ids(f, scope=None):
+    """Filtreye uyan görev kimlikleri (toplu işlemlerde "tümünü seç" için)."""
+    where, params = build_where(f, scope)
+    return f"SELECT tasks.id FROM {_from_clause(f)}{where}", params
@@ -0,0 +1,697 @@
+"""Görev deposu arayüzü ve uygulamaları.
+
+``TaskRepository`` arayüzünün üç uygulaması vardır:
+
+- ``SQLiteTaskRepository``: ``ConnectionPool`` üzerinde asıl depo.
+- ``MemoryTaskRepository``: bellekte, bağımlılıksız (testler ve denemeler için).
+- ``CachedTaskRepository``: herhangi bir deponun okumalarını veri sürümüyle
+  anahtarlanmış ``ResultCache``'te tutan sarmalayıcı.
+
+``AsyncTaskRepository`` aynı arayüzü asyncio için sunar. Bu modül (ve
+``storage`` paketi) Streamlit, pandas ya da plotly içe aktarmaz; betikler ve
+arka plan işleri hızlıca açılır.
+
+Tüm metotlar uygulama biçimindeki değerlerle çalışır: son tarih ISO tarih
+metni (ya da ``date``), öncelik "Low"/"Medium"/"High" etiketi.
+
+Depolar bir ``Scope``'a (sahip/liste) bağlanabilir: ``repo.scoped(scope)``.
+Bağlı bir deponun tüm okuma ve yazmaları (kimlikle yapılanlar dahil) o
+bölümle sınırlıdır; ``scope=None`` tüm tablo demektir (yönetim araçları).
+"""
+
+import abc
+import itertools
+import re
+import threading
+import unicodedata
+from datetime import date
+
+from . import analytics
+from .accounts import DEFAULT_LIST_ID, DEFAULT_OWNER_ID
+from .codec import (
+    DAY, PRIORITY_RANK, date_to_epoch, decode_task, encode_fields, epoch_to_date, epoch_to_iso, now_epoch,
+    priority_label, priority_rank,
+)
+from .queries import (
+    DUE_FILTERS, TaskFilter, build_count, build_ids, build_next, build_page, build_select, page_key, scope_where,
+    urgency_key,
+)
+
+# update() ile değiştirilebilen sütunlar
+UPDATABLE_FIELDS = (
+    "title", "description", "deadline", "priority", "progress",
+    "is_completed", "created_at", "completed_at", "notified",
+)
+
+
+# Toplu işlemlerde tek ifadedeki ``IN (...)`` parametre sayısı (SQLite sınırının altında)
+ID_CHUNK = 500
+
+
+def _chunks(ids, size=ID_CHUNK):
+    ids = list(dict.fromkeys(ids))  # Sırayı koruyarak tekrarları at
+    for i in range(0, len(ids), size):
+        yield ids[i:i + size]
+
+
+def _check_fields(fields):
+    unknown = set(fields) - set(UPDATABLE_FIELDS)
+    if unknown:
+        raise ValueError(f"Güncellenemeyen alan(lar): {', '.join(sorted(unknown))}")
+
+
+class TaskRepository(abc.ABC):
+    """Görev deposu arayüzü."""
+
+    scope = None
+
+    @abc.abstractmethod
+    def scoped(self, scope):
+        """Aynı veriye ``scope`` bölümüyle sınırlı bakan yeni bir depo."""
+
+    @property
+    @abc.abstractmethod
+    def version(self):
+        """Veri her değiştiğinde değişen, karşılaştırılabilir bir değer."""
+
+    @abc.abstractmethod
+    def add(self, title, description=None, deadline=None, priority="Low", progress=0, list_id=None):
+        """Yeni görev ekler ve kimliğini döndürür (varsayılan liste: bölümün listesi)."""
+
+    @abc.abstractmethod
+    def get(self, task_id):
+        """Görevi sözlük olarak döndürür; yoksa ``None``."""
+
+    @abc.abstractmethod
+    def list(self, filters=None, limit=None, offset=0):
+        """Filtreye uyan görevler, liste sırasında."""
+
+    @abc.abstractmethod
+    def page(self, filters=None, limit=50, after=None):
+        """Anahtar küme sayfası: (görevler, sonraki sayfanın ``after`` değeri ya da ``None``).
+
+        ``after`` önceki çağrının döndürdüğü anahtardır; ``None`` ilk sayfadır.
+        """
+
+    @abc.abstractmethod
+    def next_up(self, limit=10):
+        """En acil ``limit`` açık görev, ``urgency`` anahtarına göre (bkz. ``queries.URGENCY_SQL``)."""
+
+    @abc.abstractmethod
+    def count(self, filters=None):
+        """Filtreye uyan görev sayısı."""
+
+    @abc.abstractmethod
+    def update(self, task_id, **fields):
+        """Verilen alanları günceller."""
+
+    @abc.abstractmethod
+    def delete(self, task_id):
+        """Görevi siler."""
+
+    @abc.abstractmethod
+    def mark_complete(self, task_id, completed=True):
+        """Görevi tamamlandı (ya da yeniden açık) olarak işaretler."""
+
+    @abc.abstractmethod
+    def ids(self, filters=None):
+        """Filtreye uyan görev kimlikleri."""
+
+    @abc.abstractmethod
+    def update_many(self, task_ids, **fields):
+        """Aynı alanları birden çok görevde tek işlemde günceller; değişen satır sayısı."""
+
+    @abc.abstractmethod
+    def delete_many(self, task_ids):
+        """Görevleri tek işlemde siler; silinen satır sayısı."""
+
+    @abc.abstractmethod
+    def complete_many(self, task_ids, completed=True):
+        """Görevleri tek işlemde tamamlar (ya da yeniden açar); değişen satır sayısı."""
+
+    @abc.abstractmethod
+    def summary(self):
+        """Toplam/tamamlanan/bekleyen sayıları ve ortalama tamamlanma süresi (sn)."""
+
+    @abc.abstractmethod
+    def priority_distribution(self):
+        """[(öncelik etiketi, sayı), ...]"""
+
+    @abc.abstractmethod
+    def status_distribution(self):
+        """[(is_completed, sayı), ...]"""
+
+    @abc.abstractmethod
+    def daily_activity(self, since=None):
+        """Gün başına eklenen/tamamlanan görevler: [(date, eklenen, tamamlanan), ...]"""
+
+
+# ============================================================
+# SQLITE
+# ============================================================
+
+class SQLiteTaskRepository(TaskRepository):
+    """``ConnectionPool`` üzerinde çalışan depo."""
+
+    def __init__(self, pool, scope=None):
+        self.pool = pool
+        self.scope = scope
+
+    def scoped(self, scope):
+        return SQLiteTaskRepository(self.pool, scope)
+
+    @property
+    def version(self):
+        return self.pool.version
+
+    def _scope_sql(self):
+        """Kimlikle yapılan işlemlere eklenecek bölüm koşulu: (" AND ...", [değer, ...])."""
+        clauses, params = scope_where(self.scope)
+        return "".join(f" AND {c}" for c in clauses), params
+
+    def add(self, title, description=None, deadline=None, priority="Low", progress=0, list_id=None):
+        # Sahip listeden okunur; başka bir kullanıcının listesine görev eklenemez
+        list_id = list_id or (self.scope.list_id if self.scope else DEFAULT_LIST_ID)
+        if list_id is None:
+            raise ValueError("Görev eklemek için bir liste seçilmeli")
+        condition, params = (" AND owner_id = ?", [self.scope.owner_id]) if self.scope else ("", [])
+        with self.pool.write() as conn:
+            cur = conn.execute(
+                "INSERT INTO tasks (title,description,deadline,priority,progress,created_at,owner_id,list_id) "
+                f"SELECT ?,?,?,?,?,?, owner_id, id FROM lists WHERE id = ?{condition}",
+                [title, description, date_to_epoch(deadline), priority_rank(priority), progress, now_epoch(),
+                 list_id, *params],
+            )
+            if cur.rowcount == 0:
+                raise ValueError(f"Liste bulunamadı: {list_id}")
+            return cur.lastrowid
+
+    def get(self, task_id):
+        condition, params = self._scope_sql()
+        with self.pool.read() as conn:
+            row = conn.execute(f"SELECT * FROM tasks WHERE id=?{condition}", (task_id, *params)).fetchone()
+        return decode_task(row) if row else None
+
+    def list(self, filters=None, limit=None, offset=0):
+        q, params = build_select(filters or TaskFilter(), limit=limit, offset=offset, scope=self.scope)
+        with self.pool.read() as conn:
+            return [decode_task(r) for r in conn.execute(q, params).fetchall()]
+
+    def page(self, filters=None, limit=50, after=None):
+        # Bir fazla satır okunur: varsa sonraki sayfa da vardır
+        rows = []
+        with self.pool.read() as conn:
+            for q, params in build_page(filters or TaskFilter(), after, scope=self.scope):
+                rows += conn.execute(q, [*params, limit + 1 - len(rows)]).fetchall()
+                if len(rows) > limit:
+                    break
+        more = len(rows) > limit
+        rows = rows[:limit]
+        return [decode_task(r) for r in rows], page_key(rows[-1]) if more else None
+
+    def next_up(self, limit=10):
+        q, params = build_next(limit, scope=self.scope)
+        with self.pool.read() as conn:
+            return [decode_task(r) for r in conn.execute(q, params).fetchall()]
+
+    def count(self, filters=None):
+        q, params = build_count(filters or TaskFilter(), scope=self.scope)
+        with self.pool.read() as conn:
+            return conn.execute(q, params).fetchone()[0]
+
+    def update(self, task_id, **fields):
+        self.update_many([task_id], **fields)
+
+    def delete(self, task_id):
+        self.delete_many([task_id])
+
+    def mark_complete(self, task_id, completed=True):
+        with self.pool.write() as conn:
+            condition, params = self._scope_sql()
+            if completed:
+                conn.execute(
+                    f"UPDATE tasks SET is_completed=1, progress=100, completed_at=? WHERE id=?{condition}",
+                    (now_epoch(), task_id, *params),
+                )
+            else:
+                conn.execute(
+                    f"UPDATE tasks SET is_completed=0, progress=0, completed_at=NULL WHERE id=?{condition}",
+                    (task_id, *params),
+                )
+
+    def ids(self, filters=None):
+        q, params = build_ids(filters or TaskFilter(), scope=self.scope)
+        with self.pool.read() as conn:
+            return [r[0] for r in conn.execute(q, params)]
+
+    def _execute_in(self, statement, params, task_ids, condition=""):
+        """``statement WHERE id IN (...)`` ifadesini parçalar halinde tek yazma işleminde çalıştırır."""
+        scope_condition, scope_params = self._scope_sql()
+        changed = 0
+        with self.pool.write() as conn:
+            for chunk in _chunks(task_ids):
+                marks = ",".join("?" * len(chunk))
+                cur = conn.execute(
+                    f"{statement} WHERE id IN ({marks}){condition}{scope_condition}",
+                    [*params, *chunk, *scope_params],
+                )
+                changed += cur.rowcount
+        return changed
+
+    def update_many(self, task_ids, **fields):
+        if not fields:
+            return 0
+        _check_fields(fields)
+        fields = encode_fields(fields)
+        assignments = ", ".join([f"{k}=?" for k in fields.keys()])
+        return self._execute_in(f"UPDATE tasks SET {assignments}", list(fields.values()), task_ids)
+
+    def delete_many(self, task_ids):
+        return self._execute_in("DELETE FROM tasks", [], task_ids)
+
+    def complete_many(self, task_ids, completed=True):
+        # Zaten o durumdaki görevlere dokunulmaz (completed_at korunur)
+        if completed:
+            return self._execute_in(
+                "UPDATE tasks SET is_completed=1, progress=100, completed_at=?", [now_epoch()], task_ids,
+                " AND is_completed = 0",
+            )
+        return self._execute_in(
+            "UPDATE tasks SET is_completed=0, progress=0, completed_at=NULL", [], task_ids,
+            " AND is_completed = 1",
+        )
+
+    def summary(self):
+        with self.pool.read() as conn:
+            return analytics.task_summary(conn, self.scope)
+
+    def priority_distribution(self):
+        with self.pool.read() as conn:
+            return analytics.priority_distribution(conn, self.scope)
+
+    def status_distribution(self):
+        with self.pool.read() as conn:
+            return analytics.status_distribution(conn, self.scope)
+
+    def daily_activity(self, since=None):
+        with self.pool.read() as conn:
+            return analytics.daily_activity(conn, self.scope, since)
+
+
+# ============================================================
+# BELLEK
+# ============================================================
+
+def _fold(text):
+    """Küçük harf + aksan temizliği (FTS5 unicode61 remove_diacritics benzeri)."""
+    decomposed = unicodedata.normalize("NFKD", (text or "").casefold())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def _decode_row(row):
+    # SQLite satırlarındaki hesaplanmış ``urgency`` sütununun karşılığı eklenir
+    return decode_task({**row, "urgency": urgency_key(row)})
+
+
+class _MemoryStore:
+    def __init__(self):
+        self.rows = {}
+        self.ids = itertools.count(1)
+        self.lock = threading.RLock()
+        self.version = 0
+
+
+class MemoryTaskRepository(TaskRepository):
+    """Bellekte tutulan depo; SQLite deposuyla aynı filtre ve sıralama kurallarını izler."""
+
+    def __init__(self, tasks=(), scope=None, _store=None):
+        # Bölümlenmiş kopyalar (scoped) aynı satırları ve sürümü paylaşır
+        self._store = _store or _MemoryStore()
+        self._rows = self._store.rows  # id → sütun değerleri (veritabanı biçiminde)
+        self._lock = self._store.lock
+        self.scope = scope
+        for task in tasks:
+            self.add(**{k: task[k] for k in ("title", "description", "deadline", "priority", "progress") if k in task})
+
+    def scoped(self, scope):
+        return MemoryTaskRepository(scope=scope, _store=self._store)
+
+    @property
+    def version(self):
+        return self._store.version
+
+    def _changed(self):
+        self._store.version += 1
+
+    def _in_scope(self, row):
+        s = self.scope
+        return s is None or (row["owner_id"] == s.owner_id and s.list_id in (None, row["list_id"]))
+
+    def _row(self, task_id):
+        row = self._rows.get(task_id)
+        return row if row is not None and self._in_scope(row) else None
+
+    def _visible(self):
+        return [r for r in self._rows.values() if self._in_scope(r)]
+
+    def add(self, title, description=None, deadline=None, priority="Low", progress=0, list_id=None):
+        list_id = list_id or (self.scope.list_id if self.scope else DEFAULT_LIST_ID)
+        if list_id is None:
+            raise ValueError("Görev eklemek için bir liste seçilmeli")
+        with self._lock:
+            task_id = next(self._store.ids)
+            self._rows[task_id] = {
+                "id": task_id, "title": title, "description": description,
+                "deadline": date_to_epoch(deadline), "priority": priority_rank(priority),
+                "progress": progress, "is_completed": 0, "created_at": now_epoch(),
+                "completed_at": None, "notified": 0,
+                "owner_id": self.scope.owner_id if self.scope else DEFAULT_OWNER_ID, "list_id": list_id,
+            }
+            self._changed()
+            return task_id
+
+    def get(self, task_id):
+        with self._lock:
+            row = self._row(task_id)
+            return _decode_row(row) if row else None
+
+    def _matches(self, row, f, today):
+        if not f.show_completed and row["is_completed"]:
+            return False
+        if row["priority"] not in {PRIORITY_RANK[p] for p in f.priorities}:
+            return False
+        deadline = row["deadline"]
+        if f.due != "all":
+            if deadline is None:
+                return False
+            if f.due == "overdue" and not (deadline < today and not row["is_completed"]):
+                return False
+            if f.due == "today" and not (today <= deadline < today + DAY):
+                return False
+            if f.due == "week" and not (today <= deadline < today + 8 * DAY):
+                return False
+        if f.search:
+            words = re.findall(r"\w+", _fold(f"{row['title']} {row['description'] or ''}"))
+            for term in re.findall(r"\w+", _fold(f.search)):
+                if not any(w.startswith(term) for w in words):
+                    return False
+        return True
+
+    def _select(self, f):
+        f = f or TaskFilter()
+        assert f.due in DUE_FILTERS
+        today = date_to_epoch(f.today or date.today())
+        rows = [r for r in self._visible() if self._matches(r, f, today)]
+        rows.sort(key=self._sort_key)
+        return rows
+
+    @staticmethod
+    def _sort_key(row):
+        is_completed, deadline, priority, task_id = page_key(row)
+        return (is_completed, deadline is not None, deadline or 0, -priority, task_id)  # NULL'lar önce
+
+    def list(self, filters=None, limit=None, offset=0):
+        with self._lock:
+            rows = self._select(filters)
+        end = None if limit is None else offset + limit
+        return [_decode_row(r) for r in rows[offset:end]]
+
+    def page(self, filters=None, limit=50, after=None):
+        with self._lock:
+            rows = self._select(filters)
+        if after is not None:
+            start = self._sort_key(dict(zip(("is_completed", "deadline", "priority", "id"), after)))
+            rows = [r for r in rows if self._sort_key(r) > start]
+        more = len(rows) > limit
+        rows = rows[:limit]
+        return [_decode_row(r) for r in rows], page_key(rows[-1]) if more else None
+
+    def next_up(self, limit=10):
+        with self._lock:
+            rows = [r for r in self._visible() if not r["is_completed"]]
+        rows.sort(key=lambda r: (urgency_key(r), r["id"]))
+        return [_decode_row(r) for r in rows[:limit]]
+
+    def count(self, filters=None):
+        with self._lock:
+            return len(self._select(filters))
+
+    def update(self, task_id, **fields):
+        if not fields:
+            return
+        _check_fields(fields)
+        fields = encode_fields(fields)
+        with self._lock:
+            row = self._row(task_id)
+            if row is None:
+                return
+            if "deadline" in fields and fields["deadline"] != row["deadline"]:
+                fields.setdefault("notified", 0)
+            row.update(fields)
+            self._changed()
+
+    def delete(self, task_id):
+        with self._lock:
+            if self._row(task_id) is not None:
+                del self._rows[task_id]
+                self._changed()
+
+    def mark_complete(self, task_id, completed=True):
+        if completed:
+            self.update(task_id, is_completed=1, progress=100, completed_at=epoch_to_iso(now_epoch()))
+        else:
+            self.update(task_id, is_completed=0, progress=0, completed_at=None)
+
+    def ids(self, filters=None):
+        with self._lock:
+            return [r["id"] for r in self._select(filters)]
+
+    def update_many(self, task_ids, **fields):
+        with self._lock:
+            present = [i for i in dict.fromkeys(task_ids) if self._row(i) is not None]
+            for task_id in present:
+                self.update(task_id, **fields)
+            return len(present) if fields else 0
+
+    def delete_many(self, task_ids):
+        with self._lock:
+            present = [i for i in dict.fromkeys(task_ids) if self._row(i) is not None]
+            for task_id in present:
+                self.delete(task_id)
+            return len(present)
+
+    def complete_many(self, task_ids, completed=True):
+        with self._lock:
+            pending = [i for i in dict.fromkeys(task_ids)
+                       if self._row(i) is not None and bool(self._rows[i]["is_completed"]) != completed]
+            for task_id in pending:
+                self.mark_complete(task_id, completed)
+            return len(pending)
+
+    def summary(self):
+        with self._lock:
+            rows = self._visible()
+        durations = [r["completed_at"] - r["created_at"] for r in rows
+                     if r["completed_at"] is not None and r["created_at"] is not None]
+        completed = sum(1 for r in rows if r["is_completed"] == 1)
+        return {
+            "total": len(rows),
+            "completed": completed,
+            "pending": len(rows) - completed,
+            "avg_completion_seconds": sum(durations) / len(durations) if durations else None,
+        }
+
+    def priority_distribution(self):
+        with self._lock:
+            ranks = sorted(r["priority"] for r in self._visible())
+        return [(priority_label(k), len(list(g))) for k, g in itertools.groupby(ranks)]
+
+    def status_distribution(self):
+        with self._lock:
+            flags = sorted(r["is_completed"] for r in self._visible())
+        return [(k, len(list(g))) for k, g in itertools.groupby(flags)]
+
+    def daily_activity(self, since=None):
+        start = date_to_epoch(since) if since is not None else None
+        days = {}
+        with self._lock:
+            for r in self._visible():
+                events = [(r["created_at"], 0)]
+                if r["is_completed"] == 1:
+                    events.append((r["completed_at"], 1))
+                for ts, kind in events:
+                    if ts is None or (start is not None and ts - ts % DAY < start):
+                        continue
+                    counts = days.setdefault(ts - ts % DAY, [0, 0])
+                    counts[kind] += 1
+        return [(epoch_to_date(day), c, d) for day, (c, d) in sorted(days.items())]
+
+
+# ============================================================
+# ÖNBELLEKLİ SARMALAYICI
+# ============================================================
+
+class CachedTaskRepository(TaskRepository):
+    """Okumaları ``ResultCache``'ten sunar; yazmalar doğrudan alttaki depoya gider.
+
+    Önbellek anahtarı bölümü ve alttaki deponun ``version`` değerini içerir;
+    herhangi bir yazma (başka süreçlerden gelenler dahil) önceki kayıtları
+    bayatlatır.
+    """
+
+    def __init__(self, inner, cache):
+        self.inner = inner
+        self.cache = cache
+
+    @property
+    def scope(self):
+        return self.inner.scope
+
+    def scoped(self, scope):
+        return CachedTaskRepository(self.inner.scoped(scope), self.cache)
+
+    @property
+    def version(self):
+        return self.inner.version
+
+    def _cached(self, name, key, compute):
+        # Önbellek oturumlar arasında paylaşılır; anahtar bölümü de içerir
+        return self.cache.get_or_compute(name, (self.scope, key), compute)
+
+    def add(self, *args, **kwargs):
+        return self.inner.add(*args, **kwargs)
+
+    def get(self, task_id):
+        return self.inner.get(task_id)
+
+    def list(self, filters=None, limit=None, offset=0):
+        filters = filters or TaskFilter()
+        return self._cached("list", (filters, limit, offset), lambda: self.inner.list(filters, limit, offset))
+
+    def page(self, filters=None, limit=50, after=None):
+        filters = filters or TaskFilter()
+        return self._cached("page", (filters, limit, after), lambda: self.inner.page(filters, limit, after))
+
+    def next_up(self, limit=10):
+        return self._cached("next_up", limit, lambda: self.inner.next_up(limit))
+
+    def count(self, filters=None):
+        filters = filters or TaskFilter()
+        return self._cached("count", filters, lambda: self.inner.count(filters))
+
+    def update(self, task_id, **fields):
+        return self.inner.update(task_id, **fields)
+
+    def delete(self, task_id):
+        return self.inner.delete(task_id)
+
+    def mark_complete(self, task_id, completed=True):
+        return self.inner.mark_complete(task_id, completed)
+
+    def ids(self, filters=None):
+        filters = filters or TaskFilter()
+        return self._cached("ids", filters, lambda: self.inner.ids(filters))
+
+    def update_many(self, task_ids, **fields):
+        return self.inner.update_many(task_ids, **fields)
+
+    def delete_many(self, task_ids):
+        return self.inner.delete_many(task_ids)
+
+    def complete_many(self, task_ids, completed=True):
+        return self.inner.complete_many(task_ids, completed)
+
+    def summary(self):
+        return self._cached("summary", None, self.inner.summary)
+
+    def priority_distribution(self):
+        return self._cached("priority_distribution", None, self.inner.priority_distribution)
+
+    def status_distribution(self):
+        return self._cached("status_distribution", None, self.inner.status_distribution)
+
+    def daily_activity(self, since=None):
+        return self._cached("daily_activity", since, lambda: self.inner.daily_activity(since))
+
+
+# ============================================================
+# ASYNCIO
+# ============================================================
+
+class AsyncTaskRepository:
+    """Bir ``TaskRepository``'yi asyncio'dan kullanmak için sarmalayıcı.
+
+    sqlite3 çağrıları bloklayıcıdır; her çağrı ``asyncio.to_thread`` ile bir
+    iş parçacığında yürütülür (aiosqlite'ın yaptığıyla aynı yaklaşım, ek
+    bağımlılık olmadan). Havuz okuyucuları eşzamanlı, yazmalar sıralıdır.
+    """
+
+    def __init__(self, repo):
+        self.sync = repo
+
+    @property
+    def scope(self):
+        return self.sync.scope
+
+    def scoped(self, scope):
+        return AsyncTaskRepository(self.sync.scoped(scope))
+
+    @property
+    def version(self):
+        return self.sync.version
+
+    async def _call(self, fn, *args, **kwargs):
+        import asyncio  # Eşzamanlı betiklerin açılışını yavaşlatmasın
+
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    async def add(self, title, description=None, deadline=None, priority="Low", progress=0, list_id=None):
+        return await self._call(self.sync.add, title, description, deadline, priority, progress, list_id)
+
+    async def get(self, task_id):
+        return await self._call(self.sync.get, task_id)
+
+    async def list(self, filters=None, limit=None, offset=0):
+        return await self._call(self.sync.list, filters, limit, offset)
+
+    async def page(self, filters=None, limit=50, after=None):
+        return await self._call(self.sync.page, filters, limit, after)
+
+    async def next_up(self, limit=10):
+        return await self._call(self.sync.next_up, limit)
+
+    async def count(self, filters=None):
+        return await self._call(self.sync.count, filters)
+
+    async def update(self, task_id, **fields):
+        return await self._call(self.sync.update, task_id, **fields)
+
+    async def delete(self, task_id):
+        return await self._call(self.sync.delete, task_id)
+
+    async def mark_complete(self, task_id, completed=True):
+        return await self._call(self.sync.mark_complete, task_id, completed)
+
+    async def ids(self, filters=None):
+        return await self._call(self.sync.ids, filters)
+
+    async def update_many(self, task_ids, **fields):
+        return await self._call(self.sync.update_many, task_ids, **fields)
+
+    async def delete_many(self, task_ids):
+        return await self._call(self.sync.delete_many, task_ids)
+
+    async def complete_many(self, task_ids, completed=True):
+        return await self._call(self.sync.complete_many, task_ids, completed)
+
+    async def summary(self):
+        return await self._call(self.sync.summary)
+
+    async def priority_distribution(self):
+        return await self._call(self.sync.priority_distribution)
+
+    async def status_distribution(self):
+        return await self._call(self.sync.status_distribution)
+
+    async def daily_activity(self, since=None):
+        return await self._call(self.sync.daily_activity, since)
@@ -0,0 +1,59 @@
+"""Testlerin ortak verisi ve fikstürleri."""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from storage import PRIORITIES, ConnectionPool, MemoryTaskRepository, Scope, SQLiteTaskRepository, migrate
+
+TODAY = date(2026, 1, 15)
+SCOPE = Scope(1, 1)
+
+WORDS = ["Rapor", "Sunum", "Çalışma", "Toplantı", "Alışveriş", "Bütçe"]
+DEADLINES = [None, TODAY - timedelta(days=3), TODAY, TODAY + timedelta(days=3), TODAY + timedelta(days=10)]
+
+
+def seed(repo, n=60):
+    """Belirlenimci görevler; oluşturma zamanları da sabitlenir (aciliyet anahtarı için)."""
+    ids = []
+    for i in range(n):
+        deadline = DEADLINES[i % len(DEADLINES)]
+        task_id = repo.add(
+            f"{WORDS[i % len(WORDS)]} {i}",
+            f"{WORDS[(i * 7) % len(WORDS)].lower()} hazırlığı" if i % 3 else None,
+            deadline.isoformat() if deadline else None,
+            PRIORITIES[i % 3],
+            (i * 17) % 101,
+        )
+        repo.update(task_id, created_at=datetime(2026, 1, 1) + timedelta(hours=i * 5))
+        if i % 4 == 0:
+            repo.mark_complete(task_id)
+        ids.append(task_id)
+    return ids
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = ConnectionPool(str(tmp_path / "tasks.db"))
+    migrate(pool)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(params=["sqlite", "memory"])
+def repo(request, pool):
+    if request.param == "sqlite":
+        return SQLiteTaskRepository(pool).scoped(SCOPE)
+    return MemoryTaskRepository().scoped(SCOPE)
+
+
+@pytest.fixture
+def both(pool):
+    sqlite, memory = SQLiteTaskRepository(pool).scoped(SCOPE), MemoryTaskRepository().scoped(SCOPE)
+    seed(sqlite)
+    seed(memory)
+    return sqlite, memory
+
+
+def ids_of(tasks):
+    return [t["id"] for t in tasks]
@@ -0,0 +1,43 @@
+"""Kullanıcılar, listeler ve bölümler (scope) arası yalıtım."""
+
+import pytest
+
+from storage import Scope, SQLiteTaskRepository, create_list, get_or_create_list, get_or_create_user, user_lists
+from storage.accounts import DEFAULT_LIST_NAME, DEFAULT_OWNER_ID, DEFAULT_USER_NAME
+
+from .conftest import SCOPE, seed
+
+
+def test_default_user_resolves_to_migrated_owner(pool):
+    assert get_or_create_user(pool, DEFAULT_USER_NAME).id == DEFAULT_OWNER_ID
+
+
+def test_new_user_gets_default_list_once(pool):
+    ayse = get_or_create_user(pool, " ayşe ")
+    assert get_or_create_user(pool, "ayşe") == ayse
+    assert [l.name for l in user_lists(pool, ayse.id)] == [DEFAULT_LIST_NAME]
+    with pytest.raises(ValueError):
+        get_or_create_user(pool, "  ")
+
+
+def test_list_names_are_unique_per_user(pool):
+    work = create_list(pool, DEFAULT_OWNER_ID, "İş")
+    with pytest.raises(ValueError):
+        create_list(pool, DEFAULT_OWNER_ID, "İş")
+    assert get_or_create_list(pool, DEFAULT_OWNER_ID, " İş ") == work
+    # Başka kullanıcı aynı adı kullanabilir
+    ayse = get_or_create_user(pool, "ayşe")
+    assert create_list(pool, ayse.id, "İş").owner_id == ayse.id
+
+
+def test_scope_isolates_reads_and_writes(pool):
+    repo = SQLiteTaskRepository(pool)
+    seed(repo.scoped(SCOPE), n=5)
+    ayse = get_or_create_user(pool, "ayşe")
+    other = repo.scoped(Scope(ayse.id, user_lists(pool, ayse.id)[0].id))
+    assert other.count() == 0
+    assert other.get(1) is None
+    assert other.delete_many([1, 2]) == 0
+    assert other.update_many([1, 2], priority="High") == 0
+    assert repo.scoped(Scope(ayse.id)).count() == 0
+    assert repo.scoped(SCOPE).count() == 5
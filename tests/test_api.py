@@ -0,0 +1,216 @@
+"""REST/JSON API: uç noktalar, ETag/304, imleçle sayfalama ve HTTP katmanı."""
+
+import asyncio
+import gzip
+import json
+from datetime import date
+
+import pytest
+
+from api import GZIP_MIN_BYTES, HTTPError, Response, TaskApi, decode_cursor, encode_cursor, render, serve
+from storage import Scope, SQLiteTaskRepository, TaskFilter
+
+from .conftest import SCOPE, ids_of, seed
+
+
+@pytest.fixture
+def api(pool):
+    return TaskApi(pool)
+
+
+def call(api, method, target, body=None, headers=None):
+    raw = json.dumps(body).encode() if body is not None else b""
+    return asyncio.run(api.handle(method, target, headers or {}, raw))
+
+
+# ============================================================
+# UÇ NOKTALAR
+# ============================================================
+
+def test_task_lifecycle(api):
+    created = call(api, "POST", "/tasks", {"title": " Rapor ", "deadline": "2026-02-01", "priority": "High"})
+    assert created.status == 201
+    task_id = created.payload["id"]
+    assert created.headers["Location"] == f"/tasks/{task_id}"
+    assert (created.payload["title"], created.payload["list_id"]) == ("Rapor", 1)
+
+    assert call(api, "PATCH", f"/tasks/{task_id}", {"progress": 50}).payload["progress"] == 50
+    assert call(api, "POST", f"/tasks/{task_id}/complete", {"completed": True}).payload["is_completed"] == 1
+    assert call(api, "GET", f"/tasks/{task_id}").payload["is_completed"] == 1
+    assert call(api, "GET", "/summary").payload["completed"] == 1
+
+    assert call(api, "DELETE", f"/tasks/{task_id}").status == 204
+    assert call(api, "GET", f"/tasks/{task_id}").status == 404
+
+
+@pytest.mark.parametrize("method, target, body", [
+    ("POST", "/tasks", {}),
+    ("POST", "/tasks", {"title": "   "}),
+    ("POST", "/tasks", {"title": "x", "priority": "Acil"}),
+    ("POST", "/tasks", {"title": "x", "deadline": "31.01.2026"}),
+    ("POST", "/tasks", {"title": "x", "progress": 101}),
+    ("POST", "/tasks", {"title": "x", "is_completed": 1}),
+    ("GET", "/tasks?priority=Acil", None),
+    ("GET", "/tasks?due=someday", None),
+    ("GET", "/tasks?limit=0", None),
+    ("GET", "/tasks?owner=x", None),
+])
+def test_invalid_requests_are_rejected(api, method, target, body):
+    response = call(api, method, target, body)
+    assert response.status == 400
+    assert response.payload["error"]
+
+
+def test_malformed_body_is_rejected(api):
+    response = asyncio.run(api.handle("POST", "/tasks", {}, b"{oops"))
+    assert response.status == 400
+
+
+@pytest.mark.parametrize("method, target, status", [
+    ("GET", "/nope", 404),
+    ("GET", "/tasks/abc", 404),
+    ("GET", "/tasks/999", 404),
+    ("GET", "/tasks/1/extra", 404),
+    ("PATCH", "/tasks/999", 404),
+    ("DELETE", "/tasks/999", 404),
+    ("PUT", "/tasks/1", 405),
+    ("DELETE", "/tasks/1/complete", 405),
+])
+def test_unknown_routes_and_methods(api, pool, method, target, status):
+    seed(SQLiteTaskRepository(pool).scoped(SCOPE), n=1)
+    assert call(api, method, target, {}).status == status
+
+
+# ============================================================
+# ETAG VE SAYFALAMA
+# ============================================================
+
+def test_etag_returns_304_until_data_changes(api):
+    first = call(api, "GET", "/tasks")
+    etag = first.headers["ETag"]
+    cached = call(api, "GET", "/tasks", headers={"if-none-match": f'"other", {etag}'})
+    assert (cached.status, cached.payload, cached.headers["ETag"]) == (304, None, etag)
+
+    # Farklı hedefin ETag'i farklıdır
+    assert call(api, "GET", "/tasks?limit=5").headers["ETag"] != etag
+
+    call(api, "POST", "/tasks", {"title": "Yeni"})
+    fresh = call(api, "GET", "/tasks", headers={"if-none-match": etag})
+    assert fresh.status == 200
+    assert fresh.headers["ETag"] != etag
+    assert [t["title"] for t in fresh.payload["tasks"]] == ["Yeni"]
+
+
+@pytest.mark.parametrize("query", ["", "&completed=0", "&priority=High,Low"])
+def test_cursor_pages_cover_the_list(api, pool, query):
+    seed(SQLiteTaskRepository(pool).scoped(SCOPE), n=25)
+    pages, cursor = [], None
+    while True:
+        target = f"/tasks?limit=7{query}" + (f"&cursor={cursor}" if cursor else "")
+        response = call(api, "GET", target)
+        assert response.status == 200
+        assert len(response.payload["tasks"]) <= 7
+        pages += response.payload["tasks"]
+        cursor = response.payload["next_cursor"]
+        if cursor is None:
+            break
+
+    f = TaskFilter(
+        show_completed="completed=0" not in query,
+        priorities=("High", "Low") if "priority" in query else TaskFilter().priorities,
+        today=date.today(),
+    )
+    assert ids_of(pages) == ids_of(SQLiteTaskRepository(pool).scoped(Scope(1)).list(f))
+
+
+@pytest.mark.parametrize("after", [(0, None, 2, 7), (1, 1767225600, 0, 12)])
+def test_cursor_round_trip(after):
+    assert decode_cursor(encode_cursor(after)) == after
+
+
+@pytest.mark.parametrize("cursor", [
+    "!!!",
+    encode_cursor([1, 2]),
+    encode_cursor({"id": 1}),
+    encode_cursor([True, None, 0, 1]),
+    encode_cursor([2, None, 0, 1]),
+    encode_cursor([0, "2026-01-01", 0, 1]),
+    encode_cursor([0, None, 0, 1.5]),
+])
+def test_malformed_cursor_is_rejected(api, cursor):
+    with pytest.raises(HTTPError):
+        decode_cursor(cursor)
+    assert call(api, "GET", f"/tasks?cursor={cursor}").status == 400
+
+
+# ============================================================
+# TOPLU İŞLEMLER
+# ============================================================
+
+def test_bulk_actions(api, pool):
+    ids = seed(SQLiteTaskRepository(pool).scoped(SCOPE), n=8)
+
+    def bulk(body):
+        return call(api, "POST", "/tasks/bulk", body)
+
+    assert bulk({"action": "update", "ids": ids[:3], "fields": {"priority": "High"}}).payload == {"changed": 3}
+    assert all(call(api, "GET", f"/tasks/{i}").payload["priority"] == "High" for i in ids[:3])
+    # Tohum verisinde iki görev zaten tamamlanmış
+    assert bulk({"action": "complete", "ids": ids}).payload["changed"] == 6
+    assert call(api, "GET", "/tasks?completed=0").payload["tasks"] == []
+    assert bulk({"action": "reopen", "ids": ids[:2]}).payload["changed"] == 2
+    assert bulk({"action": "delete", "ids": ids[:4]}).payload["changed"] == 4
+    assert call(api, "GET", "/summary").payload["total"] == 4
+
+
+@pytest.mark.parametrize("body", [
+    {"action": "archive", "ids": [1]},
+    {"action": "delete", "ids": "1,2"},
+    {"action": "delete", "ids": [1, True]},
+    {"action": "update", "ids": [1], "fields": {"title": "Aynı"}},
+    {"action": "update", "ids": [1], "fields": {"owner_id": 2}},
+])
+def test_invalid_bulk_requests_are_rejected(api, body):
+    assert call(api, "POST", "/tasks/bulk", body).status == 400
+
+
+# ============================================================
+# HTTP KATMANI
+# ============================================================
+
+def test_large_responses_are_gzipped_when_accepted():
+    payload = {"tasks": [{"title": f"Görev {i}"} for i in range(200)]}
+    plain = render(Response(200, payload))
+    head, body = plain.split(b"\r\n\r\n", 1)
+    assert b"Content-Encoding" not in head and len(body) >= GZIP_MIN_BYTES
+
+    head, body = render(Response(200, payload), "gzip, deflate").split(b"\r\n\r\n", 1)
+    assert b"Content-Encoding: gzip" in head
+    assert json.loads(gzip.decompress(body)) == payload
+
+    # Küçük yanıtlar sıkıştırılmaz
+    head, _ = render(Response(200, {"ok": True}), "gzip").split(b"\r\n\r\n", 1)
+    assert b"Content-Encoding" not in head
+
+
+def test_server_answers_over_http(pool):
+    seed(SQLiteTaskRepository(pool).scoped(SCOPE), n=5)
+
+    async def exchange():
+        loop = asyncio.get_running_loop()
+        bound = loop.create_future()
+        server = asyncio.create_task(serve(pool, port=0, ready=bound.set_result))
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", await bound)
+            writer.write(b"GET /summary HTTP/1.1\r\nHost: x\r\nConnection: close\r\n\r\n")
+            await writer.drain()
+            raw = await reader.read()
+            writer.close()
+            return raw
+        finally:
+            server.cancel()
+
+    head, body = asyncio.run(exchange()).split(b"\r\n\r\n", 1)
+    assert head.startswith(b"HTTP/1.1 200 OK")
+    assert b"Connection: close" in head and b"ETag: W/" in head
+    assert json.loads(body)["total"] == 5
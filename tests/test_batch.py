@@ -0,0 +1,54 @@
+"""Toplu işlemler: çoklu tamamlama, güncelleme ve silme."""
+
+import pytest
+
+from storage import CachedTaskRepository, ResultCache, SQLiteTaskRepository, TaskFilter
+from storage.repository import ID_CHUNK
+
+from .conftest import SCOPE, TODAY, ids_of, seed
+
+
+def test_bulk_operations_match_between_backends(both):
+    sqlite, memory = both
+    for repo in both:
+        assert repo.complete_many([2, 3, 4, 5, 999]) == 3  # 5 zaten tamamlanmış, 999 yok
+        assert repo.complete_many([2, 3], completed=False) == 2
+        assert repo.update_many([6, 7, 8, 999], priority="High", progress=40) == 3
+        assert repo.delete_many([9, 10, 10, 999]) == 2
+    f = TaskFilter(today=TODAY)
+    assert ids_of(sqlite.list(f)) == ids_of(memory.list(f))
+    for task_id in (2, 4, 6, 9):
+        s, m = sqlite.get(task_id), memory.get(task_id)
+        if s is None:
+            assert m is None
+            continue
+        for key in ("title", "description", "deadline", "priority", "progress", "is_completed"):
+            assert s[key] == m[key]
+
+
+def test_large_batches_run_in_one_transaction(pool):
+    repo = SQLiteTaskRepository(pool).scoped(SCOPE)
+    ids = [repo.add(f"Görev {i}", None, None, "Low", 0) for i in range(ID_CHUNK * 2 + 10)]
+    writes = pool.version[0]
+    assert repo.complete_many(ids + ids[:5]) == len(ids)  # tekrarlar bir kez sayılır
+    assert pool.version[0] == writes + 1
+    assert repo.update_many(ids, priority="High") == len(ids)
+    assert repo.count(TaskFilter(priorities=("High",), today=TODAY)) == len(ids)
+    assert repo.delete_many(ids[: ID_CHUNK + 1]) == ID_CHUNK + 1
+    assert repo.count() == len(ids) - ID_CHUNK - 1
+
+
+def test_unknown_fields_are_rejected_before_writing(repo):
+    ids = seed(repo, n=5)
+    with pytest.raises(ValueError):
+        repo.update_many(ids, priority="High", owner_id=2)
+    assert repo.count(TaskFilter(priorities=("High",), today=TODAY)) == 1
+
+
+def test_batch_writes_invalidate_cached_reads(pool):
+    repo = CachedTaskRepository(SQLiteTaskRepository(pool), ResultCache(version_probe=lambda: pool.version)).scoped(SCOPE)
+    ids = seed(repo, n=10)
+    open_filter = TaskFilter(show_completed=False, today=TODAY)
+    before = repo.count(open_filter)
+    repo.complete_many(ids)
+    assert repo.count(open_filter) == 0 < before
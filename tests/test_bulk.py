@@ -0,0 +1,85 @@
+"""Toplu içe/dışa aktarma: biçimler arası gidiş-dönüş ve kayıt doğrulama."""
+
+import io
+import tempfile
+
+import pytest
+
+from storage import Scope, SQLiteTaskRepository, create_list
+from storage.bulk import BulkImportError, export_tasks, import_tasks, validate_record
+
+from .conftest import SCOPE, seed
+
+FIELDS = ("title", "description", "deadline", "priority", "progress", "is_completed", "created_at", "completed_at")
+
+
+def snapshot(repo):
+    return [{k: t[k] for k in FIELDS} for t in repo.list()]
+
+
+@pytest.fixture
+def copy_scope(pool):
+    return Scope(SCOPE.owner_id, create_list(pool, SCOPE.owner_id, "Kopya").id)
+
+
+@pytest.mark.parametrize("fmt", ["csv", "jsonl", "parquet"])
+def test_round_trip_preserves_tasks(pool, copy_scope, fmt):
+    if fmt == "parquet":
+        pytest.importorskip("pyarrow")
+    source = SQLiteTaskRepository(pool).scoped(SCOPE)
+    seed(source, n=30)
+
+    # Uygulamadaki indirme düğmesi de geçici dosyaya yazıp baştan okur
+    with tempfile.TemporaryFile() as f:
+        assert export_tasks(pool, f, fmt, batch_size=7, scope=SCOPE) == 30
+        f.seek(0)
+        result = import_tasks(pool, f, fmt=fmt, batch_size=4, scope=copy_scope)
+    assert (result.inserted, result.skipped) == (30, 0)
+    assert snapshot(SQLiteTaskRepository(pool).scoped(copy_scope)) == snapshot(source)
+
+
+@pytest.mark.parametrize("record, message", [
+    ({"title": "  "}, "title boş olamaz"),
+    ({"title": "A", "priority": "Acil"}, "geçersiz priority"),
+    ({"title": "A", "progress": "yarım"}, "progress sayı olmalı"),
+    ({"title": "A", "progress": 101}, "0-100 aralığında"),
+    ({"title": "A", "deadline": "15.01.2026"}, "Kayıt 7"),
+    ({"title": "A", "is_completed": "belki"}, "0/1 bekleniyordu"),
+    ({"title": "A", "created_at": "dün"}, "Kayıt 7"),
+])
+def test_validate_record_rejects(record, message):
+    with pytest.raises(BulkImportError, match=message) as e:
+        validate_record(record, line=7)
+    assert e.value.line == 7
+
+
+def test_validate_record_defaults():
+    title, description, deadline, priority, progress, done, created, completed, notified = validate_record(
+        {"title": " Rapor ", "description": "", "deadline": "2026-01-15T09:30:00"}, now=123,
+    )
+    assert (title, description, priority, progress, done, created, completed, notified) == (
+        "Rapor", None, 0, 0, 0, 123, None, 0,
+    )
+    assert deadline == validate_record({"title": "A", "deadline": "2026-01-15"})[2]
+
+
+CSV_WITH_ERRORS = "title,priority,progress\nA,High,10\n,Low,0\nB,Acil,0\nC,Low,50\n"
+
+
+def test_skip_invalid_collects_errors(pool):
+    result = import_tasks(pool, io.StringIO(CSV_WITH_ERRORS), fmt="csv", skip_invalid=True, scope=SCOPE)
+    assert (result.inserted, result.skipped) == (2, 2)
+    assert [e.split(":")[0] for e in result.errors] == ["Kayıt 2", "Kayıt 3"]
+    assert [t["title"] for t in SQLiteTaskRepository(pool).scoped(SCOPE).list()] == ["A", "C"]
+
+
+def test_first_invalid_record_stops_import_after_committed_batches(pool):
+    with pytest.raises(BulkImportError) as e:
+        import_tasks(pool, io.StringIO(CSV_WITH_ERRORS), fmt="csv", batch_size=1, scope=SCOPE)
+    assert e.value.line == 2
+    assert SQLiteTaskRepository(pool).scoped(SCOPE).count() == 1
+
+
+def test_import_into_foreign_list_is_rejected(pool, copy_scope):
+    with pytest.raises(ValueError, match="Liste bulunamadı"):
+        import_tasks(pool, io.StringIO("title\nA\n"), fmt="csv", scope=Scope(99, copy_scope.list_id))
@@ -0,0 +1,114 @@
+"""Sonuç önbelleği: LRU sınırları, sürümle bayatlama ve önbellekli depo."""
+
+from storage import CachedTaskRepository, ConnectionPool, ResultCache, SQLiteTaskRepository, TaskFilter
+
+from .conftest import SCOPE, TODAY, seed
+
+
+def counting(value):
+    """``compute`` olarak verilir; kaç kez çağrıldığını ``calls`` tutar."""
+    def compute():
+        compute.calls += 1
+        return value
+    compute.calls = 0
+    return compute
+
+
+# ============================================================
+# LRU SINIRLARI
+# ============================================================
+
+def test_hits_do_not_recompute():
+    cache, compute = ResultCache(), counting([1, 2, 3])
+    assert cache.get_or_compute("list", "a", compute) == [1, 2, 3]
+    assert cache.get_or_compute("list", "a", compute) == [1, 2, 3]
+    assert compute.calls == 1
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"], stats["rows"]) == (1, 1, 1, 3)
+    assert stats["hit_ratio"] == 0.5
+
+
+def test_entry_limit_evicts_least_recently_used():
+    cache = ResultCache(max_entries=2)
+    cache.get_or_compute("q", "a", lambda: "A")
+    cache.get_or_compute("q", "b", lambda: "B")
+    cache.get_or_compute("q", "a", lambda: "A")  # "a" yeniden kullanıldı, en eski "b"
+    cache.get_or_compute("q", "c", lambda: "C")
+
+    compute_a, compute_b = counting("A"), counting("B")
+    cache.get_or_compute("q", "a", compute_a)
+    cache.get_or_compute("q", "b", compute_b)
+    assert (compute_a.calls, compute_b.calls) == (0, 1)
+    assert cache.stats()["evictions"] >= 1
+
+
+def test_row_limit_weighs_sequences_by_length():
+    cache = ResultCache(max_rows=10)
+    cache.get_or_compute("list", "a", lambda: list(range(6)))
+    cache.get_or_compute("list", "b", lambda: list(range(6)))
+    stats = cache.stats()
+    assert (stats["entries"], stats["rows"], stats["evictions"]) == (1, 6, 1)
+
+    # Tekil değerler bir satır sayılır
+    cache.get_or_compute("count", "a", lambda: 42)
+    assert cache.stats()["rows"] == 7
+
+
+def test_oversize_values_are_returned_but_not_stored():
+    cache, compute = ResultCache(max_rows=5), counting(list(range(6)))
+    assert cache.get_or_compute("list", "big", compute) == list(range(6))
+    assert cache.get_or_compute("list", "big", compute) == list(range(6))
+    assert compute.calls == 2
+    assert cache.stats()["entries"] == 0
+
+
+# ============================================================
+# SÜRÜMLE BAYATLAMA
+# ============================================================
+
+def test_bump_invalidates_previous_entries():
+    cache, compute = ResultCache(), counting("x")
+    cache.get_or_compute("q", "a", compute)
+    cache.bump()
+    cache.get_or_compute("q", "a", compute)
+    assert compute.calls == 2
+
+
+def test_version_probe_invalidates_previous_entries():
+    external = [0]
+    cache, compute = ResultCache(version_probe=lambda: external[0]), counting("x")
+    cache.get_or_compute("q", "a", compute)
+    cache.get_or_compute("q", "a", compute)
+    external[0] += 1
+    cache.get_or_compute("q", "a", compute)
+    assert compute.calls == 2
+
+
+def test_clear_drops_entries_and_rows():
+    cache = ResultCache()
+    cache.get_or_compute("list", "a", lambda: [1, 2])
+    cache.clear()
+    stats = cache.stats()
+    assert (stats["entries"], stats["rows"]) == (0, 0)
+
+
+# ============================================================
+# ÖNBELLEKLİ DEPO
+# ============================================================
+
+def test_cached_repository_sees_writes_from_other_connections(pool):
+    cache = ResultCache(version_probe=lambda: pool.version)
+    repo = CachedTaskRepository(SQLiteTaskRepository(pool), cache).scoped(SCOPE)
+    seed(repo, n=10)
+    f = TaskFilter(today=TODAY)
+    before = repo.count(f)
+    assert repo.count(f) == before
+    assert cache.stats()["hits"] >= 1
+
+    # Başka bir süreç gibi ayrı bir havuzdan yazılır; ``data_version`` değişir
+    other = ConnectionPool(pool.path)
+    try:
+        SQLiteTaskRepository(other).scoped(SCOPE).add("Dışarıdan", None, None, "Low", 0)
+    finally:
+        other.close()
+    assert repo.count(f) == before + 1
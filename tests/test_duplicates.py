@@ -0,0 +1,57 @@
+"""Benzer görev araması: eşik, kapsam ve aday seçimi."""
+
+from storage import Scope, SQLiteTaskRepository, create_list, get_or_create_user, similar_tasks
+from storage.duplicates import CANDIDATES, jaccard, title_trigrams
+
+from .conftest import SCOPE
+
+
+def add_all(pool, titles, scope=SCOPE):
+    repo = SQLiteTaskRepository(pool).scoped(scope)
+    return [repo.add(t, None, None, "Medium", 0) for t in titles]
+
+
+def test_scores_respect_threshold_and_limit(pool):
+    add_all(pool, ["Haftalık raporu hazırla", "Haftalık rapor hazırla", "Aylık bütçe", "Sunumu gözden geçir"])
+    found = similar_tasks(pool, "Haftalık raporu hazırla", SCOPE, threshold=0.5)
+    assert [t.title for t in found] == ["Haftalık raporu hazırla", "Haftalık rapor hazırla"]
+    assert found[0].score == 1.0
+    for t in found:
+        assert t.score == jaccard(title_trigrams("Haftalık raporu hazırla"), title_trigrams(t.title)) >= 0.5
+    assert len(similar_tasks(pool, "Haftalık raporu hazırla", SCOPE, limit=1)) == 1
+    assert similar_tasks(pool, "Haftalık raporu hazırla", SCOPE, threshold=0.99) == found[:1]
+    assert similar_tasks(pool, "ab", SCOPE) == []
+
+
+def test_completed_tasks_are_not_candidates(pool):
+    task_id, = add_all(pool, ["Faturayı öde"])
+    SQLiteTaskRepository(pool).scoped(SCOPE).mark_complete(task_id)
+    assert similar_tasks(pool, "Faturayı öde", SCOPE) == []
+
+
+def other_scopes(pool):
+    """Başka bir kullanıcının varsayılan listesi ve bu kullanıcının ikinci listesi."""
+    ayse = get_or_create_user(pool, "ayşe")
+    with pool.read() as conn:
+        ayse_list = conn.execute("SELECT id FROM lists WHERE owner_id = ?", (ayse.id,)).fetchone()[0]
+    return Scope(ayse.id, ayse_list), Scope(SCOPE.owner_id, create_list(pool, SCOPE.owner_id, "İş").id)
+
+
+def test_scope_isolates_owners_and_lists(pool):
+    theirs, second = other_scopes(pool)
+    mine, = add_all(pool, ["Kira ödemesini yap"])
+    other_owner, = add_all(pool, ["Kira ödemesini yap"], theirs)
+    other_list, = add_all(pool, ["Kira ödemesini yap"], second)
+
+    assert [t.id for t in similar_tasks(pool, "Kira ödemesini yap", SCOPE)] == [mine]
+    assert sorted(t.id for t in similar_tasks(pool, "Kira ödemesini yap", Scope(SCOPE.owner_id))) == [mine, other_list]
+    assert sorted(t.id for t in similar_tasks(pool, "Kira ödemesini yap")) == [mine, other_owner, other_list]
+
+
+def test_old_exact_duplicate_beats_newer_partial_matches(pool):
+    original, = add_all(pool, ["Kira ödemesini yap"])
+    # Aynı seyrek trigramları taşıyan ama eşik altında kalan daha yeni görevler
+    add_all(pool, [f"Kira ödemesini sor, sonra başka işler de planla #{i}" for i in range(CANDIDATES * 2)])
+    found = similar_tasks(pool, "Kira ödemesini yap", SCOPE)
+    assert [t.id for t in found] == [original]
+
@@ -0,0 +1,122 @@
+"""Değişiklik geçmişi: geri alma, geri yükleme ve sıkıştırma."""
+
+import json
+
+import pytest
+
+import manage
+from storage import (
+    Scope, SQLiteTaskRepository, compact_history, deleted_tasks, restore_task, task_history, undo_last_change,
+)
+from storage.codec import DAY, now_epoch
+from storage.migrations import AUDIT_COLUMNS
+
+from .conftest import SCOPE, TODAY, seed
+
+
+def test_undo_round_trip(pool):
+    repo = SQLiteTaskRepository(pool).scoped(SCOPE)
+    task_id = repo.add("Rapor", "taslak", TODAY.isoformat(), "Medium", 10)
+    before = repo.get(task_id)
+    repo.update(task_id, title="Rapor v2", priority="High", progress=60)
+
+    assert undo_last_change(pool, task_id, SCOPE) == {"title": "Rapor", "priority": "Medium", "progress": 10}
+    assert repo.get(task_id) == before
+    # Geri alma da bir değişikliktir: ikinci çağrı değişikliği yineler
+    undo_last_change(pool, task_id, SCOPE)
+    assert repo.get(task_id)["title"] == "Rapor v2"
+    assert [e.kind for e in task_history(pool, task_id)] == ["insert", "update", "update", "update"]
+    assert undo_last_change(pool, task_id, Scope(2)) is None
+
+
+def test_delete_restore_round_trip(pool):
+    repo = SQLiteTaskRepository(pool).scoped(SCOPE)
+    task_id = repo.add("Sunum", None, TODAY.isoformat(), "High", 30)
+    repo.mark_complete(task_id)
+    before = repo.get(task_id)
+    repo.delete(task_id)
+
+    assert [e.task_id for e in deleted_tasks(pool, SCOPE)] == [task_id]
+    with pytest.raises(ValueError):
+        restore_task(pool, task_id, Scope(2))
+    restore_task(pool, task_id, SCOPE)
+    assert repo.get(task_id) == before
+    assert deleted_tasks(pool, SCOPE) == []
+    with pytest.raises(ValueError):
+        restore_task(pool, task_id, SCOPE)
+
+
+def replay(pool, task_id):
+    """Olayları eklemeden başlayarak uygular; her güncellemenin eski değerleri o anki durumla eşleşmeli."""
+    with pool.read() as conn:
+        events = conn.execute("SELECT kind, data FROM task_events WHERE task_id = ? ORDER BY id", (task_id,)).fetchall()
+    state = None
+    for event in events:
+        data = json.loads(event["data"])
+        if event["kind"] == "update":
+            assert {k: state[k] for k in data} == {k: old for k, (old, _) in data.items()}
+            state.update({k: new for k, (_, new) in data.items()})
+        else:
+            state = {k: data[k] for k in AUDIT_COLUMNS}
+    return state
+
+
+def age_events(pool, days):
+    """Olayları geçmişe taşır: her görevin olayları ``days`` gün önceden başlayıp günde üçer dağılır."""
+    with pool.write() as conn:
+        rows = conn.execute("SELECT id, task_id FROM task_events ORDER BY task_id, id").fetchall()
+        start, seen = now_epoch() - days * DAY, {}
+        for row in rows:
+            i = seen[row["task_id"]] = seen.get(row["task_id"], -1) + 1
+            conn.execute("UPDATE task_events SET at = ? WHERE id = ?", (start + (i // 3) * DAY + i, row["id"]))
+
+
+def test_compacted_history_replays_to_current_row(pool):
+    repo = SQLiteTaskRepository(pool).scoped(SCOPE)
+    ids = seed(repo, n=12)
+    for step in range(10):
+        repo.update_many(ids[::2], progress=step * 10)
+        repo.update(ids[step], title=f"Yeni başlık {step}", priority=("Low", "High")[step % 2])
+        if step % 3 == 0:
+            repo.update(ids[step], priority="Medium", progress=0)
+    age_events(pool, 200)
+    with pool.read() as conn:
+        before = conn.execute("SELECT COUNT(*) FROM task_events").fetchone()[0]
+
+    removed, written = compact_history(pool, now_epoch() - 30 * DAY)
+    assert removed > written > 0
+    with pool.read() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM task_events").fetchone()[0] == before - removed + written
+        current = {r["id"]: r for r in conn.execute(f"SELECT id, {', '.join(AUDIT_COLUMNS)} FROM tasks")}
+    for task_id in ids:
+        assert replay(pool, task_id) == {k: current[task_id][k] for k in AUDIT_COLUMNS}
+    # İkinci çalıştırma katlanmış geçmişi değiştirmez
+    assert compact_history(pool, now_epoch() - 30 * DAY) == (0, 0)
+
+
+def test_compaction_purges_old_deleted_tasks_only(pool):
+    repo = SQLiteTaskRepository(pool).scoped(SCOPE)
+    old, recent, alive = (repo.add(t, None, None, "Low", 0) for t in ("Eski", "Yeni", "Duran"))
+    repo.delete(old)
+    age_events(pool, 100)
+    repo.delete(recent)
+
+    compact_history(pool, now_epoch() - 30 * DAY)
+    assert [e.task_id for e in deleted_tasks(pool, SCOPE)] == [recent]
+    assert task_history(pool, old) == []
+    assert [e.kind for e in task_history(pool, alive)] == ["insert"]
+
+
+def test_maintain_compacts_history(pool):
+    repo = SQLiteTaskRepository(pool).scoped(SCOPE)
+    task_id = repo.add("Rapor", None, None, "Low", 0)
+    for progress in (10, 20, 30):
+        repo.update(task_id, progress=progress)
+    age_events(pool, 200)
+
+    assert manage.main(["--db", pool.path, "maintain", "--history-days", "0"]) == 0
+    assert len(task_history(pool, task_id)) == 4
+    assert manage.main(["--db", pool.path, "maintain"]) == 0
+    # Aynı günün iki güncellemesi katlanır (günde üç olay: ekleme + 10 + 20, ertesi gün 30)
+    assert [e.kind for e in task_history(pool, task_id)] == ["insert", "update", "update"]
+    assert replay(pool, task_id)["progress"] == 30
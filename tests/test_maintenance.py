@@ -0,0 +1,94 @@
+"""Bakım: tutarlı yedek, boş sayfaların atılması ve bütünlük denetimi."""
+
+import sqlite3
+
+import pytest
+
+from storage import ConnectionPool, SQLiteTaskRepository, migrate
+from storage.maintenance import backup, compact, database_stats, integrity_check
+
+from .conftest import SCOPE, seed
+
+
+def count(path):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_backup_is_snapshot_of_start(pool, tmp_path):
+    repo = SQLiteTaskRepository(pool).scoped(SCOPE)
+    seed(repo, n=300)
+    written = []
+
+    def write_during_copy(remaining, total):
+        # Kopyalama sürerken gelen yazmalar görüntüye girmez
+        if remaining and not written:
+            written.append(repo.add("Yedek sırasında", None, None, "Low", 0))
+
+    dest = backup(pool, str(tmp_path / "yedek.db"), pages=1, progress=write_during_copy)
+    assert written
+    assert count(dest) == 300
+    assert repo.count() == 301
+    assert not (tmp_path / "yedek.db.partial").exists()
+
+
+def test_compact_releases_free_pages_in_steps(pool):
+    repo = SQLiteTaskRepository(pool).scoped(SCOPE)
+    assert database_stats(pool)["auto_vacuum"] == "incremental"
+    ids = seed(repo, n=300)
+    with pool.write() as conn:
+        conn.execute("UPDATE tasks SET description = ? WHERE id % 2 = 0", ("x" * 2000,))
+    repo.delete_many(ids)
+    free = database_stats(pool)["freelist_count"]
+    assert free > 3
+
+    assert compact(pool, max_pages=3, step=2) == (3, free - 3)
+    assert compact(pool) == (free - 3, 0)
+    assert database_stats(pool)["freelist_count"] == 0
+
+
+def test_compact_converts_only_on_request(tmp_path):
+    path = str(tmp_path / "eski.db")
+    legacy = sqlite3.connect(path)
+    legacy.execute("CREATE TABLE dolgu (x)")  # auto_vacuum'suz eski dosya
+    legacy.executemany("INSERT INTO dolgu VALUES (?)", [("x" * 1000,) for _ in range(500)])
+    legacy.commit()
+    legacy.execute("DELETE FROM dolgu")
+    legacy.commit()
+    legacy.close()
+
+    pool = ConnectionPool(path)
+    try:
+        migrate(pool)
+        stats = database_stats(pool)
+        assert stats["auto_vacuum"] == "none"
+        assert compact(pool) == (0, stats["freelist_count"])
+        assert database_stats(pool)["page_count"] == stats["page_count"]
+
+        freed, remaining = compact(pool, convert=True)
+        after = database_stats(pool)
+        assert after["auto_vacuum"] == "incremental"
+        assert freed == stats["page_count"] - after["page_count"] > 0
+        assert remaining == 0
+    finally:
+        pool.close()
+
+
+@pytest.mark.parametrize("quick", [True, False])
+def test_integrity_check_passes_on_healthy_database(pool, quick):
+    seed(SQLiteTaskRepository(pool).scoped(SCOPE), n=20)
+    assert integrity_check(pool, quick=quick, fts=True) == ["ok"]
+
+
+def test_integrity_check_reports_stale_fts(pool):
+    seed(SQLiteTaskRepository(pool).scoped(SCOPE), n=20)
+    with pool.write() as conn:
+        # Tetikleyicileri atlayarak içerik tablosunu indeksten kopar
+        conn.execute("DROP TRIGGER tasks_fts_au")
+        conn.execute("UPDATE tasks SET title = 'bambaşka' WHERE id = 1")
+    assert integrity_check(pool, fts=False) == ["ok"]
+    problems = integrity_check(pool, fts=True)
+    assert problems != ["ok"] and any(p.startswith("tasks_fts") for p in problems)
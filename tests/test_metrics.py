@@ -0,0 +1,47 @@
+"""Sorgu ölçümleri: ``InstrumentedCursor`` okunan satırları doğru sayar."""
+
+import pytest
+
+from storage import ConnectionPool, migrate
+from storage.metrics import Metrics
+
+
+@pytest.fixture
+def measured(tmp_path):
+    metrics = Metrics()
+    pool = ConnectionPool(str(tmp_path / "tasks.db"), metrics=metrics)
+    migrate(pool)
+    with pool.write() as conn:
+        conn.executemany("INSERT INTO users (name, created_at) VALUES (?, 0)", [(f"u{i}",) for i in range(5)])
+    metrics.reset()
+    yield pool, metrics
+    pool.close()
+
+
+def rows_of(metrics, sql):
+    return metrics.snapshot()["queries"][sql]["rows"]
+
+
+@pytest.mark.parametrize("read", [
+    lambda cur: cur.fetchall(),
+    lambda cur: [r for r in cur],
+    lambda cur: list(cur),
+])
+def test_rows_counted_for_fetch_and_iteration(measured, read):
+    pool, metrics = measured
+    sql = "SELECT id FROM users WHERE name LIKE 'u_' ORDER BY id"
+    with pool.read() as conn:
+        assert len(read(conn.execute(sql))) == 5
+    assert rows_of(metrics, sql) == 5
+    assert metrics.snapshot()["queries"][sql]["count"] == 1
+
+
+def test_partial_iteration_counted_on_next_statement(measured):
+    pool, metrics = measured
+    sql = "SELECT id FROM users WHERE name LIKE 'u_' ORDER BY id"
+    with pool.read() as conn:
+        cur = conn.cursor()
+        for _ in zip(range(2), cur.execute(sql)):
+            pass
+        cur.execute("SELECT 1").fetchone()
+    assert rows_of(metrics, sql) == 2
@@ -0,0 +1,133 @@
+"""Şema geçişleri: sürümsüz (v0) bir veritabanının güncel şemaya yükseltilmesi."""
+
+import sqlite3
+
+import pytest
+
+from storage import ConnectionPool, SQLiteTaskRepository, TaskFilter, migrate
+from storage.migrations import SCHEMA_VERSION, schema_version
+
+from .conftest import SCOPE, TODAY
+
+# İlk sürümdeki ``app.py``'nin kurduğu tablo; ``user_version`` 0 kalır
+V0_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS tasks (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT NOT NULL,
+        description TEXT,
+        deadline TEXT,
+        priority TEXT,
+        progress INTEGER DEFAULT 0,
+        is_completed INTEGER DEFAULT 0,
+        created_at TEXT,
+        completed_at TEXT,
+        notified INTEGER DEFAULT 0
+    )
+"""
+
+V0_ROWS = [
+    # (başlık, son tarih, öncelik, ilerleme, tamamlandı, oluşturma, tamamlanma)
+    ("Rapor yaz", "2026-01-20", "High", 40, 0, "2026-01-01T10:00:00.123456", None),
+    ("Sunum hazırla", "2026-01-21T09:30:00", "Medium", 100, 1, "2026-01-02T08:00:00", "2026-01-05T12:00:00"),
+    ("Bozuk tarih", "yarın", "Acil", 10, 0, "2026-01-03T09:00:00", None),
+    ("Boş alanlar", None, None, None, None, None, None),
+]
+
+
+@pytest.fixture
+def v0_path(tmp_path):
+    path = str(tmp_path / "legacy.db")
+    conn = sqlite3.connect(path)
+    conn.execute(V0_SCHEMA)
+    conn.executemany(
+        "INSERT INTO tasks (title, deadline, priority, progress, is_completed, created_at, completed_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        V0_ROWS,
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def legacy(v0_path):
+    pool = ConnectionPool(v0_path)
+    yield pool
+    pool.close()
+
+
+def tasks_by_title(pool):
+    repo = SQLiteTaskRepository(pool).scoped(SCOPE)
+    return {t["title"]: t for t in repo.list(TaskFilter(today=TODAY))}
+
+
+# ============================================================
+# v0 → GÜNCEL
+# ============================================================
+
+def test_v0_database_migrates_to_current_schema(legacy):
+    assert migrate(legacy) == (0, SCHEMA_VERSION)
+    with legacy.read() as conn:
+        assert schema_version(conn) == SCHEMA_VERSION
+        assert [tuple(r) for r in conn.execute("SELECT id, name FROM users")] == [(1, "varsayılan")]
+        assert [tuple(r) for r in conn.execute("SELECT id, owner_id, name FROM lists")] == [(1, 1, "Genel")]
+        assert conn.execute("SELECT COUNT(*) FROM tasks WHERE owner_id = 1 AND list_id = 1").fetchone()[0] == 4
+
+
+def test_v0_values_are_converted(legacy):
+    migrate(legacy)
+    tasks = tasks_by_title(legacy)
+
+    report = tasks["Rapor yaz"]
+    assert (report["deadline"], report["priority"], report["progress"]) == ("2026-01-20", "High", 40)
+    assert report["created_at"] == "2026-01-01T10:00:00"
+
+    # Saat içeren son tarih güne indirgenir
+    talk = tasks["Sunum hazırla"]
+    assert (talk["deadline"], talk["priority"], talk["is_completed"]) == ("2026-01-21", "Medium", 1)
+    assert talk["completed_at"] == "2026-01-05T12:00:00"
+
+    # Çözülemeyen tarih NULL, bilinmeyen öncelik en düşük sıra olur
+    broken = tasks["Bozuk tarih"]
+    assert (broken["deadline"], broken["priority"]) == (None, "Low")
+
+    empty = tasks["Boş alanlar"]
+    assert (empty["deadline"], empty["priority"], empty["progress"], empty["is_completed"]) == (None, "Low", 0, 0)
+    assert empty["created_at"] is None
+
+
+def test_migrated_tasks_are_searchable_and_summarised(legacy):
+    migrate(legacy)
+    repo = SQLiteTaskRepository(legacy).scoped(SCOPE)
+    assert [t["title"] for t in repo.list(TaskFilter(search="rapor", today=TODAY))] == ["Rapor yaz"]
+    summary = repo.summary()
+    assert (summary["total"], summary["completed"], summary["pending"]) == (4, 1, 3)
+    assert {t["title"] for t in repo.next_up(10)} == {"Rapor yaz", "Bozuk tarih", "Boş alanlar"}
+    with legacy.read() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM task_titles").fetchone()[0] == 3
+
+
+def test_migrated_database_accepts_new_writes(legacy):
+    migrate(legacy)
+    repo = SQLiteTaskRepository(legacy).scoped(SCOPE)
+    task_id = repo.add("Yeni görev", None, "2026-02-01", "High", 0)
+    assert task_id == len(V0_ROWS) + 1
+    assert repo.get(task_id)["deadline"] == "2026-02-01"
+
+
+# ============================================================
+# YENİDEN ÇALIŞTIRMA VE SÜRÜM DENETİMİ
+# ============================================================
+
+def test_migrate_resumes_and_is_idempotent(legacy):
+    assert migrate(legacy, target=3) == (0, 3)
+    assert migrate(legacy) == (3, SCHEMA_VERSION)
+    assert migrate(legacy) == (SCHEMA_VERSION, SCHEMA_VERSION)
+    assert len(tasks_by_title(legacy)) == len(V0_ROWS)
+
+
+def test_newer_schema_is_refused(legacy):
+    with legacy.write() as conn:
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION + 1}")
+    with pytest.raises(RuntimeError):
+        migrate(legacy)
@@ -0,0 +1,60 @@
+"""Sıradaki görevler: aciliyet anahtarı, sıralama ve indeks kullanımı."""
+
+from datetime import timedelta
+
+import pytest
+
+from storage import Scope, SQLiteTaskRepository, urgency_days, utc_today
+from storage.codec import DAY, date_to_epoch
+from storage.queries import NO_DEADLINE_DAYS, build_next, urgency_key
+
+from .conftest import SCOPE, TODAY
+
+
+def test_next_up_matches_between_backends(both):
+    sqlite, memory = both
+    for limit in (1, 5, 100):
+        expected = [(t["id"], t["urgency"]) for t in memory.next_up(limit)]
+        assert [(t["id"], t["urgency"]) for t in sqlite.next_up(limit)] == expected
+    assert all(not t["is_completed"] for t in sqlite.next_up(100))
+
+
+def test_urgency_orders_by_effective_deadline(repo):
+    # Tarihsiz görevlerin etkin son tarihi oluşturulma anından sayılır; bu yüzden bugüne göre
+    today = utc_today()
+
+    def add(title, days, priority="Medium", progress=0):
+        deadline = (today + timedelta(days=days)).isoformat() if days is not None else None
+        return repo.add(title, None, deadline, priority, progress)
+
+    overdue = add("Gecikmiş", -7, "Low")
+    today_high = add("Bugün, yüksek", 0, "High")
+    today_low = add("Bugün, düşük", 0, "Low")
+    almost_done = add("Bugün, neredeyse bitti", 0, "Low", progress=90)
+    undated = add("Tarihsiz", None, "High")
+    later = add("Sonra", 30, "High")
+    done = add("Bitti", -10, "High")
+    repo.mark_complete(done)
+
+    order = [t["id"] for t in repo.next_up(10)]
+    assert order[:3] == [overdue, today_high, today_low]
+    assert order.index(today_low) < order.index(almost_done)
+    assert order.index(undated) < order.index(later)
+    assert done not in order
+
+
+def test_urgency_days_counts_from_effective_deadline():
+    now = date_to_epoch(TODAY)
+    row = {"created_at": now - 5 * DAY, "deadline": None, "priority": 0, "progress": 100}
+    # Tarihsiz görev oluşturulduktan NO_DEADLINE_DAYS gün sonra bitecekmiş gibi sayılır
+    assert urgency_days(urgency_key(row), now) == pytest.approx(5 - NO_DEADLINE_DAYS, abs=1)
+
+
+@pytest.mark.parametrize("scope_list", [True, False])
+def test_next_up_reads_partial_index_without_sorting(pool, scope_list):
+    repo = SQLiteTaskRepository(pool).scoped(SCOPE if scope_list else Scope(SCOPE.owner_id))
+    q, params = build_next(5, scope=repo.scope)
+    with pool.read() as conn:
+        plan = " ".join(r["detail"] for r in conn.execute(f"EXPLAIN QUERY PLAN {q}", params))
+    assert ("idx_tasks_next" if scope_list else "idx_tasks_next_owner") in plan
+    assert "TEMP B-TREE" not in plan
@@ -0,0 +1,68 @@
+"""Son tarih bildirimleri: seviyeler, sıfırlama ve yazma kilidinin kullanımı."""
+
+from datetime import timedelta
+
+from storage import DeadlineNotifier, MemorySink, SQLiteTaskRepository
+from storage.notify import DUE_TODAY, OVERDUE
+
+from .conftest import SCOPE, TODAY
+
+
+def levels(pool):
+    with pool.read() as conn:
+        return dict(conn.execute("SELECT id, notified FROM tasks").fetchall())
+
+
+def add(repo, deadline, done=False):
+    task_id = repo.add("Görev", None, deadline.isoformat() if deadline else None, "Medium", 0)
+    if done:
+        repo.mark_complete(task_id)
+    return task_id
+
+
+def test_levels_advance_once_per_threshold(pool):
+    repo = SQLiteTaskRepository(pool).scoped(SCOPE)
+    today = add(repo, TODAY)
+    late = add(repo, TODAY - timedelta(days=2))
+    tomorrow = add(repo, TODAY + timedelta(days=1))
+    add(repo, None)
+    add(repo, TODAY - timedelta(days=5), done=True)
+    sink = MemorySink()
+    notifier = DeadlineNotifier(pool, [sink])
+
+    found = notifier.poll_once(TODAY)
+    assert sorted((n.task_id, n.kind) for n in found) == [(today, DUE_TODAY), (late, OVERDUE)]
+    assert [n for _, n in sink.since(0)] == found
+    assert {k: v for k, v in levels(pool).items() if v} == {today: 1, late: 2}
+
+    # Aynı gün ikinci tarama hiçbir şey bulmaz ve yazma işlemi açmaz
+    writes = pool.version[0]
+    assert notifier.poll_once(TODAY) == []
+    assert pool.version[0] == writes
+
+    # Ertesi gün "bugün" bildirilen görev gecikmiş olarak bir kez daha bildirilir
+    found = notifier.poll_once(TODAY + timedelta(days=1))
+    assert sorted((n.task_id, n.kind) for n in found) == [(today, OVERDUE), (tomorrow, DUE_TODAY)]
+    assert notifier.poll_once(TODAY + timedelta(days=1)) == []
+
+
+def test_deadline_change_resets_level(pool):
+    repo = SQLiteTaskRepository(pool).scoped(SCOPE)
+    task_id = add(repo, TODAY - timedelta(days=1))
+    notifier = DeadlineNotifier(pool)
+    assert [n.kind for n in notifier.poll_once(TODAY)] == [OVERDUE]
+
+    repo.update(task_id, deadline=(TODAY + timedelta(days=3)).isoformat())
+    assert levels(pool)[task_id] == 0
+    assert notifier.poll_once(TODAY) == []
+    # Yeni son tarih gelince yeniden bildirilir
+    assert [n.kind for n in notifier.poll_once(TODAY + timedelta(days=3))] == [DUE_TODAY]
+
+
+def test_large_batches_are_marked_in_chunks(pool):
+    repo = SQLiteTaskRepository(pool).scoped(SCOPE)
+    ids = [add(repo, TODAY - timedelta(days=1)) for _ in range(1200)]
+    found = DeadlineNotifier(pool, batch_size=2000).poll_once(TODAY)
+    assert sorted(n.task_id for n in found) == ids
+    assert set(levels(pool).values()) == {2}
+
@@ -0,0 +1,83 @@
+"""Depo davranışı: aynı denetimler SQLite ve bellek depolarında çalışır.
+
+Her test iki depoya aynı veriyi yükler; ``MemoryTaskRepository``'nin SQLite
+deposuyla aynı filtre, sıralama, sayfalama ve özet kurallarını izlediği
+burada güvenceye alınır. Toplu işlemler, özet tabloları ve geçmiş kendi
+modüllerinde sınanır.
+"""
+
+import itertools
+
+import pytest
+
+from storage import DUE_FILTERS, PRIORITIES, TaskFilter
+
+from .conftest import TODAY, ids_of, seed
+
+FILTERS = [
+    TaskFilter(show_completed=completed, priorities=priorities, due=due, search=search, today=TODAY)
+    for completed, priorities, due, search in itertools.product(
+        (True, False),
+        (PRIORITIES, ("High",), ("Low", "Medium")),
+        DUE_FILTERS,
+        ("", "rapor", "butce", "çalış", "hazır sun"),
+    )
+]
+
+
+# ============================================================
+# FİLTRELER VE SAYFALAMA
+# ============================================================
+
+@pytest.mark.parametrize("f", FILTERS, ids=repr)
+def test_filters_match_between_backends(both, f):
+    sqlite, memory = both
+    assert sqlite.count(f) == memory.count(f)
+    if f.search:
+        # Arama sonuçları SQLite'ta alaka düzeyine göre sıralanır
+        assert sorted(ids_of(sqlite.list(f))) == sorted(ids_of(memory.list(f)))
+    else:
+        assert ids_of(sqlite.list(f)) == ids_of(memory.list(f))
+    assert sorted(sqlite.ids(f)) == sorted(memory.ids(f))
+
+
+@pytest.mark.parametrize("limit", [1, 7, 50])
+@pytest.mark.parametrize("f", [
+    TaskFilter(today=TODAY),
+    TaskFilter(show_completed=False, today=TODAY),
+    TaskFilter(priorities=("High", "Low"), due="week", today=TODAY),
+    TaskFilter(search="rapor", today=TODAY),
+], ids=repr)
+def test_pages_concatenate_to_list(repo, f, limit):
+    seed(repo)
+    pages, after = [], None
+    while True:
+        tasks, after = repo.page(f, limit, after)
+        assert len(tasks) <= limit
+        pages += tasks
+        if after is None:
+            break
+    expected = repo.list(f)
+    if f.search:
+        assert sorted(ids_of(pages)) == sorted(ids_of(expected))
+    else:
+        assert ids_of(pages) == ids_of(expected)
+
+
+def test_offset_pages_match_list(repo):
+    seed(repo)
+    f = TaskFilter(today=TODAY)
+    everything = ids_of(repo.list(f))
+    assert ids_of(repo.list(f, limit=10, offset=20)) == everything[20:30]
+
+
+# ============================================================
+# ÖZETLER
+# ============================================================
+
+def test_summaries_match_between_backends(both):
+    sqlite, memory = both
+    s, m = sqlite.summary(), memory.summary()
+    assert {k: s[k] for k in ("total", "completed", "pending")} == {k: m[k] for k in ("total", "completed", "pending")}
+    assert sqlite.priority_distribution() == memory.priority_distribution()
+    assert sqlite.status_distribution() == memory.status_distribution()
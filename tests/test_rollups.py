@@ -0,0 +1,56 @@
+"""Özet tabloları: tetikleyicilerin tuttuğu toplamlar ve UTC gün kovaları."""
+
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from storage import MemoryTaskRepository, SQLiteTaskRepository, rebuild_rollups, restore_task, undo_last_change, utc_today
+from storage.codec import DAY, epoch_to_date, now_epoch
+
+from .conftest import SCOPE, seed
+
+
+def _rollups(pool):
+    with pool.read() as conn:
+        rollup = conn.execute("SELECT * FROM task_rollup WHERE tasks > 0 ORDER BY 1, 2, 3, 4").fetchall()
+        daily = conn.execute(
+            "SELECT * FROM task_daily WHERE created > 0 OR completed > 0 ORDER BY 1, 2, 3"
+        ).fetchall()
+    return [tuple(r) for r in rollup], [tuple(r) for r in daily]
+
+
+def test_rollups_equal_rebuild_after_mixed_writes(pool):
+    repo = SQLiteTaskRepository(pool).scoped(SCOPE)
+    ids = seed(repo)
+    repo.complete_many(ids[:10])
+    repo.complete_many(ids[:4], completed=False)
+    repo.update_many(ids[10:20], priority="Low", progress=90)
+    repo.update(ids[21], created_at=datetime(2025, 12, 1), completed_at=datetime(2026, 1, 2))
+    repo.delete_many(ids[30:35])
+    repo.delete(ids[40])
+    undo_last_change(pool, ids[21], SCOPE)
+    restore_task(pool, ids[40], SCOPE)
+
+    maintained = _rollups(pool)
+    with pool.write() as conn:
+        rebuild_rollups(conn)
+    assert _rollups(pool) == maintained
+
+
+@pytest.mark.parametrize("backend", ["sqlite", "memory"])
+def test_daily_activity_buckets_by_utc_day(pool, backend):
+    repo = (SQLiteTaskRepository(pool) if backend == "sqlite" else MemoryTaskRepository()).scoped(SCOPE)
+    istanbul = timezone(timedelta(hours=3))
+    # Yerel saatle 15 Ocak 01:30, UTC'de 14 Ocak 22:30
+    late = repo.add("Gece", None, None, "Low", 0)
+    repo.update(late, created_at=datetime(2026, 1, 15, 1, 30, tzinfo=istanbul))
+    early = repo.add("Sabah", None, None, "Low", 0)
+    repo.update(early, created_at=datetime(2026, 1, 15, 9, 0, tzinfo=istanbul))
+
+    assert repo.daily_activity(date(2026, 1, 1)) == [(date(2026, 1, 14), 1, 0), (date(2026, 1, 15), 1, 0)]
+    assert repo.daily_activity(date(2026, 1, 15)) == [(date(2026, 1, 15), 1, 0)]
+
+
+def test_utc_today_matches_bucket_of_now():
+    now = now_epoch()
+    assert utc_today() in (epoch_to_date(now - now % DAY), epoch_to_date(now_epoch()))